@@ -319,5 +319,46 @@ def create_benchmark_plots(results):
     plt.savefig(os.path.join(os.path.dirname(__file__), 'benchmark_results.png'), dpi=300, bbox_inches='tight')
     print("Benchmark grafikleri 'benchmark_results.png' dosyasına kaydedildi.")
 
+def run_engine_benchmark(size=(120, 120), obstacle_ratio=0.2, update_rounds=20, seed=42):
+    """Temel ve optimize D* Lite motorlarının saniyedeki genişletme sayısı"""
+    print("\nD* Lite Motor Karşılaştırması (basic vs optimized)")
+    print("=" * 50)
+    
+    width, height = size
+    start = (2, 2)
+    goal = (width - 3, height - 3)
+    results = {}
+    
+    for engine in ('basic', 'optimized'):
+        # Her motor aynı haritayı ve aynı engel dizisini görür
+        rng = np.random.default_rng(seed)
+        grid_map = GridMap(width, height)
+        grid_map.grid[rng.random((height, width)) < obstacle_ratio] = grid_map.OBSTACLE
+        grid_map.clear_area(0, 0, 5, 5)
+        grid_map.clear_area(width - 6, height - 6, width - 1, height - 1)
+        
+        planner = DStarLite(grid_map, storage='array', engine=engine)
+        start_time = time.time()
+        path = planner.plan_path(start, goal)
+        for _ in range(update_rounds):
+            changed = []
+            for x, y in rng.integers(6, min(width, height) - 6, size=(5, 2)).tolist():
+                blocked = not grid_map.is_obstacle(x, y)
+                grid_map.set_obstacle(x, y, blocked)
+                changed.append((x, y, blocked))
+            planner.update_obstacles(changed)
+            path = planner.extract_path()
+        elapsed = time.time() - start_time
+        
+        expanded = planner.stats['nodes_expanded']
+        results[engine] = {'time': elapsed, 'expanded': expanded,
+                           'rate': expanded / elapsed if elapsed > 0 else 0.0,
+                           'path_length': len(path)}
+        print(f"{engine:>9}: {elapsed:.3f} s, {expanded} genişletme, "
+              f"{results[engine]['rate']:.0f} genişletme/s, yol {len(path)} adım")
+    
+    return results
+
 if __name__ == "__main__":
-    run_benchmark()
\ No newline at end of file
+    run_benchmark()
+    run_engine_benchmark()
\ No newline at end of file
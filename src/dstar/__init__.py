@@ -1,4 +1,12 @@
 from .dstar_lite import DStarLite, Node
 from .dstar_original import DStarLiteOriginal
+from .node_store import ArrayNodeStore
+from .path_cache import PathCache
+from .hierarchical import HierarchicalDStarLite
+from .jump_point import JumpPointPlanner
+from .landmarks import LandmarkHeuristic
+from .bidirectional import BidirectionalAStar, QueryDispatcher
 
-__all__ = ['DStarLite', 'DStarLiteOriginal', 'Node']
\ No newline at end of file
+__all__ = ['DStarLite', 'DStarLiteOriginal', 'Node', 'ArrayNodeStore', 'PathCache',
+           'HierarchicalDStarLite', 'JumpPointPlanner', 'LandmarkHeuristic',
+           'BidirectionalAStar', 'QueryDispatcher']
\ No newline at end of file
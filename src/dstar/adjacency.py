@@ -0,0 +1,298 @@
+import numpy as np
+from typing import List, Tuple
+
+from .array_search import DIRECTIONS, SQRT2
+
+# DIRECTIONS[k] yönünün tersi DIRECTIONS[REVERSE_SLOT - k] yönüdür
+REVERSE_SLOT = len(DIRECTIONS) - 1
+
+
+def grid_window(array: np.ndarray, x1: int, y1: int, x2: int, y2: int, fill) -> np.ndarray:
+    """Dikdörtgeni bir hücrelik kenarla çıkar; harita dışını `fill` ile doldur"""
+    height, width = array.shape
+    out = np.full((y2 - y1 + 3, x2 - x1 + 3), fill, dtype=array.dtype)
+    sy1, sy2 = max(0, y1 - 1), min(height, y2 + 2)
+    sx1, sx2 = max(0, x1 - 1), min(width, x2 + 2)
+    out[sy1 - (y1 - 1):sy2 - (y1 - 1), sx1 - (x1 - 1):sx2 - (x1 - 1)] = array[sy1:sy2, sx1:sx2]
+    return out
+
+
+def edge_cost_window(grid_map, x1: int, y1: int, x2: int, y2: int) -> np.ndarray:
+    """[x1, x2] x [y1, y2] kaynak hücrelerinin kenar maliyetleri.
+
+    (rows, cols, 8) dizi döner; yuva ``k`` ``DIRECTIONS[k]`` yönüdür, geçersiz
+    kenar inf'tir. Kurallar `GridAdjacency` ile aynıdır.
+    """
+    rows = y2 - y1 + 1
+    cols = x2 - x1 + 1
+    # Yalnızca pencere dönüştürülür; harita boyutunda geçici dizi oluşmaz
+    blocked = grid_window(grid_map.grid, x1, y1, x2, y2, grid_map.OBSTACLE) == grid_map.OBSTACLE
+    terrain = grid_window(grid_map.terrain_costs, x1, y1, x2, y2, np.inf).astype(np.float64)
+
+    costs = np.empty((rows, cols, len(DIRECTIONS)), dtype=np.float64)
+    for k, (dx, dy) in enumerate(DIRECTIONS):
+        target = (slice(1 + dy, 1 + dy + rows), slice(1 + dx, 1 + dx + cols))
+        invalid = blocked[target].copy()
+        if dx != 0 and dy != 0:
+            # Köşe kesme yasağı: (x+dx, y) ve (x, y+dy) serbest olmalı
+            invalid |= blocked[1:1 + rows, 1 + dx:1 + dx + cols]
+            invalid |= blocked[1 + dy:1 + dy + rows, 1:1 + cols]
+            base = SQRT2
+        else:
+            base = 1.0
+        costs[:, :, k] = np.where(invalid, np.inf, base + terrain[target])
+    return costs
+
+
+class GridAdjacency:
+    """`GridMap`'ten derlenmiş CSR tarzı komşuluk ve kenar maliyeti tabloları.
+
+    Her hücreye sabit ``STRIDE`` (8) yuvalık bir satır ayrılır: hücre ``u``
+    için satır ``indices[u * 8:(u + 1) * 8]`` aralığıdır ve yuva ``k``,
+    ``DIRECTIONS[k]`` yönündeki komşuyu tutar. Geçersiz kenarlar ``indices``
+    içinde -1, ``costs`` içinde inf değerindedir. Sabit adım sayesinde hücre
+    değişiklikleri satırları kaydırmadan yerinde yamalanır.
+
+    Kenar kuralları `DStarLite.get_neighbors` / `get_cost` ile aynıdır:
+    hedef hücre harita içinde ve engel değilse, diyagonalde her iki ortogonal
+    köşe de serbestse kenar vardır; maliyeti taban (1 veya √2) artı hedefin
+    arazi maliyetidir.
+
+    Tablo `GridMap` değişikliklerini dinler ve kirli bölgeleri biriktirir;
+    `sync` çağrısı yalnızca etkilenen satırları vektörel olarak yeniden kurar.
+    """
+
+    STRIDE = len(DIRECTIONS)
+
+    def __init__(self, grid_map):
+        self.grid_map = grid_map
+        self.width = grid_map.width
+        self.height = grid_map.height
+        self.size = self.width * self.height
+
+        self.indices = np.full(self.size * self.STRIDE, -1, dtype=np.int32)
+        self.costs = np.full(self.size * self.STRIDE, np.inf, dtype=np.float64)
+        self.indices_view = memoryview(self.indices)
+        self.costs_view = memoryview(self.costs)
+
+        self._dirty: List[Tuple[int, int, int, int]] = []
+        self.patched_rows = 0
+
+        self.rebuild()
+        grid_map.add_change_listener(self._on_grid_change)
+
+    @property
+    def neighbor_table(self) -> np.ndarray:
+        """(height, width, 8) şeklinde komşu kimlikleri (kopyasız görünüm)"""
+        return self.indices.reshape(self.height, self.width, self.STRIDE)
+
+    @property
+    def cost_table(self) -> np.ndarray:
+        """(height, width, 8) şeklinde kenar maliyetleri (kopyasız görünüm)"""
+        return self.costs.reshape(self.height, self.width, self.STRIDE)
+
+    def rebuild(self):
+        """Tüm tabloları baştan kur"""
+        self._dirty.clear()
+        self._build_rows(0, 0, self.width - 1, self.height - 1)
+
+    def _on_grid_change(self, x1: int, y1: int, x2: int, y2: int):
+        self._dirty.append((x1, y1, x2, y2))
+
+    def is_dirty(self) -> bool:
+        return bool(self._dirty)
+
+    def sync(self) -> int:
+        """Bekleyen harita değişikliklerini yamala; yenilenen satır sayısını döndür"""
+        patched = 0
+        while self._dirty:
+            x1, y1, x2, y2 = self._patch_rect(*self._dirty.pop())
+            self._build_rows(x1, y1, x2, y2)
+            patched += (x2 - x1 + 1) * (y2 - y1 + 1)
+        self.patched_rows += patched
+        return patched
+
+    def sync_changes(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Bekleyen değişiklikleri yamala ve maliyeti değişen kenarları döndür.
+
+        Dönüş: (kaynaklar, hedefler, eski maliyetler, yeni maliyetler) dizileri.
+        Kaybolan kenarın yeni maliyeti, yeni oluşan kenarın eski maliyeti inf'tir.
+        """
+        offsets = np.array([dy * self.width + dx for dx, dy in DIRECTIONS], dtype=np.int64)
+        sources, targets, old_costs, new_costs = [], [], [], []
+        while self._dirty:
+            x1, y1, x2, y2 = self._patch_rect(*self._dirty.pop())
+            before = self.cost_table[y1:y2 + 1, x1:x2 + 1].copy()
+            self._build_rows(x1, y1, x2, y2)
+            after = self.cost_table[y1:y2 + 1, x1:x2 + 1]
+            self.patched_rows += before.shape[0] * before.shape[1]
+
+            changed = before != after
+            ys, xs, slots = np.nonzero(changed)
+            edge_sources = (ys + y1).astype(np.int64) * self.width + (xs + x1)
+            sources.append(edge_sources)
+            targets.append(edge_sources + offsets[slots])
+            old_costs.append(before[changed])
+            new_costs.append(after[changed])
+
+        if not sources:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0), np.empty(0)
+        return (np.concatenate(sources), np.concatenate(targets),
+                np.concatenate(old_costs), np.concatenate(new_costs))
+
+    def _patch_rect(self, x1: int, y1: int, x2: int, y2: int) -> Tuple[int, int, int, int]:
+        # Bir hücre hem hedef hem de diyagonal köşe olarak 3x3 komşuluğunu etkiler
+        return (max(0, x1 - 1), max(0, y1 - 1),
+                min(self.width - 1, x2 + 1), min(self.height - 1, y2 + 1))
+
+    def _build_rows(self, x1: int, y1: int, x2: int, y2: int):
+        """[x1, x2] x [y1, y2] kaynak hücrelerinin satırlarını NumPy ile kur"""
+        costs = edge_cost_window(self.grid_map, x1, y1, x2, y2)
+
+        ys, xs = np.mgrid[y1:y2 + 1, x1:x2 + 1]
+        source_ids = (ys * self.width + xs).astype(np.int32)
+        offsets = np.array([dy * self.width + dx for dx, dy in DIRECTIONS], dtype=np.int32)
+
+        self.neighbor_table[y1:y2 + 1, x1:x2 + 1] = np.where(
+            np.isinf(costs), -1, source_ids[:, :, None] + offsets)
+        self.cost_table[y1:y2 + 1, x1:x2 + 1] = costs
+
+    def edges(self, node_id: int) -> List[Tuple[int, float]]:
+        """Çıkan kenarlar: (komşu, c(node, komşu)) çiftleri"""
+        base = node_id * self.STRIDE
+        end = base + self.STRIDE
+        return [(neighbor, cost) for neighbor, cost
+                in zip(self.indices_view[base:end], self.costs_view[base:end])
+                if neighbor >= 0]
+
+    def reverse_edges(self, node_id: int) -> List[Tuple[int, float]]:
+        """Gelen kenarlar: (komşu, c(komşu, node)) çiftleri"""
+        indices = self.indices_view
+        costs = self.costs_view
+        stride = self.STRIDE
+        base = node_id * stride
+        result = []
+        for k in range(stride):
+            neighbor = indices[base + k]
+            if neighbor >= 0:
+                result.append((neighbor, costs[neighbor * stride + REVERSE_SLOT - k]))
+        return result
+
+    def blocked(self, cell_ids):
+        """Hücreler geçilemez mi (engel); kimlik ya da kimlik dizisi alır"""
+        return self.grid_map.grid.ravel()[cell_ids] == self.grid_map.OBSTACLE
+
+    def nbytes(self) -> int:
+        return self.indices.nbytes + self.costs.nbytes
+
+
+class TrafficAdjacency(GridAdjacency):
+    """Hücreye giriş maliyetlerinden derlenmiş `GridAdjacency` düzeninde tablo.
+
+    Trafik kuralı `entry_cost_table` ile aynıdır: kaynak ve hedefin maliyeti
+    sonluysa kenar maliyeti mesafe (1 veya √2) çarpı hedefin maliyetidir,
+    köşe kesme kısıtı yoktur. Tablo ortamı dinlemez; planlayıcının gördüğü
+    maliyetleri tutar. `set_cell_costs` değişen hücreleri kaydeder ve `sync`
+    yalnızca bu hücrelerin 3x3 komşuluğundaki satırları vektörel yeniden kurar.
+    """
+
+    def __init__(self, cell_costs: np.ndarray):
+        self.grid_map = None
+        self.height, self.width = cell_costs.shape
+        self.size = self.width * self.height
+        self.cell_costs = np.array(cell_costs, dtype=np.float64)
+
+        self.indices = np.full(self.size * self.STRIDE, -1, dtype=np.int32)
+        self.costs = np.full(self.size * self.STRIDE, np.inf, dtype=np.float64)
+        self.indices_view = memoryview(self.indices)
+        self.costs_view = memoryview(self.costs)
+
+        self._offsets = np.array([dy * self.width + dx for dx, dy in DIRECTIONS], dtype=np.int64)
+        self._dirty: List[np.ndarray] = []
+        self.patched_rows = 0
+
+        self.rebuild()
+
+    def rebuild(self):
+        """Tüm tabloları baştan kur"""
+        self._dirty.clear()
+        self._build_ids(np.arange(self.size, dtype=np.int64))
+
+    def load(self, cell_costs: np.ndarray):
+        """Tüm hücre maliyetlerini değiştir ve tabloları baştan kur"""
+        self.cell_costs[:] = cell_costs
+        self.rebuild()
+
+    def set_cell_costs(self, cell_ids, costs):
+        """Hücre maliyetlerini yaz; satırlar bir sonraki `sync`'te yamalanır"""
+        cell_ids = np.asarray(cell_ids, dtype=np.int64).ravel()
+        costs = np.asarray(costs, dtype=np.float64).ravel()
+        if len(cell_ids) != len(costs):
+            raise ValueError("Kimlik ve maliyet dizileri aynı uzunlukta olmalı")
+        if len(cell_ids) and not (0 <= cell_ids.min() and cell_ids.max() < self.size):
+            raise ValueError("Harita dışında hücre kimliği")
+        self.cell_costs.flat[cell_ids] = costs
+        self._dirty.append(cell_ids)
+
+    def sync(self) -> int:
+        """Bekleyen maliyet değişikliklerini yamala; yenilenen satır sayısını döndür"""
+        sources = self._dirty_sources()
+        self._build_ids(sources)
+        self.patched_rows += len(sources)
+        return len(sources)
+
+    def sync_changes(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Bekleyen değişiklikleri yamala ve maliyeti değişen kenarları döndür.
+
+        Dönüş `GridAdjacency.sync_changes` ile aynıdır.
+        """
+        sources = self._dirty_sources()
+        rows = self.costs.reshape(self.size, self.STRIDE)
+        before = rows[sources]
+        self._build_ids(sources)
+        after = rows[sources]
+        self.patched_rows += len(sources)
+
+        changed = before != after
+        row, slots = np.nonzero(changed)
+        edge_sources = sources[row]
+        return (edge_sources, edge_sources + self._offsets[slots],
+                before[changed], after[changed])
+
+    def _dirty_sources(self) -> np.ndarray:
+        """Değişen hücrelerin satırı etkilenen kaynakları (kendisi ve 8 komşusu)"""
+        if not self._dirty:
+            return np.empty(0, dtype=np.int64)
+        cells = np.unique(np.concatenate(self._dirty))
+        self._dirty.clear()
+        ys, xs = np.divmod(cells, self.width)
+        sources = [cells]
+        for dx, dy in DIRECTIONS:
+            nx, ny = xs + dx, ys + dy
+            inside = (0 <= nx) & (nx < self.width) & (0 <= ny) & (ny < self.height)
+            sources.append(ny[inside] * self.width + nx[inside])
+        return np.unique(np.concatenate(sources))
+
+    def _build_ids(self, source_ids: np.ndarray):
+        """``source_ids`` kaynak hücrelerinin satırlarını NumPy ile kur"""
+        ys, xs = np.divmod(source_ids, self.width)
+        dx = np.array([d[0] for d in DIRECTIONS])
+        dy = np.array([d[1] for d in DIRECTIONS])
+        nx = xs[:, None] + dx
+        ny = ys[:, None] + dy
+        inside = (0 <= nx) & (nx < self.width) & (0 <= ny) & (ny < self.height)
+        targets = np.where(inside, ny * self.width + nx, 0)
+        flat = self.cell_costs.ravel()
+        distance = np.where((dx != 0) & (dy != 0), SQRT2, 1.0)
+        costs = np.where(inside, distance * flat[targets], np.inf)
+        costs[~np.isfinite(flat[source_ids])] = np.inf
+
+        rows = self.costs.reshape(self.size, self.STRIDE)
+        rows[source_ids] = costs
+        self.indices.reshape(self.size, self.STRIDE)[source_ids] = np.where(
+            np.isinf(costs), -1, targets)
+
+    def blocked(self, cell_ids):
+        """Hücreler geçilemez mi (maliyeti sonsuz)"""
+        return ~np.isfinite(self.cell_costs.ravel()[cell_ids])
@@ -0,0 +1,105 @@
+from typing import List, Optional, Tuple
+
+from .array_search import INF, SEARCH_COMPLETE
+
+
+class AnytimeSearchMixin:
+    """Anytime Dynamic A* (AD*, Likhachev vd. 2005) adımları.
+
+    Nesne tabanlı düğümlerle (``storage='object'`` / ``'lazy'``) çalışır.
+    Arama önce şişirilmiş bir heuristikle (ε > 1) hızlı bir yol bulur, sonra
+    ε adım adım düşürülür ve önceki aramanın g/rhs değerleri yeniden
+    kullanılır. Bulunan yolun maliyeti en fazla ε katı kadar optimumdan
+    kötüdür (temel heuristik kabul edilebilirse).
+
+    ε, `heuristic` içindeki ``heuristic_weight`` çarpanına uygulanır:
+    anytime modunda ``heuristic_weight = base_heuristic_weight * ε`` olur.
+    Anahtarlar AD* kuralına göre hesaplanır; aşırı tutarlı düğümler şişirilmiş,
+    eksik tutarlı düğümler şişirilmemiş heuristik kullanır. Bir iterasyonda
+    genişletilmiş (CLOSED) düğüm yeniden tutarsızlaşırsa INCONS listesinde
+    bekler ve bir sonraki iterasyonun başında açık listeye taşınır.
+    """
+
+    def plan_path_anytime(self, start: Tuple[int, int], goal: Tuple[int, int],
+                          initial_inflation: float = 2.5,
+                          max_expansions: Optional[int] = None,
+                          deadline: Optional[float] = None) -> Tuple[List[Tuple[int, int]], float]:
+        """İlk yolu ``initial_inflation`` şişirmesiyle planla; (yol, ε sınırı) döndür.
+
+        Bütçe ilk iterasyonu bitirmeye yetmezse henüz kanıtlanmış bir sınır
+        yoktur ve ε sınırı inf döner (yol ``path_tentative`` ile işaretlenir).
+        """
+        if self.array_mode:
+            raise ValueError("Anytime modu nesne tabanlı depolama gerektirir")
+        if initial_inflation < 1.0:
+            raise ValueError("Şişirme katsayısı en az 1 olmalı")
+        self.initialize_search(start, goal)
+        self.anytime = True
+        self._closed = set()
+        self._incons = {}
+        self.inflation = initial_inflation
+        self.suboptimality_bound = INF  # İlk iterasyon bitene kadar sınır yok
+        self.heuristic_weight = self.base_heuristic_weight * initial_inflation
+        self._reorder_open_list()
+        return self._anytime_result(max_expansions, deadline)
+
+    def improve_path(self, inflation_step: float = 0.5,
+                     max_expansions: Optional[int] = None,
+                     deadline: Optional[float] = None) -> Tuple[List[Tuple[int, int]], float]:
+        """ε'u ``inflation_step`` kadar düşür (en az 1) ve yolu iyileştir.
+
+        Önceki iterasyon bütçe yüzünden yarım kaldıysa ε değiştirilmez,
+        yalnızca arama sürdürülür.
+        """
+        if not self.anytime:
+            raise RuntimeError("Önce plan_path_anytime çağrılmalı")
+        if self.search_status == SEARCH_COMPLETE and self.inflation > 1.0:
+            self.inflation = max(1.0, self.inflation - inflation_step)
+            self.heuristic_weight = self.base_heuristic_weight * self.inflation
+        return self._anytime_result(max_expansions, deadline)
+
+    def _anytime_result(self, max_expansions: Optional[int],
+                        deadline: Optional[float]) -> Tuple[List[Tuple[int, int]], float]:
+        if self.compute_shortest_path(max_expansions, deadline) == SEARCH_COMPLETE:
+            self.suboptimality_bound = self.inflation
+        return self.extract_path(), self.suboptimality_bound
+
+    def _reset_anytime(self):
+        """Normal D* Lite moduna dön"""
+        self.anytime = False
+        self._closed = None
+        self._incons = {}
+        self.inflation = 1.0
+        self.suboptimality_bound = INF  # Tamamlanan bir anytime iterasyonu yok
+        self.heuristic_weight = self.base_heuristic_weight
+
+    def _anytime_key(self, node) -> Tuple[float, float]:
+        h = self.heuristic(node, self.start)
+        if node.g > node.rhs:
+            return (node.rhs + h + self.km, node.rhs)
+        # Eksik tutarlı düğümde şişirilmemiş heuristik
+        return (node.g + h / self.inflation + self.km, node.g)
+
+    def _anytime_queue_vertex(self, node):
+        """AD* UpdateState kuyruk adımı: CLOSED düğümler INCONS'a gider"""
+        if node.g != node.rhs:
+            if node in self._closed:
+                self._incons[node] = None
+            else:
+                node.h = self.heuristic(node, self.start)
+                self.open_list.insert(node, self._anytime_key(node))
+        elif self.open_list.contains(node):
+            self.open_list.remove(node)
+
+    def _begin_anytime_iteration(self):
+        """INCONS'u açık listeye taşı, anahtarları yenile, CLOSED'ı boşalt"""
+        for node in self._incons:
+            if node.g != node.rhs:
+                self.open_list.insert(node, self._anytime_key(node))
+        self._incons = {}
+        self._closed = set()
+        self._reorder_open_list()
+
+    def _reorder_open_list(self):
+        for node in self.open_list.items():
+            self.open_list.insert(node, self._anytime_key(node))
@@ -0,0 +1,292 @@
+import math
+import time
+from typing import List, Optional, Tuple
+
+INF = float('inf')
+SQRT2 = math.sqrt(2)
+# Eski kenar maliyetinin argmin olup olmadığı kontrolünde yuvarlama payı
+COST_EPSILON = 1e-9
+DIRECTIONS = [(-1, -1), (-1, 0), (-1, 1), (0, -1),
+              (0, 1), (1, -1), (1, 0), (1, 1)]
+
+# compute_shortest_path dönüş durumları
+SEARCH_COMPLETE = 'complete'
+SEARCH_PARTIAL = 'partial'
+# extract_path sonuç durumları (``path_status``)
+PATH_COMPLETE = 'complete'
+PATH_STALLED = 'stalled'  # g'si azalan komşu kalmadı; yol hedefe varmadan kesildi
+PATH_UNREACHABLE = 'unreachable'  # g(start) sonsuz
+# Süre sınırı her bu kadar genişletmede bir kontrol edilir
+DEADLINE_CHECK_INTERVAL = 16
+
+
+def budget_exhausted(expanded: int, max_expansions: Optional[int],
+                     deadline: Optional[float]) -> bool:
+    """Genişletme ya da süre bütçesi bitti mi (``deadline`` perf_counter zamanı)"""
+    if max_expansions is not None and expanded >= max_expansions:
+        return True
+    return (deadline is not None and expanded % DEADLINE_CHECK_INTERVAL == 0
+            and time.perf_counter() >= deadline)
+
+
+class ArraySearchMixin:
+    """`ArrayNodeStore` üzerinde tamsayı kimliklerle çalışan D* Lite adımları.
+
+    Planlayıcı sınıfı ``self.nodes`` (ArrayNodeStore), ``self.open_list``,
+    ``self.start``, ``self.goal`` ve ``self.stats`` alanlarını sağlar.
+    Komşuluk, maliyet ve heuristik ``_neighbor_ids``, ``_cost_ids`` ve
+    ``_heuristic_ids`` kancalarıyla verilir; kancalar planlayıcının
+    ``self.provider`` sağlayıcısına (ör. `GridProvider`) gider. Planlayıcı
+    ``self.adjacency`` olarak bir `GridAdjacency` verirse iç döngüler bu
+    kancalar yerine derlenmiş komşuluk ve maliyet dizilerini okur.
+    """
+
+    def _neighbor_ids(self, node_id: int) -> List[int]:
+        """Geçilebilir komşu kimlikleri"""
+        return self.provider.neighbor_ids(node_id)
+
+    def _cost_ids(self, from_id: int, to_id: int) -> float:
+        """İki hücre kimliği arasındaki hareket maliyeti"""
+        return self.provider.cost_ids(from_id, to_id)
+
+    def _edge_cost_for(self, from_id: int, to_id: int, cell_cost: float) -> float:
+        """Hedef hücrenin maliyeti ``cell_cost`` iken c(from, to)"""
+        return self.provider.edge_cost_for(from_id, to_id, cell_cost)
+
+    def _heuristic_ids(self, id1: int, id2: int) -> float:
+        """Kimlikler arası ağırlıklı heuristik"""
+        return self.heuristic_weight * self.provider.heuristic_ids(id1, id2)
+
+    def _array_refresh(self, edges: List[Tuple[int, float]]) -> List[Tuple[int, float]]:
+        """Kenar uçlarından önceki nesilde kalanların g/rhs değerlerini sıfırla"""
+        store = self.nodes
+        stamp = store.stamp_view
+        generation = store.generation
+        for neighbor, _ in edges:
+            if stamp[neighbor] != generation:
+                stamp[neighbor] = generation
+                store.g_view[neighbor] = INF
+                store.rhs_view[neighbor] = INF
+        return edges
+
+    def _array_successors(self, node_id: int) -> List[Tuple[int, float]]:
+        """(komşu, c(node, komşu)) çiftleri"""
+        if self.adjacency is not None:
+            return self._array_refresh(self.adjacency.edges(node_id))
+        return self._array_refresh([(neighbor, self._cost_ids(node_id, neighbor))
+                                    for neighbor in self._neighbor_ids(node_id)])
+
+    def _array_predecessors(self, node_id: int) -> List[Tuple[int, float]]:
+        """(komşu, c(komşu, node)) çiftleri"""
+        if self.adjacency is not None:
+            return self._array_refresh(self.adjacency.reverse_edges(node_id))
+        return self._array_refresh([(neighbor, self._cost_ids(neighbor, node_id))
+                                    for neighbor in self._neighbor_ids(node_id)])
+
+    def _array_key(self, node_id: int) -> Tuple[float, float]:
+        m = min(self.nodes.g_view[node_id], self.nodes.rhs_view[node_id])
+        return (m + self._heuristic_ids(node_id, self.start) + self.km, m)
+
+    def _array_initialize_search(self, start: Tuple[int, int], goal: Tuple[int, int]):
+        store = self.nodes
+        self.start = store.index(start[0], start[1])
+        self.goal = store.index(goal[0], goal[1])
+        self.last_start = self.start
+        self.km = 0.0
+
+        if self.adjacency is not None:
+            self.adjacency.sync()
+
+        # Nesil sayacını artır: O(1) sıfırlama
+        store.reset()
+        store.touch(self.start)
+        store.touch(self.goal)
+        self.open_list.clear()
+
+        store.rhs_view[self.goal] = 0.0
+        store.h_view[self.goal] = self._heuristic_ids(self.goal, self.start)
+        self.open_list.insert(self.goal, self._array_key(self.goal))
+
+    def _array_min_rhs(self, node_id: int) -> float:
+        """rhs = min over successors (c(node, s') + g(s'))"""
+        g = self.nodes.g_view
+        min_rhs = self.goal_offsets.get(node_id, INF) if self.goal_offsets else INF
+        for neighbor, edge_cost in self._array_successors(node_id):
+            cost = edge_cost + g[neighbor]
+            if cost < min_rhs:
+                min_rhs = cost
+        return min_rhs
+
+    def _array_update_vertex(self, node_id: int):
+        self.nodes.touch(node_id)
+        if node_id != self.goal:
+            self.nodes.rhs_view[node_id] = self._array_min_rhs(node_id)
+        self._array_queue_vertex(node_id)
+
+    def _array_queue_vertex(self, node_id: int):
+        """rhs'e dokunmadan kuyruğu düzenle"""
+        g = self.nodes.g_view
+        rhs = self.nodes.rhs_view
+        # insert kuyruktaki girdiyi günceller; tutarlıysa kuyruktan çıkar
+        if g[node_id] != rhs[node_id]:
+            self.nodes.h_view[node_id] = self._heuristic_ids(node_id, self.start)
+            self.open_list.insert(node_id, self._array_key(node_id))
+        elif self.open_list.contains(node_id):
+            self.open_list.remove(node_id)
+
+    def _array_start_consistent(self) -> bool:
+        """Arama döngüsünün durma koşulu sağlanıyor mu"""
+        return (self.open_list.empty() or
+                (not self.open_list.top_key() < self._array_key(self.start) and
+                 self.nodes.rhs_view[self.start] == self.nodes.g_view[self.start]))
+
+    def _array_compute_shortest_path(self, max_expansions: Optional[int] = None,
+                                     deadline: Optional[float] = None) -> bool:
+        """Bütçe bitmeden tutarlılığa ulaşılırsa True döndür"""
+        g = self.nodes.g_view
+        rhs = self.nodes.rhs_view
+        open_list = self.open_list
+        limited = max_expansions is not None or deadline is not None
+        expanded = 0
+        while (not open_list.empty() and
+               (open_list.top_key() < self._array_key(self.start) or
+                rhs[self.start] != g[self.start])):
+            if limited and budget_exhausted(expanded, max_expansions, deadline):
+                return False
+            k_old = open_list.top_key()
+            current = open_list.pop()
+            k_new = self._array_key(current)
+            if k_old < k_new:
+                open_list.insert(current, k_new)
+                continue
+            self.stats['nodes_expanded'] += 1
+            expanded += 1
+
+            if g[current] > rhs[current]:
+                g[current] = rhs[current]
+                for neighbor, edge_cost in self._array_predecessors(current):
+                    if neighbor != self.goal:
+                        cost = edge_cost + g[current]
+                        if cost < rhs[neighbor]:
+                            rhs[neighbor] = cost
+                    self._array_update_vertex(neighbor)
+            else:
+                g[current] = INF
+                for neighbor, _ in self._array_predecessors(current):
+                    self._array_update_vertex(neighbor)
+                self._array_update_vertex(current)
+        return True
+
+    def _array_extract_path(self) -> List[Tuple[int, int]]:
+        """g değerlerinde iniş yaparak yolu çıkar.
+
+        Derlenmiş komşuluk varsa adımlar `GridAdjacency` indeks/maliyet
+        tablolarından (köşe kesme kuralı tabloda) liste oluşturmadan okunur.
+        Yalnızca g'si azalan komşulara gidildiğinden tutarsız g değerleriyle
+        de döngü oluşmaz; iniş hedefe varmadan biterse ``path_status``
+        ``'stalled'`` olur ve yol kesildiği hücrede biter.
+        """
+        store = self.nodes
+        g = store.g_view
+        coords = store.coords
+        if g[self.start] == INF:
+            self.path_status = PATH_UNREACHABLE
+            return []
+
+        stamp = store.stamp_view
+        generation = store.generation
+        offsets = self.goal_offsets
+        goal = self.goal
+        adjacency = self.adjacency
+        if adjacency is not None:
+            indices = adjacency.indices_view
+            costs = adjacency.costs_view
+        stride = len(DIRECTIONS)
+
+        ids = []
+        current = self.start
+        self.path_status = PATH_COMPLETE
+        while current != goal:
+            ids.append(current)
+            g_current = g[current]
+            best_neighbor = -1
+            best_cost = INF
+            if adjacency is not None:
+                base = current * stride
+                for slot in range(base, base + stride):
+                    neighbor = indices[slot]
+                    # Eski nesilden kalan komşunun g değeri sonsuz sayılır
+                    if neighbor < 0 or stamp[neighbor] != generation:
+                        continue
+                    g_neighbor = g[neighbor]
+                    if g_neighbor < g_current:
+                        cost = costs[slot] + g_neighbor
+                        if cost < best_cost:
+                            best_cost = cost
+                            best_neighbor = neighbor
+            else:
+                for neighbor, edge_cost in self._array_successors(current):
+                    g_neighbor = g[neighbor]
+                    if g_neighbor < g_current:
+                        cost = edge_cost + g_neighbor
+                        if cost < best_cost:
+                            best_cost = cost
+                            best_neighbor = neighbor
+            if offsets and offsets.get(current, INF) <= best_cost:
+                # Çoklu hedef: burada durmak devam etmekten ucuz
+                self.reached_goal = coords(current)
+                return [coords(node_id) for node_id in ids]
+            if best_neighbor < 0:
+                self.path_status = PATH_STALLED
+                return [coords(node_id) for node_id in ids]
+            current = best_neighbor
+
+        ids.append(goal)
+        self.reached_goal = coords(goal)
+        return [coords(node_id) for node_id in ids]
+
+    def _array_update_cells(self, cells: List[Tuple[int, int]]):
+        """Değişen hücrelerin ve komşularının rhs değerlerini yenile.
+
+        Etkilenen kimliklerin birleşimi bir kez toplanır ve her biri tek kez
+        güncellenir; geçilebilir komşusu olmayan hücreler atlanır.
+        """
+        if self.adjacency is not None:
+            self.adjacency.sync()
+        index = self.nodes.index
+        affected = {}
+        for x, y in cells:
+            node_id = index(x, y)
+            predecessors = self._array_predecessors(node_id)
+            for neighbor, _ in predecessors:
+                affected[neighbor] = None
+            if predecessors or node_id == self.start:
+                affected[node_id] = None
+        for node_id in affected:
+            self._array_update_vertex(node_id)
+
+    def _array_update_costs(self, cell_ids, old_costs, new_costs):
+        """Hücre maliyeti değişikliklerini gelen kenarlara uygula.
+
+        Maliyet azalınca öncülün rhs değeri doğrudan küçültülür; artınca
+        öncül yalnızca değişen kenar argmin ise yeniden taranır.
+        """
+        if self.adjacency is not None:
+            self.adjacency.sync()
+        store = self.nodes
+        g = store.g_view
+        rhs = store.rhs_view
+        goal = self.goal
+        for node_id, old_cost, new_cost in zip(cell_ids, old_costs, new_costs):
+            store.touch(node_id)
+            g_node = g[node_id]
+            for neighbor, edge_cost in self._array_predecessors(node_id):
+                if neighbor != goal:
+                    if new_cost < old_cost:
+                        cost = edge_cost + g_node
+                        if cost < rhs[neighbor]:
+                            rhs[neighbor] = cost
+                    elif rhs[neighbor] >= (self._edge_cost_for(neighbor, node_id, old_cost)
+                                           + g_node - COST_EPSILON):
+                        rhs[neighbor] = self._array_min_rhs(neighbor)
+                self._array_queue_vertex(neighbor)
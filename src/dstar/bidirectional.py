@@ -0,0 +1,193 @@
+import heapq
+import math
+import time
+from typing import List, Optional, Tuple
+
+from .adjacency import GridAdjacency, REVERSE_SLOT
+from .array_search import (INF, PATH_COMPLETE, PATH_UNREACHABLE, SEARCH_COMPLETE,
+                           SEARCH_PARTIAL)
+from .dstar_lite import DStarLite
+
+
+class BidirectionalAStar:
+    """Yeniden planlanmayacak tek seferlik sorgular için iki yönlü A*.
+
+    Kenarlar `GridAdjacency` tablolarından okunur; komşuluk, köşe kesme ve
+    arazi maliyeti kuralları `DStarLite` ile aynıdır. İleri arama başlangıçtan
+    çıkan, geri arama hedefe giren kenarları izler; her iki yön de Euclidean
+    heuristiği (``heuristic_weight`` ile) kullanır. Düğümler NBA* kuralıyla
+    budanır; bir yönün en küçük f değeri bulunan en iyi yol maliyetine
+    ulaşınca arama biter.
+
+    rhs, iki parçalı anahtar ve `update_vertex` taramaları olmadığından
+    düğüm başına iş D* Lite'tan azdır. ``stats`` D* Lite ile aynı
+    biçimdedir; ``last_cost`` son yolun maliyetidir.
+    """
+
+    def __init__(self, grid_map, heuristic_weight: float = 1.0):
+        self.grid_map = grid_map
+        self.width = grid_map.width
+        self.height = grid_map.height
+        self.heuristic_weight = heuristic_weight
+        self.adjacency = GridAdjacency(grid_map)
+        self.search_status = SEARCH_COMPLETE
+        self.path_status = PATH_COMPLETE
+        self.path_tentative = False
+        self.last_cost = INF
+        self.stats = {
+            'nodes_expanded': 0,
+            'replanning_count': 0,
+            'total_planning_time': 0.0
+        }
+
+    def heuristic(self, id1: int, id2: int) -> float:
+        """Euclidean mesafe (hücre kimlikleri üzerinden)"""
+        y1, x1 = divmod(id1, self.width)
+        y2, x2 = divmod(id2, self.width)
+        return self.heuristic_weight * math.hypot(x1 - x2, y1 - y2)
+
+    def plan_path(self, start: Tuple[int, int], goal: Tuple[int, int],
+                  max_expansions: Optional[int] = None,
+                  deadline: Optional[float] = None) -> List[Tuple[int, int]]:
+        """Yol planla (bütçe parametreleri `DStarLite.plan_path` ile aynı).
+
+        Bütçe biterse o ana kadar bulunan en iyi yol ``path_tentative`` ile
+        döner; henüz yol yoksa boş liste döner.
+        """
+        start_time = time.time()
+        self.adjacency.sync()
+        width = self.width
+        source = start[1] * width + start[0]
+        target = goal[1] * width + goal[0]
+        self.search_status = SEARCH_COMPLETE
+        self.path_tentative = False
+        self.last_cost = INF
+
+        if self.grid_map.is_obstacle(*start) or self.grid_map.is_obstacle(*goal):
+            self.path_status = PATH_UNREACHABLE
+            self.stats['total_planning_time'] += time.time() - start_time
+            return []
+
+        indices = self.adjacency.indices_view
+        costs = self.adjacency.costs_view
+        stride = self.adjacency.STRIDE
+        heuristic = self.heuristic
+
+        # Yön başına: g değerleri, ebeveynler (geri yönde hedefe doğru ardıl), kuyruk
+        g = ({source: 0.0}, {target: 0.0})
+        parent = ({source: -1}, {target: -1})
+        goals = (target, source)
+        queues = ([(heuristic(source, target), source)], [(heuristic(target, source), target)])
+        closed = (set(), set())
+        best, meet = (0.0, source) if source == target else (INF, -1)
+        expanded = 0
+
+        while queues[0] and queues[1]:
+            if queues[0][0][0] >= best or queues[1][0][0] >= best:
+                break
+            if max_expansions is not None and expanded >= max_expansions:
+                self.search_status = SEARCH_PARTIAL
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                self.search_status = SEARCH_PARTIAL
+                break
+
+            # Küçük kuyruğu genişlet
+            side = 0 if len(queues[0]) <= len(queues[1]) else 1
+            _, u = heapq.heappop(queues[side])
+            if u in closed[side]:
+                continue
+            closed[side].add(u)
+            g_side, g_other = g[side], g[1 - side]
+            g_u = g_side[u]
+            # NBA* budaması: u üzerinden geçen yol diğer cephenin en küçük
+            # f değeriyle bile en iyi yolu geçemiyorsa genişletme
+            other_queue = queues[1 - side]
+            if (g_u + heuristic(u, goals[side]) >= best or
+                    (other_queue and g_u + other_queue[0][0] - heuristic(u, goals[1 - side]) >= best)):
+                continue
+            expanded += 1
+            base = u * stride
+            for k in range(stride):
+                v = indices[base + k]
+                if v < 0:
+                    continue
+                # İleri: c(u, v); geri: c(v, u) (v'nin ters yuvası)
+                cost = costs[base + k] if side == 0 else costs[v * stride + REVERSE_SLOT - k]
+                new_g = g_u + cost
+                if new_g < g_side.get(v, INF):
+                    g_side[v] = new_g
+                    parent[side][v] = u
+                    heapq.heappush(queues[side], (new_g + heuristic(v, goals[side]), v))
+                    other = g_other.get(v)
+                    if other is not None and new_g + other < best:
+                        best, meet = new_g + other, v
+
+        self.stats['nodes_expanded'] += expanded
+        self.stats['total_planning_time'] += time.time() - start_time
+        if meet < 0:
+            self.path_status = PATH_UNREACHABLE
+            return []
+        self.path_status = PATH_COMPLETE
+        self.path_tentative = self.search_status == SEARCH_PARTIAL
+        self.last_cost = best
+        return self._join(meet, parent)
+
+    def _join(self, meet: int, parent) -> List[Tuple[int, int]]:
+        """İki yarı yolu buluşma hücresinde birleştir"""
+        width = self.width
+        cells = []
+        node = meet
+        while node >= 0:
+            cells.append(node)
+            node = parent[0][node]
+        cells.reverse()
+        node = parent[1][meet]
+        while node >= 0:
+            cells.append(node)
+            node = parent[1][node]
+        return [(cell % width, cell // width) for cell in cells]
+
+
+class QueryDispatcher:
+    """Tek seferlik sorguları `BidirectionalAStar`'a, dinamik oturumları
+    `DStarLite`'a yönlendirir.
+
+    ``plan_path(..., session=True)`` yeni bir D* Lite oturumu başlatır;
+    `replan_path` ve `update_obstacles` bu oturuma gider. ``dstar_options``
+    `DStarLite` yapıcısına aktarılır.
+    """
+
+    def __init__(self, grid_map, heuristic_weight: float = 1.0, **dstar_options):
+        self.grid_map = grid_map
+        self.heuristic_weight = heuristic_weight
+        self.dstar_options = dstar_options
+        self.one_shot = BidirectionalAStar(grid_map, heuristic_weight)
+        self.session: Optional[DStarLite] = None
+        self.stats = {
+            'one_shot_queries': 0,
+            'session_queries': 0
+        }
+
+    def plan_path(self, start: Tuple[int, int], goal: Tuple[int, int],
+                  session: bool = False, **budget) -> List[Tuple[int, int]]:
+        """``session`` False ise tek seferlik, True ise yeniden planlanabilir yol"""
+        if not session:
+            self.stats['one_shot_queries'] += 1
+            return self.one_shot.plan_path(start, goal, **budget)
+        self.stats['session_queries'] += 1
+        self.session = DStarLite(self.grid_map, self.heuristic_weight, **self.dstar_options)
+        return self.session.plan_path(start, goal, **budget)
+
+    def _require_session(self) -> DStarLite:
+        if self.session is None:
+            raise ValueError("Açık bir D* Lite oturumu yok (plan_path(..., session=True))")
+        return self.session
+
+    def replan_path(self, new_start: Optional[Tuple[int, int]] = None, **budget) -> List[Tuple[int, int]]:
+        """Oturumu yeni başlangıçtan yeniden planla"""
+        return self._require_session().replan_path(new_start, **budget)
+
+    def update_obstacles(self, changed_cells, **budget):
+        """Engel değişikliklerini oturuma uygula"""
+        return self._require_session().update_obstacles(changed_cells, **budget)
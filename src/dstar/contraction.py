@@ -0,0 +1,375 @@
+import heapq
+import time
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+from .road_graph import RoadGraph
+
+
+class ContractionHierarchy:
+    """`RoadGraph` üzerinde özelleştirilebilir kontraksiyon hiyerarşisi (CCH).
+
+    Ön işleme metrikten bağımsızdır: düğümler minimum derece sırasıyla
+    elenir ve her elemede üst komşular arasına kısayol eklenir. Elde edilen
+    kordal grafın her yayı için (alt, üst) ikilisinin iki yöndeki ağırlığı
+    `customize` ile hesaplanır: düğümler eleme ağacı seviyesine göre işlenir
+    ve her alt üçgen ``v -> x -> w`` yayı ``v -> w``'yi küçültebilir. Trafik
+    değiştiğinde yalnızca bu adım tekrarlanır (sıralama ve üçgenler aynı).
+
+    `plan_path` iki yönlü yukarı Dijkstra ile sorgular; kısayollar üçgen
+    orta düğümleriyle açılır, graf kenarları da `RoadGraph` zincirleriyle
+    hücrelere açılır. `save` / `load` ön işlenmiş veriyi ``.npz`` olarak
+    saklar; yüklemede graf topolojisi doğrulanır.
+    """
+
+    # `save` ile yazılan ön işleme ve özelleştirme dizileri
+    _SAVED = ('rank', 'arc_tail', 'arc_head', 'tri_low', 'tri_first', 'tri_second',
+              'tri_target', 'tri_levels', 'edge_arc', 'edge_upward',
+              'up_weight', 'down_weight', 'up_middle', 'down_middle')
+
+    def __init__(self, road_graph: RoadGraph, _state: Optional[Dict[str, np.ndarray]] = None):
+        self.graph = road_graph
+        self.node_cells = np.flatnonzero(road_graph.is_node)
+        self._index = {cell: i for i, cell in enumerate(self.node_cells.tolist())}
+        self.stats = {
+            'nodes_expanded': 0,
+            'queries': 0,
+            'total_planning_time': 0.0,
+            'preprocessing_time': 0.0,
+            'customization_time': 0.0
+        }
+        self.last_cost = float('inf')
+
+        start_time = time.time()
+        if _state is None:
+            self._contract()
+            self._finish_topology()
+            self._build_triangles()
+        else:
+            self._restore(_state)
+            self._finish_topology()
+        self.stats['preprocessing_time'] = time.time() - start_time
+
+        if _state is None:
+            self.customize(refresh=False)
+
+    # ---- Metrikten bağımsız ön işleme -------------------------------------
+
+    def _contract(self):
+        """Minimum derece eleme sırası ve kordal üst komşuluklar"""
+        size = len(self.node_cells)
+        adjacency = [set() for _ in range(size)]
+        for source, target in zip(self.graph.edge_sources.tolist(), self.graph.edge_targets.tolist()):
+            u, v = self._index[source], self._index[target]
+            adjacency[u].add(v)
+            adjacency[v].add(u)
+
+        heap = [(len(neighbors), u) for u, neighbors in enumerate(adjacency)]
+        heapq.heapify(heap)
+        eliminated = [False] * size
+        order = []
+        upper = [None] * size
+        while heap:
+            degree, u = heapq.heappop(heap)
+            if eliminated[u] or degree != len(adjacency[u]):
+                continue
+            eliminated[u] = True
+            order.append(u)
+            neighbors = adjacency[u]
+            upper[u] = neighbors
+            for v in neighbors:
+                adjacency[v].discard(u)
+                adjacency[v] |= neighbors
+                adjacency[v].discard(v)
+                heapq.heappush(heap, (len(adjacency[v]), v))
+
+        self.rank = np.empty(size, dtype=np.int64)
+        self.rank[order] = np.arange(size)
+        tails, heads = [], []
+        for u in range(size):
+            for v in sorted(upper[u], key=self.rank.__getitem__):
+                tails.append(u)
+                heads.append(v)
+        self.arc_tail = np.array(tails, dtype=np.int64)
+        self.arc_head = np.array(heads, dtype=np.int64)
+
+    def _restore(self, state: Dict[str, np.ndarray]):
+        if not (np.array_equal(state['node_cells'], self.node_cells) and
+                np.array_equal(state['edge_sources'], self.graph.edge_sources) and
+                np.array_equal(state['edge_targets'], self.graph.edge_targets)):
+            raise ValueError("Kaydedilmiş hiyerarşi bu yol grafıyla uyuşmuyor")
+        for key in self._SAVED:
+            setattr(self, key, state[key])
+        self._weights = (self.up_weight.tolist(), self.down_weight.tolist())
+
+    def _finish_topology(self):
+        """Yay arama tablosu ve CSR düzeni"""
+        size = len(self.node_cells)
+        tails = self.arc_tail.tolist()
+        heads = self.arc_head.tolist()
+        self._arc = {(u, v): arc for arc, (u, v) in enumerate(zip(tails, heads))}
+
+        # Yaylar kuyruk düğümüne göre sıralı (CSR düzeni)
+        if np.any(np.diff(self.arc_tail) < 0):
+            raise ValueError("Yaylar kuyruk düğümüne göre sıralı değil")
+        counts = np.bincount(self.arc_tail, minlength=size)
+        self.up_start = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.up_start[1:])
+        self._up_start = self.up_start.tolist()
+        self._arc_head = heads
+
+    def _build_triangles(self):
+        """Alt üçgenler, eleme seviyeleri ve graf kenarı -> yay eşlemesi"""
+        size = len(self.node_cells)
+        heads = self._arc_head
+
+        # Alt üçgenler (x, v, w): x'in üst komşuları v < w için v -> w yayı
+        low, first, second, target = [], [], [], []
+        start = self._up_start
+        for x in range(size):
+            arcs = range(start[x], start[x + 1])
+            for i in arcs:
+                v = heads[i]
+                for j in range(i + 1, start[x + 1]):
+                    low.append(x)
+                    first.append(i)
+                    second.append(j)
+                    target.append(self._arc[(v, heads[j])])
+        self.tri_low = np.array(low, dtype=np.int64)
+        self.tri_first = np.array(first, dtype=np.int64)    # yay (x, v)
+        self.tri_second = np.array(second, dtype=np.int64)  # yay (x, w)
+        self.tri_target = np.array(target, dtype=np.int64)  # yay (v, w)
+
+        # Eleme ağacı seviyesi: bir düğümün üçgenleri, alt seviyeler bitince kesinleşir
+        level = np.zeros(size, dtype=np.int64)
+        for x in np.argsort(self.rank).tolist():
+            for i in range(start[x], start[x + 1]):
+                v = heads[i]
+                if level[v] <= level[x]:
+                    level[v] = level[x] + 1
+        order = np.argsort(level[self.tri_low], kind='stable')
+        self.tri_low, self.tri_first, self.tri_second, self.tri_target = (
+            self.tri_low[order], self.tri_first[order], self.tri_second[order], self.tri_target[order])
+        self.tri_levels = np.searchsorted(level[self.tri_low],
+                                          np.arange(level.max() + 2 if size else 1))
+
+        # Her graf kenarının yayı ve yönü (alt -> üst ise yukarı)
+        sources = np.array([self._index[c] for c in self.graph.edge_sources.tolist()], dtype=np.int64)
+        targets = np.array([self._index[c] for c in self.graph.edge_targets.tolist()], dtype=np.int64)
+        self.edge_upward = self.rank[sources] < self.rank[targets]
+        low = np.where(self.edge_upward, sources, targets).tolist()
+        high = np.where(self.edge_upward, targets, sources).tolist()
+        self.edge_arc = np.array([self._arc[pair] for pair in zip(low, high)], dtype=np.int64)
+
+    @property
+    def shortcut_count(self) -> int:
+        """Özgün grafta karşılığı olmayan yay sayısı"""
+        return len(self.arc_tail) - len(self._original_arcs())
+
+    def _original_arcs(self):
+        index = self._index
+        return {tuple(sorted((index[s], index[t]), key=self.rank.__getitem__))
+                for s, t in zip(self.graph.edge_sources.tolist(), self.graph.edge_targets.tolist())}
+
+    # ---- Özelleştirme -----------------------------------------------------
+
+    def customize(self, refresh: bool = True):
+        """Yay ağırlıklarını güncel kenar maliyetleriyle yeniden hesapla.
+
+        ``refresh=True`` ise önce `RoadGraph.refresh_costs` çağrılır.
+        """
+        start_time = time.time()
+        if refresh:
+            self.graph.refresh_costs()
+        arcs = len(self.arc_tail)
+        up = np.full(arcs, np.inf)
+        down = np.full(arcs, np.inf)
+        upward = self.edge_upward
+        np.minimum.at(up, self.edge_arc[upward], self.graph.costs[upward])
+        np.minimum.at(down, self.edge_arc[~upward], self.graph.costs[~upward])
+        original_up, original_down = up.copy(), down.copy()
+
+        # v -> x -> w: c(v -> x) = down(x, v), c(x -> w) = up(x, w)
+        first, second, target = self.tri_first, self.tri_second, self.tri_target
+        bounds = self.tri_levels
+        for level in range(len(bounds) - 1):
+            lo, hi = bounds[level], bounds[level + 1]
+            if lo == hi:
+                continue
+            f, s, t = first[lo:hi], second[lo:hi], target[lo:hi]
+            np.minimum.at(up, t, down[f] + up[s])
+            np.minimum.at(down, t, down[s] + up[f])
+
+        # Kısayol orta düğümleri (özgün kenardan kesin daha iyiyse)
+        up_middle = np.full(arcs, -1, dtype=np.int64)
+        down_middle = np.full(arcs, -1, dtype=np.int64)
+        low = self.tri_low
+        via_up = down[first] + up[second]
+        via_down = down[second] + up[first]
+        hit = (via_up == up[target]) & (via_up < original_up[target])
+        up_middle[target[hit]] = low[hit]
+        hit = (via_down == down[target]) & (via_down < original_down[target])
+        down_middle[target[hit]] = low[hit]
+
+        self.up_weight, self.down_weight = up, down
+        self.up_middle, self.down_middle = up_middle, down_middle
+        self._weights = (up.tolist(), down.tolist())
+        self.stats['customization_time'] = time.time() - start_time
+
+    # ---- Sorgu ------------------------------------------------------------
+
+    def _endpoints(self, cell: int, outgoing: bool) -> List[Tuple[int, float, List[int]]]:
+        """Hücreyi graf düğümlerine bağla: (düğüm, maliyet, ara hücreler)"""
+        if cell in self._index:
+            return [(self._index[cell], 0.0, [])]
+        links = []
+        for end, walk, back in self.graph.split(cell):
+            cells = walk if outgoing else back
+            links.append((self._index[end], self.graph.path_cost(cells), cells))
+        return links
+
+    def plan_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """İki yönlü yukarı arama ile hücre yolu (yol yoksa boş liste)"""
+        start_time = time.time()
+        self.stats['queries'] += 1
+        width = self.graph.width
+        start_cell = start[1] * width + start[0]
+        goal_cell = goal[1] * width + goal[0]
+        self.last_cost = float('inf')
+        if start_cell == goal_cell:
+            self.last_cost = 0.0
+            return [tuple(start)]
+
+        sources = self._endpoints(start_cell, outgoing=True)
+        targets = self._endpoints(goal_cell, outgoing=False)
+        best, meet, direct = float('inf'), None, None
+
+        # Başlangıç ve hedef aynı zincirdeyse doğrudan zincir boyunca
+        for end, walk, _ in self.graph.split(start_cell, stops={goal_cell}):
+            if walk[-1] == goal_cell:
+                cost = self.graph.path_cost(walk)
+                if cost < best:
+                    best, direct = cost, walk
+
+        forward, forward_parent = self._seed(sources)
+        backward, backward_parent = self._seed(targets)
+        queues = [[(cost, node) for node, cost in forward.items()],
+                  [(cost, node) for node, cost in backward.items()]]
+        for queue in queues:
+            heapq.heapify(queue)
+        for node, cost in forward.items():
+            if node in backward and cost + backward[node] < best:
+                best, meet, direct = cost + backward[node], node, None
+
+        up_start, heads = self._up_start, self._arc_head
+        weights = self._weights
+        dists = (forward, backward)
+        parents = (forward_parent, backward_parent)
+        expanded = 0
+        while any(queue and queue[0][0] < best for queue in queues):
+            for side in (0, 1):
+                queue = queues[side]
+                if not queue or queue[0][0] >= best:
+                    continue
+                cost, u = heapq.heappop(queue)
+                dist = dists[side]
+                if cost > dist[u]:
+                    continue
+                expanded += 1
+                other = dists[1 - side].get(u)
+                if other is not None and cost + other < best:
+                    best, meet, direct = cost + other, u, None
+                weight = weights[side]
+                for arc in range(up_start[u], up_start[u + 1]):
+                    v = heads[arc]
+                    new_cost = cost + weight[arc]
+                    if new_cost < dist.get(v, float('inf')):
+                        dist[v] = new_cost
+                        parents[side][v] = arc
+                        heapq.heappush(queue, (new_cost, v))
+
+        self.stats['nodes_expanded'] += expanded
+        path = []
+        if direct is not None:
+            path = [tuple(start)] + [(cell % width, cell // width) for cell in direct]
+        elif meet is not None:
+            path = self._cell_path(start, meet, forward_parent, backward_parent, sources, targets)
+        if path:
+            self.last_cost = best
+        self.stats['total_planning_time'] += time.time() - start_time
+        return path
+
+    @staticmethod
+    def _seed(endpoints):
+        dist, parent = {}, {}
+        for node, cost, cells in endpoints:
+            if cost < dist.get(node, float('inf')):
+                dist[node] = cost
+                parent[node] = ('seed', cells)
+        return dist, parent
+
+    def _cell_path(self, start, meet, forward_parent, backward_parent, sources, targets):
+        """Buluşma düğümünden hücre yolunu kur"""
+        width = self.graph.width
+        tails = self.arc_tail
+
+        # İleri: tohum -> ... -> meet (yukarı yaylar)
+        up_arcs = []
+        node = meet
+        while not isinstance(forward_parent[node], tuple):
+            arc = forward_parent[node]
+            up_arcs.append(arc)
+            node = int(tails[arc])
+        first_cells = forward_parent[node][1]
+        nodes = [node]
+        for arc in reversed(up_arcs):
+            self._unpack(arc, True, nodes)
+
+        # Geri: meet -> ... -> hedef tohumu (aşağı yaylar)
+        node = meet
+        while not isinstance(backward_parent[node], tuple):
+            arc = backward_parent[node]
+            self._unpack(arc, False, nodes)
+            node = int(tails[arc])
+        last_cells = backward_parent[node][1]
+
+        cells = list(first_cells)
+        node_cells = self.node_cells
+        for a, b in zip(nodes, nodes[1:]):
+            cells.extend(self.graph.edge_path(int(node_cells[a]), int(node_cells[b])))
+        cells.extend(last_cells)
+        return [tuple(start)] + [(cell % width, cell // width) for cell in cells]
+
+    def _unpack(self, arc: int, upward: bool, out: List[int]):
+        """Yayı özgün kenarlara aç; geçilen düğümleri (ilki hariç) ``out``'a ekle"""
+        stack = [(arc, upward)]
+        while stack:
+            arc, upward = stack.pop()
+            tail, head = int(self.arc_tail[arc]), int(self.arc_head[arc])
+            middle = int(self.up_middle[arc] if upward else self.down_middle[arc])
+            if middle < 0:
+                out.append(head if upward else tail)
+            elif upward:
+                # tail -> middle -> head; yığın ters sırayla
+                stack.append((self._arc[(middle, head)], True))
+                stack.append((self._arc[(middle, tail)], False))
+            else:
+                # head -> middle -> tail
+                stack.append((self._arc[(middle, tail)], True))
+                stack.append((self._arc[(middle, head)], False))
+
+    # ---- Kalıcılık --------------------------------------------------------
+
+    def save(self, path):
+        """Sıralama, yaylar ve özelleştirilmiş ağırlıkları ``.npz`` dosyasına yaz"""
+        np.savez_compressed(path, node_cells=self.node_cells,
+                            edge_sources=self.graph.edge_sources,
+                            edge_targets=self.graph.edge_targets,
+                            **{key: getattr(self, key) for key in self._SAVED})
+
+    @classmethod
+    def load(cls, path, road_graph: RoadGraph) -> 'ContractionHierarchy':
+        """`save` ile yazılmış hiyerarşiyi aynı topolojili yol grafına yükle"""
+        with np.load(path) as data:
+            state = {key: data[key] for key in data.files}
+        return cls(road_graph, _state=state)
@@ -0,0 +1,93 @@
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+from .array_search import DIRECTIONS
+
+
+def field_successors(g_field: np.ndarray, cost_table: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Her hücre için en iyi ardılın kimliği ve ``c + g`` değeri.
+
+    ``cost_table`` `GridAdjacency.cost_table` düzenindedir: (height, width, 8)
+    kenar maliyetleri, yuva ``k`` ``DIRECTIONS[k]`` yönü, geçersiz kenar inf.
+    Ardıl ``argmin_k c(s, s_k) + g(s_k)`` olup yalnızca g değeri azalan
+    komşular sayılır; böylece tutarsız alanlarda bile izleme döngüye girmez.
+    İki (height, width) dizi döner; ardılı olmayan hücrelerde kimlik -1,
+    değer inf'tir.
+    """
+    height, width = g_field.shape
+    padded = np.pad(g_field, 1, constant_values=np.inf)
+    totals = np.empty((height, width, len(DIRECTIONS)), dtype=np.float64)
+    for k, (dx, dy) in enumerate(DIRECTIONS):
+        neighbor_g = padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+        totals[:, :, k] = np.where(neighbor_g < g_field, cost_table[:, :, k] + neighbor_g, np.inf)
+
+    best_slot = totals.argmin(axis=2)
+    best_total = np.take_along_axis(totals, best_slot[:, :, None], axis=2)[:, :, 0]
+    offsets = np.array([dy * width + dx for dx, dy in DIRECTIONS], dtype=np.int64)
+    cell_ids = np.arange(height * width, dtype=np.int64).reshape(height, width)
+    successors = np.where(np.isfinite(best_total), cell_ids + offsets[best_slot], -1)
+    return successors, best_total
+
+
+def cost_table_graph(cost_table: np.ndarray, reverse: bool = False) -> csr_matrix:
+    """``cost_table`` kenarlarından hücre kimlikli SciPy seyrek grafı.
+
+    ``reverse=True`` ise kenarlar ters çevrilir; tek kaynaklı Dijkstra bu
+    durumda kaynağa *varış* maliyetlerini verir.
+    """
+    height, width, _ = cost_table.shape
+    finite = np.isfinite(cost_table)
+    ys, xs, slots = np.nonzero(finite)
+    offsets = np.array([dy * width + dx for dx, dy in DIRECTIONS], dtype=np.int64)
+    sources = ys.astype(np.int64) * width + xs
+    targets = sources + offsets[slots]
+    if reverse:
+        sources, targets = targets, sources
+    size = height * width
+    return csr_matrix((cost_table[finite], (sources, targets)), shape=(size, size))
+
+
+def dijkstra_cost_field(cost_table: np.ndarray, goal_id: int) -> np.ndarray:
+    """Tüm hücrelerin ``goal_id``'ye kalan maliyeti, tek bir Dijkstra geçişiyle.
+
+    ``cost_table`` `GridAdjacency.cost_table` düzenindedir. Kenarlar ters
+    çevrilir, böylece hedeften başlayan tek kaynaklı SciPy Dijkstra her
+    hücre için ``min c(s, s') + g(s')`` değerini verir. Döndürülen
+    (height, width) alanda ulaşılamayan hücreler inf'tir.
+    """
+    height, width, _ = cost_table.shape
+    reverse = cost_table_graph(cost_table, reverse=True)
+    return dijkstra(reverse, directed=True, indices=goal_id).reshape(height, width)
+
+
+def descend_cost_field(g_field: np.ndarray, start: Tuple[int, int], cost_table: np.ndarray,
+                       goal_offsets: Optional[Dict[int, float]] = None) -> List[Tuple[int, int]]:
+    """Maliyet alanında ``start``'tan gradyan inişiyle yol çıkar.
+
+    Ardıllar tüm alan için tek seferde vektörel hesaplanır; yol izleme yalnızca
+    dizi indekslemesidir. İniş ardılı olmayan hücrede (hedef, yerel minimum)
+    durur. ``goal_offsets`` ({hücre kimliği: maliyet}) verilirse, durmanın
+    devam etmekten ucuz olduğu hedefte de durulur (çoklu hedef). ``start``'ın
+    g değeri sonsuzsa boş liste döner.
+    """
+    height, width = g_field.shape
+    x, y = start
+    if not np.isfinite(g_field[y, x]):
+        return []
+    successors, best_total = field_successors(g_field, cost_table)
+    successors = successors.ravel().tolist()
+    best_total = best_total.ravel()
+    offsets = goal_offsets or {}
+    current = y * width + x
+    path = []
+    while True:
+        path.append((current % width, current // width))
+        offset = offsets.get(current)
+        if offset is not None and offset <= best_total[current]:
+            break
+        current = successors[current]
+        if current < 0:
+            break
+    return path
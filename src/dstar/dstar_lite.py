@@ -1,45 +1,160 @@
 import heapq
-import math
 import numpy as np
 from typing import List, Tuple, Dict, Set, Optional
-from dataclasses import dataclass
-from src.utils.data_structures import PriorityQueue
+from src.utils.data_structures import QUEUE_TYPES
+from src.dstar.node_store import ArrayNodeStore
+from src.dstar.array_search import (ArraySearchMixin, COST_EPSILON, INF, SEARCH_COMPLETE,
+                                     SEARCH_PARTIAL, PATH_COMPLETE, PATH_STALLED,
+                                     PATH_UNREACHABLE, budget_exhausted)
+from src.dstar.optimized_search import OptimizedSearchMixin
+from src.dstar.anytime_search import AnytimeSearchMixin
+from src.dstar.providers import GridProvider
+from src.dstar.cost_field import descend_cost_field, dijkstra_cost_field
 
-@dataclass
 class Node:
-    """D* Lite düğüm sınıfı"""
-    x: int
-    y: int
-    g: float = float('inf')  # Başlangıçtan gerçek maliyet
-    rhs: float = float('inf')  # Tek adım lookahead maliyet
-    h: float = 0.0  # Heuristik maliyet
+    """D* Lite düğüm sınıfı
+    
+    ``__slots__`` ile örnek başına ``__dict__`` tutulmaz. ``id`` kurulumda
+    bir kez hesaplanan tamsayı anahtardır (``y << 32`` + ``x``); hash ve
+    eşitlik yalnızca ona bakar, böylece kuyruk sözlüklerinde her aramada
+    (x, y) demeti kurulmaz. ``last_cost`` trafik planlayıcısının son
+    raporlanan dinamik maliyetidir (henüz yoksa None).
+    """
+    
+    __slots__ = ('x', 'y', 'id', 'g', 'rhs', 'h', 'generation', 'last_cost')
+    
+    def __init__(self, x: int, y: int, g: float = INF, rhs: float = INF,
+                 h: float = 0.0, generation: int = 0, last_cost: Optional[float] = None):
+        # NumPy tamsayıları da kabul edilir; __hash__ Python int döndürmeli
+        self.x = x = int(x)
+        self.y = y = int(y)
+        self.id = (y << 32) + x
+        self.g = g  # Başlangıçtan gerçek maliyet
+        self.rhs = rhs  # Tek adım lookahead maliyet
+        self.h = h  # Heuristik maliyet
+        self.generation = generation  # Değerlerin ait olduğu arama nesli
+        self.last_cost = last_cost
     
     def __hash__(self):
-        return hash((self.x, self.y))
+        return self.id
     
     def __eq__(self, other):
-        return self.x == other.x and self.y == other.y
+        if not isinstance(other, Node):
+            return NotImplemented
+        return self.id == other.id
+    
+    def __repr__(self):
+        return (f"Node(x={self.x}, y={self.y}, g={self.g}, rhs={self.rhs}, "
+                f"h={self.h}, generation={self.generation})")
+
+STORAGE_MODES = ('object', 'array', 'lazy')
+ENGINES = ('basic', 'optimized')
+
+class DStarLite(AnytimeSearchMixin, OptimizedSearchMixin, ArraySearchMixin):
+    """D* Lite algoritması implementasyonu
 
-class DStarLite:
-    """D* Lite algoritması implementasyonu"""
+    Sınıf tüm D* planlayıcılarının ortak çekirdeğidir. Komşuluk, kenar
+    maliyeti ve heuristik bir sağlayıcıdan (``provider``) gelir; verilmezse
+    ``grid_map`` için `GridProvider` kullanılır. `TrafficAwareDStar` ve
+    `DStarLiteOriginal` yalnızca farklı sağlayıcı ve seçeneklerle kurulan
+    yapılandırmalardır. Sağlayıcı arayüzü: ``width``, ``height``,
+    ``neighbor_ids``, ``cost_ids``, ``edge_cost_for``, ağırlıksız
+    ``heuristic_ids``, ``compile`` (derlenmiş komşuluk ya da None) ve toplu
+    ``edge_cost_table`` / ``cell_cost_grid``.
+    
+    ``storage='object'`` her hücre için bir `Node` nesnesi tutar.
+    ``storage='array'`` g/rhs/h değerlerini `ArrayNodeStore` dizilerinde tutar;
+    bu modda `get_node` tamsayı hücre kimliği döndürür ve `update_vertex`,
+    `compute_shortest_path`, `extract_path` bu kimliklerle çalışır.
+    ``storage='lazy'`` düğümleri önceden oluşturmaz; `get_node` ilk erişimde
+    oluşturur ve her yeni aramada hepsi bırakılır. Bellek ve başlangıç süresi
+    harita alanıyla değil keşfedilen bölgeyle ölçeklenir.
+    
+    Dizi modunda ``compiled_adjacency=True`` (varsayılan) komşuluk ve kenar
+    maliyetlerini sağlayıcının `compile` tablolarına (`GridAdjacency`,
+    `TrafficAdjacency`) bir kez derler; değişiklikler bu tablolara artımlı
+    olarak yamalanır.
+    
+    ``queue='indexed'`` açık listeyi silinmiş işaretli girdi biriktirmeyen
+    `IndexedPriorityQueue` ile tutar.
+    
+    ``engine='optimized'`` Koenig & Likhachev'in optimize D* Lite sürümünü
+    seçer (dizi deposu ve derlenmiş komşuluk gerekir); aynı yolları daha az
+    rhs taramasıyla bulur.
+    
+    `compute_shortest_path` bir genişletme bütçesi (``max_expansions``) ya da
+    ``time.perf_counter`` cinsinden bir son an (``deadline``) alabilir.
+    Bütçe biterse ``'partial'`` döner, kalan iş açık listede bekler ve sonraki
+    çağrı kaldığı yerden sürer. Bu durumda çıkarılan yol ``path_tentative``
+    ile işaretlenir.
+    
+    `plan_path_anytime` / `improve_path` AD* tarzı anytime modu sağlar: önce
+    şişirilmiş heuristikle hızlı bir yol, ardından ε düşürülerek önceki arama
+    yeniden kullanılıp iyileştirilmiş yollar; her yol ε sınırıyla döner.
     
-    def __init__(self, grid_map, heuristic_weight=1.0):
+    `plan_path_multi_goal` birden çok hedefi (isteğe bağlı başlangıç
+    maliyetleriyle) rhs = maliyet olarak tohumlar; tek aramada en ucuz hedefi
+    ve yolunu bulur. Bu modda ``goal`` gerçek bir hücre değildir, hedefler
+    ``goal_offsets`` içinde tutulur.
+    
+    `cost_field` hedefe kalan maliyet alanını (g, isteğe bağlı rhs)
+    (height, width) dizisi olarak verir; dizi modunda depoyla bellek paylaşır.
+    `extract_path_from_field` bu alan üzerinde vektörel gradyan inişi yapar.
+    
+    ``plan_path(..., warm_start=True)`` ilk aramayı `warm_start_search` ile
+    yapar: hedefe kalan maliyetler SciPy Dijkstra ile toplu hesaplanıp
+    tutarlı g = rhs durumu olarak yüklenir. Sonraki artımlı güncellemeler
+    normal D* Lite yolundan geçer.
+    """
+    
+    def __init__(self, grid_map, heuristic_weight=1.0, storage: str = 'object',
+                 compiled_adjacency: bool = True, queue: str = 'lazy',
+                 engine: str = 'basic', provider=None):
+        if storage not in STORAGE_MODES:
+            raise ValueError(f"Bilinmeyen depolama modu: {storage}")
+        if queue not in QUEUE_TYPES:
+            raise ValueError(f"Bilinmeyen kuyruk tipi: {queue}")
+        if engine not in ENGINES:
+            raise ValueError(f"Bilinmeyen motor: {engine}")
+        if engine == 'optimized' and not (storage == 'array' and compiled_adjacency):
+            raise ValueError("Optimize motor dizi deposu ve derlenmiş komşuluk gerektirir")
+        self.engine = engine
+        self.optimized = engine == 'optimized'
         self.grid_map = grid_map
-        self.width = grid_map.width
-        self.height = grid_map.height
+        self.provider = provider if provider is not None else GridProvider(grid_map)
+        self.width = self.provider.width
+        self.height = self.provider.height
         self.heuristic_weight = heuristic_weight
+        self.base_heuristic_weight = heuristic_weight  # Anytime ε bu değeri çarpar
+        self.storage = storage
+        self.array_mode = storage == 'array'
+        self.lazy_mode = storage == 'lazy'
+        self._reset_anytime()
         
         # Düğüm haritası
         self.nodes = {}
+        self.generation = 0  # initialize_search her çağrıda artırır
         self.initialize_nodes()
         
+        # Derlenmiş komşuluk tabloları (yalnızca dizi modunda)
+        self.adjacency = (self.provider.compile()
+                          if self.array_mode and compiled_adjacency else None)
+        if self.optimized and self.adjacency is None:
+            raise ValueError("Sağlayıcı derlenmiş komşuluk sunmuyor; optimize motor kullanılamaz")
+        
         # Priority queue
-        self.open_list = PriorityQueue()
+        self.open_list = QUEUE_TYPES[queue]()
         
         # Başlangıç ve hedef noktalar
         self.start = None
         self.goal = None
         self.last_start = None
+        self.km = 0.0  # Başlangıç hareketlerinden biriken anahtar düzeltmesi
+        self.search_status = SEARCH_COMPLETE
+        self.path_tentative = False  # Son çıkarılan yol kısmi aramadan mı
+        self.goal_offsets = {}  # Çoklu hedef modunda düğüm -> hedef maliyeti
+        self.reached_goal = None  # Son çıkarılan yolun ulaştığı hedef
+        self.path_status = PATH_COMPLETE
         
         # İstatistikler
         self.stats = {
@@ -50,73 +165,98 @@ class DStarLite:
     
     def initialize_nodes(self):
         """Tüm düğümleri başlat"""
+        if self.array_mode:
+            self.nodes = ArrayNodeStore(self.width, self.height)
+            return
+        if self.lazy_mode:
+            return  # Düğümler get_node ile ihtiyaç oldukça oluşturulur
         for y in range(self.height):
             for x in range(self.width):
                 self.nodes[(x, y)] = Node(x, y)
     
     def get_node(self, x: int, y: int) -> Node:
         """Koordinatlara göre düğüm getir"""
-        if (x, y) not in self.nodes:
-            self.nodes[(x, y)] = Node(x, y)
-        return self.nodes[(x, y)]
+        if self.array_mode:
+            return self.nodes.index(x, y)
+        node = self.nodes.get((x, y))
+        if node is None:
+            node = Node(x, y, generation=self.generation)
+            self.nodes[(x, y)] = node
+        elif node.generation != self.generation:
+            # Önceki aramadan kalan değerler geçersiz
+            node.g = float('inf')
+            node.rhs = float('inf')
+            node.generation = self.generation
+        return node
     
     def heuristic(self, node1: Node, node2: Node) -> float:
-        """Heuristik fonksiyon (Euclidean distance)"""
-        dx = abs(node1.x - node2.x)
-        dy = abs(node1.y - node2.y)
-        return self.heuristic_weight * math.sqrt(dx*dx + dy*dy)
+        """Sağlayıcının heuristiği (``heuristic_weight`` ile)"""
+        if self.array_mode:
+            return self._heuristic_ids(node1, node2)
+        width = self.width
+        return self.heuristic_weight * self.provider.heuristic_ids(node1.y * width + node1.x,
+                                                                   node2.y * width + node2.x)
     
     def get_neighbors(self, node: Node) -> List[Node]:
-        """Bir düğümün komşularını getir (köşe kesmeyi engelle)"""
-        neighbors = []
-        directions = [(-1, -1), (-1, 0), (-1, 1), (0, -1), 
-                      (0, 1), (1, -1), (1, 0), (1, 1)]
-
-        for dx, dy in directions:
-            nx, ny = node.x + dx, node.y + dy
-            if not (0 <= nx < self.width and 0 <= ny < self.height):
-                continue
-            if self.grid_map.is_obstacle(nx, ny):
-                continue
-            # Diyagonal harekette köşe kesmeyi engelle: her iki ortogonal komşu da geçişe açık olmalı
-            if dx != 0 and dy != 0:
-                if (self.grid_map.is_obstacle(node.x + dx, node.y) or
-                    self.grid_map.is_obstacle(node.x, node.y + dy)):
-                    continue
-            neighbors.append(self.get_node(nx, ny))
-
-        return neighbors
+        """Bir düğümün sağlayıcıya göre geçilebilir komşuları"""
+        if self.array_mode:
+            return self._neighbor_ids(node)
+        width = self.width
+        get_node = self.get_node
+        return [get_node(neighbor % width, neighbor // width)
+                for neighbor in self.provider.neighbor_ids(node.y * width + node.x)]
     
     def get_cost(self, node1: Node, node2: Node) -> float:
         """İki düğüm arasındaki maliyet"""
-        if self.grid_map.is_obstacle(node2.x, node2.y):
-            return float('inf')
-        
-        # Diagonal ve düz hareket maliyetleri
-        dx = abs(node1.x - node2.x)
-        dy = abs(node1.y - node2.y)
-        
-        if dx == 1 and dy == 1:  # Diagonal
-            return math.sqrt(2) + self.grid_map.get_terrain_cost(node2.x, node2.y)
-        else:  # Düz hareket
-            return 1.0 + self.grid_map.get_terrain_cost(node2.x, node2.y)
+        if self.array_mode:
+            return self._cost_ids(node1, node2)
+        width = self.width
+        return self.provider.cost_ids(node1.y * width + node1.x, node2.y * width + node2.x)
     
     def calculate_key(self, node: Node) -> Tuple[float, float]:
         """Düğümün priority key'ini hesapla"""
-        k1 = min(node.g, node.rhs) + self.heuristic(node, self.start)
+        if self.array_mode:
+            return self._array_key(node)
+        if self.anytime:
+            return self._anytime_key(node)
+        k1 = min(node.g, node.rhs) + self.heuristic(node, self.start) + self.km
         k2 = min(node.g, node.rhs)
         return (k1, k2)
     
+    def _advance_start(self):
+        """Başlangıç hareket ettiyse km'yi last_start'tan start'a maliyetin
+        alt sınırı kadar artır.
+        
+        Kuyruktaki anahtarlar böylece geçerli kalır; düğümleri tek tek
+        gezip heuristiği yeniden hesaplamak gerekmez. ``heuristic(s, start)``
+        start'tan s'ye maliyetin sınırı olduğundan terim
+        ``heuristic(start, last_start)``'tır; asimetrik (landmark) sınırlarda
+        ters sıra km'yi küçük bırakıp eski anahtarları gerçek değerlerinin
+        üstünde tutabilir.
+        """
+        if self.last_start is not None and self.last_start != self.start:
+            self.km += self.heuristic(self.start, self.last_start)
+            self.last_start = self.start
+    
     def initialize_search(self, start: Tuple[int, int], goal: Tuple[int, int]):
         """Arama sürecini başlat"""
+        self.search_status = SEARCH_COMPLETE
+        self._reset_anytime()
+        self.goal_offsets = {}
+        if self.array_mode:
+            self._array_initialize_search(start, goal)
+            return
+        
+        # Tüm düğümleri sıfırla: nesil sayacı artınca eski değerler
+        # get_node ile ilk erişimde sonsuza çekilir (O(1) sıfırlama)
+        self.generation += 1
+        if self.lazy_mode:
+            # Önceki aramanın düğümlerini bırak
+            self.nodes.clear()
         self.start = self.get_node(start[0], start[1])
         self.goal = self.get_node(goal[0], goal[1])
         self.last_start = self.start
-        
-        # Tüm düğümleri sıfırla
-        for node in self.nodes.values():
-            node.g = float('inf')
-            node.rhs = float('inf')
+        self.km = 0.0
         
         # Priority queue'yu temizle
         self.open_list.clear()
@@ -128,34 +268,88 @@ class DStarLite:
     
     def update_vertex(self, node: Node):
         """Düğümü güncelle"""
+        if self.array_mode:
+            self._array_update_vertex(node)
+            return
+        
         if node != self.goal:
-            min_rhs = float('inf')
+            min_rhs = self.goal_offsets.get(node, INF) if self.goal_offsets else INF
             for neighbor in self.get_neighbors(node):
                 cost = self.get_cost(node, neighbor) + neighbor.g
                 if cost < min_rhs:
                     min_rhs = cost
             node.rhs = min_rhs
         
-        # Priority queue'dan kaldır
-        if self.open_list.contains(node):
-            self.open_list.remove(node)
-        
-        # Tutarsızsa tekrar ekle
+        self._queue_vertex(node)
+    
+    def _queue_vertex(self, node: Node):
+        """rhs'e dokunmadan düğümün kuyruktaki yerini düzenle"""
+        if self.array_mode:
+            self._array_queue_vertex(node)
+            return
+        if self.anytime:
+            self._anytime_queue_vertex(node)
+            return
+        # Tutarsızsa kuyruğa ekle (varsa girdisi güncellenir), değilse kaldır
         if node.g != node.rhs:
             node.h = self.heuristic(node, self.start)
             self.open_list.insert(node, self.calculate_key(node))
+        elif self.open_list.contains(node):
+            self.open_list.remove(node)
+    
+    def compute_shortest_path(self, max_expansions: Optional[int] = None,
+                              deadline: Optional[float] = None) -> str:
+        """En kısa yolu hesapla.
+        
+        ``max_expansions`` ya da ``deadline`` (``time.perf_counter`` zamanı)
+        verilirse bütçe bitince durur ve ``'partial'`` döndürür; aksi halde
+        ``'complete'``. Durum ``search_status`` alanında da tutulur.
+        """
+        if self.anytime and self.search_status == SEARCH_COMPLETE:
+            # Yeni AD* iterasyonu (yarım kalan arama sürdürülürken değil)
+            self._begin_anytime_iteration()
+        if self.optimized:
+            complete = self._optimized_compute_shortest_path(max_expansions, deadline)
+        elif self.array_mode:
+            complete = self._array_compute_shortest_path(max_expansions, deadline)
+        else:
+            complete = self._compute_shortest_path(max_expansions, deadline)
+        self.search_status = SEARCH_COMPLETE if complete else SEARCH_PARTIAL
+        return self.search_status
+    
+    def is_start_consistent(self) -> bool:
+        """Başlangıcın g değeri kesinleşti mi (bekleyen iş yolu etkilemez mi)"""
+        if self.array_mode:
+            return self._array_start_consistent()
+        return (self.open_list.empty() or
+                (not self.open_list.top_key() < self.calculate_key(self.start) and
+                 self.start.rhs == self.start.g))
     
-    def compute_shortest_path(self):
-        """En kısa yolu hesapla"""
+    def _compute_shortest_path(self, max_expansions: Optional[int],
+                               deadline: Optional[float]) -> bool:
+        """Nesne modu arama döngüsü; bütçe bitmeden biterse True"""
+        limited = max_expansions is not None or deadline is not None
+        expanded = 0
         while (not self.open_list.empty() and 
                (self.open_list.top_key() < self.calculate_key(self.start) or
                 self.start.rhs != self.start.g)):
+            if limited and budget_exhausted(expanded, max_expansions, deadline):
+                return False
             
+            k_old = self.open_list.top_key()
             current = self.open_list.pop()
+            k_new = self.calculate_key(current)
+            if k_old < k_new:
+                # Başlangıç hareket ettiği için anahtar eskimiş: güncel anahtarla geri koy
+                self.open_list.insert(current, k_new)
+                continue
             self.stats['nodes_expanded'] += 1
+            expanded += 1
             
             if current.g > current.rhs:
                 current.g = current.rhs
+                if self._closed is not None:
+                    self._closed.add(current)
                 for neighbor in self.get_neighbors(current):
                     if neighbor != self.goal:
                         neighbor.rhs = min(neighbor.rhs, 
@@ -166,43 +360,123 @@ class DStarLite:
                 neighbors = self.get_neighbors(current) + [current]
                 for neighbor in neighbors:
                     self.update_vertex(neighbor)
+        return True
     
     def extract_path(self) -> List[Tuple[int, int]]:
-        """Hesaplanan yolu çıkar"""
+        """Hesaplanan yolu çıkar.
+        
+        Arama bütçe yüzünden yarım kaldıysa yol geçici sayılır ve
+        ``path_tentative`` True olur. Yalnızca g'si azalan komşulara gidilir;
+        iniş hedefe varmadan biterse ``path_status`` ``'stalled'`` olur ve yol
+        kesildiği hücrede biter (yol yoksa ``'unreachable'``).
+        """
+        self.path_tentative = not self.is_start_consistent()
+        self.reached_goal = None
+        if self.array_mode:
+            return self._array_extract_path()
+        
         if self.start.g == float('inf'):
+            self.path_status = PATH_UNREACHABLE
             return []  # Yol bulunamadı
         
+        offsets = self.goal_offsets
         path = []
         current = self.start
+        self.path_status = PATH_COMPLETE
         
         while current != self.goal:
             path.append((current.x, current.y))
             
-            # En iyi komşuyu bul
+            # En iyi komşuyu bul; yalnızca g'si azalan komşular (kısmi arama ya
+            # da raporlanmamış maliyet kayması varken de döngü oluşmaz)
             best_neighbor = None
             best_cost = float('inf')
             
             for neighbor in self.get_neighbors(current):
                 cost = self.get_cost(current, neighbor) + neighbor.g
-                if cost < best_cost:
+                if neighbor.g < current.g and cost < best_cost:
                     best_cost = cost
                     best_neighbor = neighbor
             
+            if offsets and offsets.get(current, INF) <= best_cost:
+                # Çoklu hedef: burada durmak devam etmekten ucuz
+                self.reached_goal = (current.x, current.y)
+                return path
+            
             if best_neighbor is None:
-                break  # Takılı kaldı
+                self.path_status = PATH_STALLED  # Takılı kaldı
+                return path
                 
             current = best_neighbor
         
         path.append((self.goal.x, self.goal.y))
+        self.reached_goal = path[-1]
         return path
     
-    def plan_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
-        """Yol planla"""
+    def cost_field(self, with_rhs: bool = False):
+        """Hedefe kalan maliyet alanı: (height, width) float64 g dizisi.
+        
+        ``with_rhs=True`` ise (g, rhs) döner. Dizi modunda eski nesilden kalan
+        hücreler bir kez vektörel olarak sıfırlanır ve depo dizilerinin kopyasız
+        görünümleri döner; görünümler sonraki güncellemeleri de yansıtır
+        (yeni bir aramadan sonra eski hücreler ancak tekrar çağrıyla sıfırlanır).
+        Nesne modlarında değerler düğümlerden yeni dizilere kopyalanır.
+        Ulaşılmamış hücreler inf'tir.
+        """
+        shape = (self.height, self.width)
+        if self.array_mode:
+            self.nodes.refresh_all()
+            g = self.nodes.g.reshape(shape)
+            rhs = self.nodes.rhs.reshape(shape)
+        else:
+            g = np.full(shape, np.inf)
+            rhs = np.full(shape, np.inf)
+            for node in self.nodes.values():
+                if node.generation == self.generation:
+                    g[node.y, node.x] = node.g
+                    rhs[node.y, node.x] = node.rhs
+        return (g, rhs) if with_rhs else g
+    
+    def _edge_cost_table(self) -> np.ndarray:
+        """(height, width, 8) kenar maliyetleri (`GridAdjacency.cost_table` düzeni)"""
+        if self.adjacency is not None:
+            self.adjacency.sync()
+            return self.adjacency.cost_table
+        return self.provider.edge_cost_table()
+    
+    def extract_path_from_field(self) -> List[Tuple[int, int]]:
+        """Yolu `cost_field` üzerinde vektörel gradyan inişiyle çıkar.
+        
+        Tüm hücrelerin en iyi ardılı NumPy ile tek seferde bulunur; köşe kesme
+        kuralı kenar maliyeti tablosundan gelir. Çoklu hedef modunda ucuz
+        hedefte durulur.
+        """
+        width = self.width
+        if self.array_mode:
+            start = self.nodes.coords(self.start)
+            offsets = self.goal_offsets
+        else:
+            start = (self.start.x, self.start.y)
+            offsets = {node.y * width + node.x: offset
+                       for node, offset in self.goal_offsets.items()}
+        return descend_cost_field(self.cost_field(), start, self._edge_cost_table(), offsets)
+    
+    def plan_path(self, start: Tuple[int, int], goal: Tuple[int, int],
+                  max_expansions: Optional[int] = None,
+                  deadline: Optional[float] = None,
+                  warm_start: bool = False) -> List[Tuple[int, int]]:
+        """Yol planla (bütçe parametreleri `compute_shortest_path` ile aynı).
+        
+        ``warm_start=True`` ise arama `warm_start_search` ile başlatılır.
+        """
         import time
         start_time = time.time()
         
-        self.initialize_search(start, goal)
-        self.compute_shortest_path()
+        if warm_start:
+            self.warm_start_search(start, goal)
+        else:
+            self.initialize_search(start, goal)
+        self.compute_shortest_path(max_expansions, deadline)
         path = self.extract_path()
         
         planning_time = time.time() - start_time
@@ -210,34 +484,209 @@ class DStarLite:
         
         return path
     
-    def update_obstacles(self, changed_cells: List[Tuple[int, int, bool]]):
-        """Engelleri güncelle ve yeniden planla"""
+    def warm_start_search(self, start: Tuple[int, int], goal: Tuple[int, int]):
+        """Aramayı başlat ve tüm haritanın hedefe kalan maliyetini toplu yükle.
+        
+        Maliyetler `_edge_cost_table` üzerinde tek bir SciPy Dijkstra ile
+        hesaplanır ve her hücreye g = rhs olarak yazılır; açık liste boş
+        kalır. Dijkstra değerleri ``min c(s, s') + g(s')`` eşitliğini tam
+        sağladığından durum D* Lite açısından tutarlıdır.
+        """
+        self.initialize_search(start, goal)
+        goal_id = goal[1] * self.width + goal[0]
+        field = dijkstra_cost_field(self._edge_cost_table(), goal_id)
+        self.open_list.clear()
+        if self.array_mode:
+            store = self.nodes
+            store.g[:] = field.ravel()
+            store.rhs[:] = store.g
+            store.stamp[:] = store.generation
+            return
+        ys, xs = np.nonzero(np.isfinite(field))
+        for x, y, value in zip(xs.tolist(), ys.tolist(), field[ys, xs].tolist()):
+            node = self.get_node(x, y)
+            node.g = value
+            node.rhs = value
+    
+    def initialize_multi_goal_search(self, start: Tuple[int, int], goals):
+        """Birden çok hedefle arama başlat.
+        
+        ``goals`` (x, y) listesi ya da {(x, y): başlangıç maliyeti} sözlüğüdür.
+        Her hedef rhs = maliyet ile tohumlanır; rhs(s) = min(maliyet(s),
+        min c(s, s') + g(s')) olduğundan g değerleri en ucuz hedefe kalan
+        maliyet olur.
+        """
+        goals = dict(goals) if isinstance(goals, dict) else dict.fromkeys(goals, 0.0)
+        if not goals:
+            raise ValueError("En az bir hedef gerekli")
+        if min(goals.values()) < 0:
+            raise ValueError("Hedef maliyetleri negatif olamaz")
+        
+        # Tek hedefli başlatma sonrası hedef tohumunu kaldır
+        self.initialize_search(start, next(iter(goals)))
+        self.open_list.clear()
+        if self.array_mode:
+            self.nodes.rhs_view[self.goal] = INF
+            self.goal = -1  # Hiçbir hücreyle eşleşmeyen nöbetçi
+        else:
+            self.goal.rhs = INF
+            self.goal = Node(-1, -1)
+        
+        for (x, y), offset in goals.items():
+            node = self.get_node(x, y)
+            if self.array_mode:
+                self.nodes.touch(node)
+                self.nodes.rhs_view[node] = offset
+            else:
+                node.rhs = offset
+            self.goal_offsets[node] = float(offset)
+        for node in self.goal_offsets:
+            self._queue_vertex(node)
+    
+    def plan_path_multi_goal(self, start: Tuple[int, int], goals,
+                             max_expansions: Optional[int] = None,
+                             deadline: Optional[float] = None):
+        """Tek aramada en ucuz hedefi bul; (hedef, yol) döndür.
+        
+        Yol yoksa hedef None olur. Sonraki `update_obstacles`, `update_costs`
+        ve `replan_path` çağrıları aynı hedef kümesiyle artımlı çalışır.
+        """
+        self.initialize_multi_goal_search(start, goals)
+        self.compute_shortest_path(max_expansions, deadline)
+        path = self.extract_path()
+        return (self.reached_goal if path else None), path
+    
+    def path_from(self, start: Tuple[int, int], goal: Optional[Tuple[int, int]] = None,
+                  max_expansions: Optional[int] = None,
+                  deadline: Optional[float] = None) -> List[Tuple[int, int]]:
+        """Hedefin arama ağacını koruyarak ``start``'tan yol çıkar.
+        
+        Arama geriye doğru (hedeften) yapıldığından g değerleri hedefe kalan
+        maliyettir. İlk çağrıda ya da ``goal`` değişince arama başlatılır;
+        sonraki çağrılar yalnızca başlangıcı taşır (km ile) ve ağacı yeni
+        başlangıç için gerektiği kadar genişletir. Böylece aynı hedefe giden
+        N sorgu bir arama ve N ucuz yol çıkarımıyla yanıtlanır.
+        """
+        if goal is not None and (self.goal is None or self.get_node(goal[0], goal[1]) != self.goal):
+            self.initialize_search(start, goal)
+        elif self.goal is None:
+            raise ValueError("İlk sorguda hedef verilmeli")
+        return self.replan_path(start, max_expansions, deadline)
+    
+    def update_obstacles(self, changed_cells: List[Tuple[int, int, bool]],
+                         max_expansions: Optional[int] = None,
+                         deadline: Optional[float] = None):
+        """Engelleri güncelle ve yeniden planla.
+        
+        ``changed_cells`` (x, y, is_obstacle) üçlüleridir; harita önceden
+        güncellenmiş olmalıdır. Engel olmayan maliyet değişiklikleri için
+        `update_costs` kullanılır. Bütçe parametreleri yeniden planlamaya
+        aktarılır.
+        """
         self.stats['replanning_count'] += 1
         
-        # Değişen hücreler için düğümleri güncelle
-        for x, y, is_obstacle in changed_cells:
+        # Başlangıç değiştiyse anahtar düzeltmesini güncelle (km)
+        self._advance_start()
+        
+        if self.optimized:
+            # Değişen kenarlar komşuluk tablosundan eski/yeni maliyetleriyle okunur
+            self._optimized_update_edges([(x, y) for x, y, _ in changed_cells])
+        elif self.array_mode:
+            self._array_update_cells([(x, y) for x, y, _ in changed_cells])
+        else:
+            # Etkilenen düğümlerin birleşimi: her düğüm tek kez güncellenir
+            for node in self._affected_vertices(changed_cells):
+                self.update_vertex(node)
+        
+        self.compute_shortest_path(max_expansions, deadline)
+    
+    def update_costs(self, cell_ids, old_costs, new_costs,
+                     max_expansions: Optional[int] = None,
+                     deadline: Optional[float] = None):
+        """Hücre maliyeti değişikliklerini uygula ve yeniden planla.
+        
+        ``cell_ids`` ``y * width + x`` kimlikleri, ``old_costs`` / ``new_costs``
+        hücreye giriş maliyetleridir (GridMap'te arazi maliyeti). Diziler
+        NumPy dizisi veya liste olabilir; harita önceden güncellenmiş olmalıdır.
+        Azalan maliyetlerde öncüllerin rhs değeri taranmadan küçültülür;
+        artan maliyetlerde yalnızca değişen kenar argmin ise tarama yapılır.
+        Bütçe parametreleri yeniden planlamaya aktarılır. Değişen hücre
+        sayısını döndürür.
+        """
+        cell_ids = np.asarray(cell_ids, dtype=np.int64).ravel()
+        old_costs = np.asarray(old_costs, dtype=np.float64).ravel()
+        new_costs = np.asarray(new_costs, dtype=np.float64).ravel()
+        if not (len(cell_ids) == len(old_costs) == len(new_costs)):
+            raise ValueError("Kimlik ve maliyet dizileri aynı uzunlukta olmalı")
+        if len(cell_ids) and not (0 <= cell_ids.min() and cell_ids.max() < self.width * self.height):
+            raise ValueError("Harita dışında hücre kimliği")
+        
+        changed = old_costs != new_costs
+        cell_ids = cell_ids[changed].tolist()
+        old_costs = old_costs[changed].tolist()
+        new_costs = new_costs[changed].tolist()
+        
+        self.stats['replanning_count'] += 1
+        self._advance_start()
+        
+        if self.optimized:
+            # Kenar farkları komşuluk tablosundan doğrudan okunur
+            self._optimized_update_edges()
+        elif self.array_mode:
+            self._array_update_costs(cell_ids, old_costs, new_costs)
+        else:
+            self._update_costs(cell_ids, old_costs, new_costs)
+        
+        self.compute_shortest_path(max_expansions, deadline)
+        return len(cell_ids)
+    
+    def _update_costs(self, cell_ids: List[int], old_costs: List[float], new_costs: List[float]):
+        """`update_costs` için nesne modu adımları"""
+        width = self.width
+        for node_id, old_cost, new_cost in zip(cell_ids, old_costs, new_costs):
+            y, x = divmod(node_id, width)
+            node = self.get_node(x, y)
+            for neighbor in self.get_neighbors(node):
+                if neighbor != self.goal:
+                    if new_cost < old_cost:
+                        cost = self.get_cost(neighbor, node) + node.g
+                        if cost < neighbor.rhs:
+                            neighbor.rhs = cost
+                    else:
+                        old_edge = self._edge_cost_for(neighbor.y * width + neighbor.x,
+                                                       node_id, old_cost)
+                        if neighbor.rhs >= old_edge + node.g - COST_EPSILON:
+                            # Değişen kenar argmin'di: tüm ardılları yeniden tara
+                            self.update_vertex(neighbor)
+                            continue
+                self._queue_vertex(neighbor)
+    
+    def _affected_vertices(self, changed_cells: List[Tuple[int, int, bool]]) -> List[Node]:
+        """Değişen hücreler ve komşuları (tekrarsız, ilk görülme sırasıyla).
+        
+        Geçilebilir komşusu olmayan hücre (ör. kapatılan bölgenin içi) hiçbir
+        kenarla okunmadığından atlanır; böylece büyük kapanmalarda iş yalnızca
+        bölgenin sınırıyla orantılı olur.
+        """
+        affected = {}
+        for x, y, _ in changed_cells:
             node = self.get_node(x, y)
-            
-            # Bu düğümün komşularını güncelle
             neighbors = self.get_neighbors(node)
             for neighbor in neighbors:
-                self.update_vertex(neighbor)
-            
-            # Kendi düğümünü de güncelle
-            self.update_vertex(node)
-        
-        # Başlangıç değiştiyse heuristiği güncelle
-        if self.last_start != self.start:
-            for node in self.nodes.values():
-                node.h = self.heuristic(node, self.start)
-            self.last_start = self.start
-        
-        self.compute_shortest_path()
+                affected[neighbor] = None
+            if neighbors or node == self.start:
+                affected[node] = None
+        return list(affected)
     
-    def replan_path(self, new_start: Optional[Tuple[int, int]] = None) -> List[Tuple[int, int]]:
-        """Yeniden planla"""
+    def replan_path(self, new_start: Optional[Tuple[int, int]] = None,
+                    max_expansions: Optional[int] = None,
+                    deadline: Optional[float] = None) -> List[Tuple[int, int]]:
+        """Yeniden planla; yarım kalan arama varsa kaldığı yerden sürer"""
         if new_start:
             self.start = self.get_node(new_start[0], new_start[1])
+            if self.array_mode:
+                self.nodes.touch(self.start)
+            self._advance_start()
         
-        self.compute_shortest_path()
+        self.compute_shortest_path(max_expansions, deadline)
         return self.extract_path()
\ No newline at end of file
@@ -0,0 +1,489 @@
+import math
+import time
+import numpy as np
+from typing import Dict, List, Optional, Set, Tuple
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+from src.utils.data_structures import PriorityQueue
+from .adjacency import edge_cost_window
+from .array_search import DIRECTIONS, INF
+
+Cell = Tuple[int, int]
+
+# HPA*: bu uzunluktan kısa geçitlere ortadan bir, uzunlara iki uçtan giriş konur
+LONG_ENTRANCE = 6
+
+
+class Cluster:
+    """Bir kümenin yerel hücre grafiği (küme dışına çıkan kenarlar kesik)"""
+
+    def __init__(self, grid_map, x1: int, y1: int, x2: int, y2: int):
+        self.x1, self.y1 = x1, y1
+        self.cols = x2 - x1 + 1
+        self.rows = y2 - y1 + 1
+        self.nodes: Set[Cell] = set()  # Giriş hücreleri
+
+        costs = edge_cost_window(grid_map, x1, y1, x2, y2)
+        for k, (dx, dy) in enumerate(DIRECTIONS):
+            if dx < 0:
+                costs[:, 0, k] = np.inf
+            elif dx > 0:
+                costs[:, -1, k] = np.inf
+            if dy < 0:
+                costs[0, :, k] = np.inf
+            elif dy > 0:
+                costs[-1, :, k] = np.inf
+
+        finite = np.isfinite(costs)
+        ys, xs, slots = np.nonzero(finite)
+        offsets = np.array([dy * self.cols + dx for dx, dy in DIRECTIONS], dtype=np.int64)
+        sources = ys * self.cols + xs
+        size = self.rows * self.cols
+        self.graph = csr_matrix((costs[finite], (sources, sources + offsets[slots])),
+                                shape=(size, size))
+
+    def local(self, cell: Cell) -> int:
+        return (cell[1] - self.y1) * self.cols + (cell[0] - self.x1)
+
+    def cell(self, local: int) -> Cell:
+        y, x = divmod(int(local), self.cols)
+        return (x + self.x1, y + self.y1)
+
+    def distances(self, sources: List[Cell], reverse: bool = False) -> np.ndarray:
+        """Kaynaklardan (``reverse`` ise kaynaklara) küme içi en kısa maliyetler"""
+        graph = self.graph.T if reverse else self.graph
+        return dijkstra(graph, directed=True, indices=[self.local(c) for c in sources])
+
+    def path(self, source: Cell, target: Cell) -> List[Cell]:
+        """Küme içinde ``source``'tan ``target``'a yol (``source`` hariç)"""
+        _, predecessors = dijkstra(self.graph, directed=True, indices=self.local(source),
+                                   return_predecessors=True)
+        path = []
+        current = self.local(target)
+        end = self.local(source)
+        while current != end:
+            path.append(self.cell(current))
+            current = predecessors[current]
+            if current < 0:
+                return []
+        path.reverse()
+        return path
+
+
+class HierarchicalDStarLite:
+    """Küme tabanlı hiyerarşik D* Lite (HPA* tarzı).
+
+    Harita ``cluster_size`` kenarlı kümelere bölünür. Komşu kümeler arasındaki
+    her serbest geçitte giriş hücre çiftleri seçilir; kümeler arası kenar tek
+    adımdır, küme içi kenarlar girişler arasındaki en kısa maliyetlerdir
+    (SciPy Dijkstra, tüm girişler tek çağrıda). D* Lite bu soyut grafikte
+    hedeften geriye çalışır; seçilen yol yalnızca geçtiği kümelerde hücre
+    düzeyine açılır. Kenar kuralları `DStarLite` ile aynıdır, ancak yol soyut
+    grafikte en kısadır, hücre grafiğinde optimuma yakındır.
+
+    Kümeler ilk erişimde kurulur; bellek ve ön hesap keşfedilen bölgeyle
+    ölçeklenir. Harita değişiklikleri `GridMap` dinleyicisiyle toplanır ve
+    sonraki planlamada yalnızca etkilenen kümelerin giriş ve iç kenarları
+    yeniden hesaplanır; ardından D* Lite değişen kenarlardan artımlı onarır.
+    """
+
+    def __init__(self, grid_map, cluster_size: int = 16, heuristic_weight: float = 1.0):
+        if cluster_size < 2:
+            raise ValueError("Küme boyutu en az 2 olmalı")
+        self.grid_map = grid_map
+        self.width = grid_map.width
+        self.height = grid_map.height
+        self.cluster_size = cluster_size
+        self.heuristic_weight = heuristic_weight
+        self.clusters_x = (self.width + cluster_size - 1) // cluster_size
+        self.clusters_y = (self.height + cluster_size - 1) // cluster_size
+
+        self.clusters: Dict[Tuple[int, int], Cluster] = {}
+        self._borders: Dict[Tuple[str, int, int], List[Tuple[Cell, Cell]]] = {}
+        self._out: Dict[Cell, Dict[Cell, float]] = {}
+        self._in: Dict[Cell, Dict[Cell, float]] = {}
+        # Başlangıç/hedefi kümesinin girişlerine bağlayan geçici kenarlar
+        self._temp_out: Dict[Cell, Dict[Cell, float]] = {}
+        self._temp_in: Dict[Cell, Dict[Cell, float]] = {}
+        self._dirty: List[Tuple[int, int, int, int]] = []
+        grid_map.add_change_listener(self._on_grid_change)
+
+        self.g: Dict[Cell, float] = {}
+        self.rhs: Dict[Cell, float] = {}
+        self.open_list = PriorityQueue()
+        self.start = None
+        self.goal = None
+        self.last_start = None
+        self.km = 0.0
+        self.abstract_path: List[Cell] = []
+
+        self.stats = {
+            'nodes_expanded': 0,
+            'replanning_count': 0,
+            'clusters_built': 0,
+            'clusters_rebuilt': 0,
+            'total_planning_time': 0.0
+        }
+
+    # --- Soyut grafik ---
+
+    def cluster_of(self, cell: Cell) -> Tuple[int, int]:
+        return (cell[0] // self.cluster_size, cell[1] // self.cluster_size)
+
+    def _cluster_borders(self, cluster: Tuple[int, int]) -> List[Tuple[str, int, int]]:
+        cx, cy = cluster
+        keys = []
+        if cx > 0:
+            keys.append(('v', cx - 1, cy))
+        if cx + 1 < self.clusters_x:
+            keys.append(('v', cx, cy))
+        if cy > 0:
+            keys.append(('h', cx, cy - 1))
+        if cy + 1 < self.clusters_y:
+            keys.append(('h', cx, cy))
+        return keys
+
+    def _ensure_border(self, key: Tuple[str, int, int]) -> List[Tuple[Cell, Cell]]:
+        """(cx, cy) kümesi ile sağ ('v') ya da alt ('h') komşusu arasındaki girişler"""
+        pairs = self._borders.get(key)
+        if pairs is not None:
+            return pairs
+        kind, cx, cy = key
+        size = self.cluster_size
+        grid = self.grid_map.grid
+        obstacle = self.grid_map.OBSTACLE
+        if kind == 'v':
+            x = (cx + 1) * size - 1
+            lo, hi = cy * size, min(self.height, (cy + 1) * size)
+            band = grid[lo:hi, x:x + 2].T
+        else:
+            y = (cy + 1) * size - 1
+            lo, hi = cx * size, min(self.width, (cx + 1) * size)
+            band = grid[y:y + 2, lo:hi]
+        open_cells = (band != obstacle).all(axis=0)
+
+        # Ardışık serbest geçitler [run_start, run_end)
+        padded = np.concatenate(([False], open_cells, [False])).astype(np.int8)
+        edges = np.flatnonzero(np.diff(padded))
+        pairs = []
+        for run_start, run_end in zip(edges[::2].tolist(), edges[1::2].tolist()):
+            if run_end - run_start >= LONG_ENTRANCE:
+                offsets = (run_start, run_end - 1)
+            else:
+                offsets = ((run_start + run_end - 1) // 2,)
+            for offset in offsets:
+                if kind == 'v':
+                    pairs.append(((x, lo + offset), (x + 1, lo + offset)))
+                else:
+                    pairs.append(((lo + offset, y), (lo + offset, y + 1)))
+
+        terrain = self.grid_map.terrain_costs
+        for a, b in pairs:
+            self._add_edge(self._out, self._in, a, b, 1.0 + float(terrain[b[1], b[0]]))
+            self._add_edge(self._out, self._in, b, a, 1.0 + float(terrain[a[1], a[0]]))
+        self._borders[key] = pairs
+        return pairs
+
+    def _drop_border(self, key: Tuple[str, int, int]) -> List[Tuple[Cell, Cell]]:
+        pairs = self._borders.pop(key)
+        for a, b in pairs:
+            self._remove_edge(self._out, self._in, a, b)
+            self._remove_edge(self._out, self._in, b, a)
+        return pairs
+
+    def _border_overlaps(self, key: Tuple[str, int, int], rect: Tuple[int, int, int, int]) -> bool:
+        """Değişen dikdörtgen sınırın iki hücre şeridine değiyor mu"""
+        kind, cx, cy = key
+        x1, y1, x2, y2 = rect
+        size = self.cluster_size
+        if kind == 'v':
+            line = (cx + 1) * size - 1
+            return x1 <= line + 1 and x2 >= line and y1 < (cy + 1) * size and y2 >= cy * size
+        line = (cy + 1) * size - 1
+        return y1 <= line + 1 and y2 >= line and x1 < (cx + 1) * size and x2 >= cx * size
+
+    def _ensure_cluster(self, cluster: Tuple[int, int]) -> Cluster:
+        """Kümeyi (girişleri ve iç kenarlarıyla) gerekirse kur"""
+        built = self.clusters.get(cluster)
+        if built is not None:
+            return built
+        cx, cy = cluster
+        size = self.cluster_size
+        built = Cluster(self.grid_map, cx * size, cy * size,
+                        min(self.width, (cx + 1) * size) - 1,
+                        min(self.height, (cy + 1) * size) - 1)
+        for key in self._cluster_borders(cluster):
+            for pair in self._ensure_border(key):
+                built.nodes.update(c for c in pair if self.cluster_of(c) == cluster)
+
+        nodes = sorted(built.nodes)
+        if nodes:
+            distances = built.distances(nodes)[:, [built.local(c) for c in nodes]]
+            np.fill_diagonal(distances, np.inf)
+            rows, cols = np.nonzero(np.isfinite(distances))
+            for i, j, cost in zip(rows.tolist(), cols.tolist(), distances[rows, cols].tolist()):
+                self._add_edge(self._out, self._in, nodes[i], nodes[j], cost)
+        self.clusters[cluster] = built
+        self.stats['clusters_built'] += 1
+        return built
+
+    def _drop_cluster(self, cluster: Tuple[int, int]) -> Set[Cell]:
+        """Kümenin iç kenarlarını sil; eski giriş hücrelerini döndür"""
+        built = self.clusters.pop(cluster)
+        for source in built.nodes:
+            for target in [t for t in self._out.get(source, ()) if t in built.nodes]:
+                self._remove_edge(self._out, self._in, source, target)
+        return built.nodes
+
+    @staticmethod
+    def _add_edge(out_edges, in_edges, source: Cell, target: Cell, cost: float):
+        out_edges.setdefault(source, {})[target] = cost
+        in_edges.setdefault(target, {})[source] = cost
+
+    @staticmethod
+    def _remove_edge(out_edges, in_edges, source: Cell, target: Cell):
+        targets = out_edges.get(source)
+        if targets is not None and targets.pop(target, None) is not None and not targets:
+            del out_edges[source]
+        sources = in_edges.get(target)
+        if sources is not None and sources.pop(source, None) is not None and not sources:
+            del in_edges[target]
+
+    def successors(self, cell: Cell):
+        """Soyut grafikte çıkan kenarlar: (komşu, maliyet) çiftleri"""
+        return self._merged_edges(cell, self._out, self._temp_out)
+
+    def predecessors(self, cell: Cell):
+        """Soyut grafikte gelen kenarlar: (öncül, maliyet) çiftleri"""
+        return self._merged_edges(cell, self._in, self._temp_in)
+
+    def _merged_edges(self, cell: Cell, edges, temp_edges):
+        if self.cluster_of(cell) not in self.clusters:
+            self._ensure_cluster(self.cluster_of(cell))
+        temp = temp_edges.get(cell)
+        if not temp:
+            return edges.get(cell, {}).items()
+        merged = dict(temp)
+        for other, cost in edges.get(cell, {}).items():
+            if cost < merged.get(other, INF):
+                merged[other] = cost
+        return merged.items()
+
+    def is_vertex(self, cell: Cell) -> bool:
+        if cell == self.start or cell == self.goal:
+            return True
+        cluster = self.clusters.get(self.cluster_of(cell))
+        return cluster is not None and cell in cluster.nodes
+
+    def _connect_endpoints(self) -> Set[Cell]:
+        """Başlangıç ve hedefi kümelerinin girişlerine bağla; kenarı değişen düğümler"""
+        changed = set(self._temp_out)
+        self._temp_out = {}
+        self._temp_in = {}
+
+        goal_cluster = self._ensure_cluster(self.cluster_of(self.goal))
+        entrances = sorted(goal_cluster.nodes - {self.goal})
+        if entrances:
+            to_goal = goal_cluster.distances([self.goal], reverse=True)[0]
+            for entrance in entrances:
+                cost = to_goal[goal_cluster.local(entrance)]
+                if np.isfinite(cost):
+                    self._add_edge(self._temp_out, self._temp_in, entrance, self.goal, float(cost))
+
+        start_cluster = self._ensure_cluster(self.cluster_of(self.start))
+        targets = sorted(start_cluster.nodes - {self.start})
+        if self.cluster_of(self.goal) == self.cluster_of(self.start) and self.goal != self.start:
+            targets.append(self.goal)
+        if targets:
+            from_start = start_cluster.distances([self.start])[0]
+            for target in targets:
+                cost = from_start[start_cluster.local(target)]
+                if np.isfinite(cost):
+                    self._add_edge(self._temp_out, self._temp_in, self.start, target, float(cost))
+
+        changed.update(self._temp_out)
+        changed.add(self.start)
+        return changed
+
+    def _on_grid_change(self, x1: int, y1: int, x2: int, y2: int):
+        self._dirty.append((x1, y1, x2, y2))
+
+    def _apply_changes(self) -> Set[Cell]:
+        """Bekleyen harita değişikliklerinden etkilenen kümeleri yeniden kur.
+
+        Çıkan kenarları değişmiş olabilecek soyut düğümleri döndürür.
+        """
+        size = self.cluster_size
+        rects = self._dirty
+        self._dirty = []
+        # Küme içi kenarlar yalnızca kümenin kendi hücrelerine bağlıdır
+        touched = set()
+        for x1, y1, x2, y2 in rects:
+            touched.update((cx, cy) for cx in range(x1 // size, x2 // size + 1)
+                           for cy in range(y1 // size, y2 // size + 1))
+
+        affected = set()
+        rebuild = {c for c in touched if c in self.clusters}
+        borders = {key for c in touched for key in self._cluster_borders(c) if key in self._borders}
+        for key in borders:
+            if not any(self._border_overlaps(key, rect) for rect in rects):
+                continue
+            old_pairs = self._drop_border(key)
+            new_pairs = self._ensure_border(key)
+            for pair in old_pairs + new_pairs:
+                affected.update(pair)
+            if old_pairs != new_pairs:
+                # Girişler değişti: iki yandaki kümelerin iç kenarları da
+                kind, cx, cy = key
+                for side in ((cx, cy), (cx + 1, cy) if kind == 'v' else (cx, cy + 1)):
+                    if side in self.clusters:
+                        rebuild.add(side)
+
+        for cluster in rebuild:
+            affected.update(self._drop_cluster(cluster))
+        for cluster in rebuild:
+            affected.update(self._ensure_cluster(cluster).nodes)
+        self.stats['clusters_rebuilt'] += len(rebuild)
+
+        if self.start is not None and (self.cluster_of(self.start) in rebuild or
+                                       self.cluster_of(self.goal) in rebuild):
+            affected.update(self._connect_endpoints())
+        return affected
+
+    # --- D* Lite ---
+
+    def heuristic(self, a: Cell, b: Cell) -> float:
+        return self.heuristic_weight * math.hypot(a[0] - b[0], a[1] - b[1])
+
+    def calculate_key(self, cell: Cell) -> Tuple[float, float]:
+        value = min(self.g.get(cell, INF), self.rhs.get(cell, INF))
+        return (value + self.heuristic(cell, self.start) + self.km, value)
+
+    def update_vertex(self, cell: Cell):
+        if cell != self.goal:
+            best = INF
+            for neighbor, cost in self.successors(cell):
+                total = cost + self.g.get(neighbor, INF)
+                if total < best:
+                    best = total
+            self.rhs[cell] = best
+        self._queue_vertex(cell)
+
+    def _queue_vertex(self, cell: Cell):
+        if self.g.get(cell, INF) != self.rhs.get(cell, INF):
+            self.open_list.insert(cell, self.calculate_key(cell))
+        elif self.open_list.contains(cell):
+            self.open_list.remove(cell)
+
+    def initialize_search(self, start: Cell, goal: Cell):
+        self.start = tuple(start)
+        self.goal = tuple(goal)
+        self.last_start = self.start
+        self.km = 0.0
+        self.g = {}
+        self.rhs = {self.goal: 0.0}
+        self.open_list.clear()
+        self._apply_changes()
+        self._connect_endpoints()
+        self.open_list.insert(self.goal, self.calculate_key(self.goal))
+
+    def compute_shortest_path(self):
+        while (not self.open_list.empty() and
+               (self.open_list.top_key() < self.calculate_key(self.start) or
+                self.rhs.get(self.start, INF) != self.g.get(self.start, INF))):
+            k_old = self.open_list.top_key()
+            current = self.open_list.pop()
+            k_new = self.calculate_key(current)
+            if k_old < k_new:
+                self.open_list.insert(current, k_new)
+                continue
+            self.stats['nodes_expanded'] += 1
+
+            if self.g.get(current, INF) > self.rhs.get(current, INF):
+                g = self.g[current] = self.rhs[current]
+                # g azaldı: öncüllerin rhs'i taranmadan küçültülür
+                for neighbor, cost in list(self.predecessors(current)):
+                    if neighbor != self.goal and cost + g < self.rhs.get(neighbor, INF):
+                        self.rhs[neighbor] = cost + g
+                        self._queue_vertex(neighbor)
+            else:
+                self.g[current] = INF
+                for neighbor, _ in list(self.predecessors(current)):
+                    self.update_vertex(neighbor)
+                self.update_vertex(current)
+
+    def _update_affected(self, cells: Set[Cell]):
+        """Çıkan kenarları değişmiş olabilecek düğümleri güncelle"""
+        for cell in cells:
+            if self.is_vertex(cell):
+                self.update_vertex(cell)
+            else:
+                # Artık giriş olmayan hücre grafikten düştü
+                self.g.pop(cell, None)
+                self.rhs.pop(cell, None)
+                self.open_list.remove(cell)
+
+    # --- Yol ---
+
+    def extract_abstract_path(self) -> List[Cell]:
+        """Soyut düğümler üzerinden başlangıçtan hedefe yol (g'si azalan adımlar)"""
+        if self.g.get(self.start, INF) == INF:
+            return []
+        path = [self.start]
+        current = self.start
+        while current != self.goal:
+            best, best_cost = None, INF
+            current_g = self.g.get(current, INF)
+            for neighbor, cost in self.successors(current):
+                neighbor_g = self.g.get(neighbor, INF)
+                if neighbor_g < current_g and cost + neighbor_g < best_cost:
+                    best, best_cost = neighbor, cost + neighbor_g
+            if best is None:
+                return []
+            path.append(best)
+            current = best
+        return path
+
+    def refine(self, abstract_path: List[Cell]) -> List[Cell]:
+        """Soyut yolu hücre yoluna aç; yalnızca yolun geçtiği kümeler aranır"""
+        if not abstract_path:
+            return []
+        path = [abstract_path[0]]
+        for source, target in zip(abstract_path, abstract_path[1:]):
+            cluster = self.cluster_of(source)
+            if cluster == self.cluster_of(target):
+                path.extend(self.clusters[cluster].path(source, target))
+            else:
+                path.append(target)  # Kümeler arası tek adım
+        return path
+
+    def _result(self) -> List[Cell]:
+        self.abstract_path = self.extract_abstract_path()
+        return self.refine(self.abstract_path)
+
+    def plan_path(self, start: Cell, goal: Cell) -> List[Cell]:
+        """Yol planla"""
+        start_time = time.time()
+        self.initialize_search(start, goal)
+        self.compute_shortest_path()
+        path = self._result()
+        self.stats['total_planning_time'] += time.time() - start_time
+        return path
+
+    def replan_path(self, new_start: Optional[Cell] = None) -> List[Cell]:
+        """Harita değişikliklerini ve başlangıç hareketini işleyip yeniden planla"""
+        start_time = time.time()
+        self.stats['replanning_count'] += 1
+        affected = set()
+        if new_start is not None and tuple(new_start) != self.start:
+            self.start = tuple(new_start)
+            self.km += self.heuristic(self.last_start, self.start)
+            self.last_start = self.start
+            affected.update(self._connect_endpoints())
+        affected.update(self._apply_changes())
+        self._update_affected(affected)
+        self.compute_shortest_path()
+        path = self._result()
+        self.stats['total_planning_time'] += time.time() - start_time
+        return path
@@ -0,0 +1,268 @@
+import heapq
+import time
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+from .adjacency import grid_window
+from .array_search import DIRECTIONS, SQRT2
+
+Cell = Tuple[int, int]
+
+STRAIGHT = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def _line_jumps(free: np.ndarray, stop: np.ndarray) -> np.ndarray:
+    """Satırlar boyunca +x yönünde atlama mesafeleri.
+
+    ``free`` bir hücrelik kenarla doldurulmuş (R+2, L+2), ``stop`` (R, L)
+    dizidir. Pozitif değer bir sonraki atlama noktasına adım sayısı, sıfır ya
+    da negatif değer duvara kadar serbest adım sayısının eksisidir.
+    """
+    center = free[1:-1, 1:-1]
+    # Köşe kesmesiz JPS: yandaki hücre açık, arkasındaki kapalıysa zorunlu komşu
+    forced = (free[:-2, 1:-1] & ~free[:-2, :-2]) | (free[2:, 1:-1] & ~free[2:, :-2])
+    event = ~center | forced | stop
+    rows, length = center.shape
+    positions = np.arange(length)
+    nearest = np.where(event, positions, length)
+    nearest = np.minimum.accumulate(nearest[:, ::-1], axis=1)[:, ::-1]
+    following = np.empty_like(nearest)
+    following[:, :-1] = nearest[:, 1:]
+    following[:, -1] = length
+    steps = following - positions
+    landing = np.take_along_axis(center, np.minimum(following, length - 1), axis=1)
+    return np.where((following < length) & landing, steps, 1 - steps).astype(np.int32)
+
+
+class JumpPointPlanner:
+    """Köşe kesmesiz Jump Point Search (JPS+ tarzı düz atlama tablolarıyla).
+
+    Kenar kuralları `DStarLite.get_neighbors` / `get_cost` ile aynıdır ve
+    bulunan yolun maliyeti D* Lite'ın optimum maliyetine eşittir
+    (``last_cost`` ile `DStarLite` sonucunu doğrulamak ya da tohumlamak için).
+
+    Arazi maliyeti ``uniform_cost`` olmayan serbest hücreler ve komşuları
+    durak hücresidir: atlamalar bu hücrelerde durur, buradan tüm komşular
+    açılır. Böylece budama yalnızca düzgün maliyetli bölgelerde yapılır.
+
+    Dört düz yön için her hücrenin bir sonraki atlama noktasına (ya da duvara)
+    mesafesi tablolarda tutulur. Tablolar `GridMap` değişikliklerini dinler;
+    `sync` yalnızca değişen dikdörtgenin satırlarını (yatay yönler) ve
+    sütunlarını (dikey yönler) yeniden hesaplar. Diyagonal atlamalar sorgu
+    anında bu tablolarla adım adım yürütülür; diyagonal mesafe tablosu tüm
+    köşegen boyunca düz tablolara bağlı olduğundan yerel yamalanamazdı.
+    """
+
+    def __init__(self, grid_map, uniform_cost: float = 1.0):
+        self.grid_map = grid_map
+        self.width = grid_map.width
+        self.height = grid_map.height
+        self.uniform_cost = uniform_cost
+
+        shape = (self.height, self.width)
+        self.free = np.zeros(shape, dtype=bool)
+        self.stop = np.zeros(shape, dtype=bool)  # Düzgün olmayan hücre ya da komşusu
+        self.jumps: Dict[Tuple[int, int], np.ndarray] = {
+            d: np.zeros(shape, dtype=np.int32) for d in STRAIGHT
+        }
+        self.min_terrain = 0.0
+        self.last_cost = float('inf')
+        self._dirty: List[Tuple[int, int, int, int]] = []
+
+        self.stats = {
+            'nodes_expanded': 0,
+            'patched_lines': 0,
+            'total_planning_time': 0.0
+        }
+
+        self.rebuild()
+        grid_map.add_change_listener(self._on_grid_change)
+
+    # --- Tablolar ---
+
+    def rebuild(self):
+        """Tüm tabloları baştan kur"""
+        self._dirty.clear()
+        self.min_terrain = float(self.grid_map.terrain_costs.min())
+        self._update_flags(0, 0, self.width - 1, self.height - 1)
+        self._build_rows(0, self.height - 1)
+        self._build_columns(0, self.width - 1)
+
+    def _on_grid_change(self, x1: int, y1: int, x2: int, y2: int):
+        self._dirty.append((x1, y1, x2, y2))
+
+    def sync(self) -> int:
+        """Bekleyen değişiklikleri yamala; yeniden hesaplanan satır+sütun sayısı"""
+        patched = 0
+        while self._dirty:
+            x1, y1, x2, y2 = self._dirty.pop()
+            window = self.grid_map.terrain_costs[y1:y2 + 1, x1:x2 + 1]
+            self.min_terrain = min(self.min_terrain, float(window.min()))
+            # Durak ve zorunlu komşu bilgisi bir hücre öteye taşar
+            x1, y1 = max(0, x1 - 1), max(0, y1 - 1)
+            x2, y2 = min(self.width - 1, x2 + 1), min(self.height - 1, y2 + 1)
+            self._update_flags(x1, y1, x2, y2)
+            self._build_rows(y1, y2)
+            self._build_columns(x1, x2)
+            patched += (y2 - y1 + 1) + (x2 - x1 + 1)
+        self.stats['patched_lines'] += patched
+        return patched
+
+    def _update_flags(self, x1: int, y1: int, x2: int, y2: int):
+        grid_map = self.grid_map
+        free = grid_window(grid_map.grid, x1, y1, x2, y2, grid_map.OBSTACLE) != grid_map.OBSTACLE
+        terrain = grid_window(grid_map.terrain_costs, x1, y1, x2, y2, self.uniform_cost)
+        rough = free & (terrain != self.uniform_cost)
+        rows, cols = y2 - y1 + 1, x2 - x1 + 1
+        near_rough = np.zeros((rows, cols), dtype=bool)
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                near_rough |= rough[1 + dy:1 + dy + rows, 1 + dx:1 + dx + cols]
+        center = free[1:-1, 1:-1]
+        self.free[y1:y2 + 1, x1:x2 + 1] = center
+        self.stop[y1:y2 + 1, x1:x2 + 1] = center & near_rough
+
+    def _build_rows(self, y1: int, y2: int):
+        """[y1, y2] satırlarının yatay atlama tablolarını kur"""
+        free = self._padded_rows(y1, y2)
+        stop = self.stop[y1:y2 + 1]
+        self.jumps[(1, 0)][y1:y2 + 1] = _line_jumps(free, stop)
+        self.jumps[(-1, 0)][y1:y2 + 1] = _line_jumps(free[:, ::-1], stop[:, ::-1])[:, ::-1]
+
+    def _build_columns(self, x1: int, x2: int):
+        """[x1, x2] sütunlarının dikey atlama tablolarını kur"""
+        free = self._padded_columns(x1, x2).T
+        stop = self.stop[:, x1:x2 + 1].T
+        self.jumps[(0, 1)][:, x1:x2 + 1] = _line_jumps(free, stop).T
+        self.jumps[(0, -1)][:, x1:x2 + 1] = _line_jumps(free[:, ::-1], stop[:, ::-1])[:, ::-1].T
+
+    def _padded_rows(self, y1: int, y2: int) -> np.ndarray:
+        out = np.zeros((y2 - y1 + 3, self.width + 2), dtype=bool)
+        sy1, sy2 = max(0, y1 - 1), min(self.height, y2 + 2)
+        out[sy1 - (y1 - 1):sy2 - (y1 - 1), 1:-1] = self.free[sy1:sy2]
+        return out
+
+    def _padded_columns(self, x1: int, x2: int) -> np.ndarray:
+        out = np.zeros((self.height + 2, x2 - x1 + 3), dtype=bool)
+        sx1, sx2 = max(0, x1 - 1), min(self.width, x2 + 2)
+        out[1:-1, sx1 - (x1 - 1):sx2 - (x1 - 1)] = self.free[:, sx1:sx2]
+        return out
+
+    # --- Arama ---
+
+    def heuristic(self, a: Cell, b: Cell) -> float:
+        """En ucuz adım maliyetleriyle oktil mesafe (kabul edilebilir)"""
+        dx, dy = abs(a[0] - b[0]), abs(a[1] - b[1])
+        diagonal, straight = min(dx, dy), abs(dx - dy)
+        return diagonal * (SQRT2 + self.min_terrain) + straight * (1.0 + self.min_terrain)
+
+    def _directions(self, cell: Cell, parent: Optional[Cell]) -> List[Tuple[int, int]]:
+        """Budanmış arama yönleri (durak hücrelerinde ve başlangıçta hepsi)"""
+        x, y = cell
+        if parent is None or self.stop[y, x]:
+            return list(DIRECTIONS)
+        dx = (x > parent[0]) - (x < parent[0])
+        dy = (y > parent[1]) - (y < parent[1])
+        if dx and dy:
+            return [(0, dy), (dx, 0), (dx, dy)]
+        if dx:
+            return [(dx, 0), (dx, 1), (dx, -1), (0, 1), (0, -1)]
+        return [(0, dy), (1, dy), (-1, dy), (1, 0), (-1, 0)]
+
+    def _passable(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height and self.free[y, x]
+
+    def _jump(self, cell: Cell, direction: Tuple[int, int], goal: Cell) -> Optional[Tuple[Cell, int]]:
+        """``cell``'den ``direction`` yönünde atla: (atlama noktası, adım) ya da None"""
+        x, y = cell
+        dx, dy = direction
+        if dx and dy:
+            while True:
+                nx, ny = x + dx, y + dy
+                if not (self._passable(nx, ny) and self.free[y, nx] and self.free[ny, x]):
+                    return None
+                x, y = nx, ny
+                if (x, y) == goal or self.stop[y, x]:
+                    break
+                if self.jumps[(dx, 0)][y, x] > 0 or self.jumps[(0, dy)][y, x] > 0:
+                    break
+                # Hedefle aynı satır/sütun: düz atlama hedefe ulaşıyorsa burada dur
+                if x == goal[0] and 0 < (goal[1] - y) * dy <= abs(self.jumps[(0, dy)][y, x]):
+                    break
+                if y == goal[1] and 0 < (goal[0] - x) * dx <= abs(self.jumps[(dx, 0)][y, x]):
+                    break
+            return (x, y), abs(x - cell[0])
+
+        distance = int(self.jumps[direction][y, x])
+        reach = abs(distance)
+        if dx and y == goal[1] and 0 < (goal[0] - x) * dx <= reach:
+            return goal, abs(goal[0] - x)
+        if dy and x == goal[0] and 0 < (goal[1] - y) * dy <= reach:
+            return goal, abs(goal[1] - y)
+        if distance > 0:
+            return (x + dx * distance, y + dy * distance), distance
+        return None
+
+    def _segment_cost(self, target: Cell, steps: int, diagonal: bool) -> float:
+        """Ara hücreler düzgün maliyetli olduğundan kapalı formda"""
+        base = SQRT2 if diagonal else 1.0
+        terrain = float(self.grid_map.terrain_costs[target[1], target[0]])
+        return steps * base + (steps - 1) * self.uniform_cost + terrain
+
+    def plan_path(self, start: Cell, goal: Cell) -> List[Cell]:
+        """Yol planla; yol yoksa boş liste (maliyet ``last_cost``)"""
+        start_time = time.time()
+        self.sync()
+        start, goal = tuple(start), tuple(goal)
+        self.last_cost = float('inf')
+        if not (self._passable(*start) and self._passable(*goal)):
+            return []
+
+        g = {start: 0.0}
+        parents: Dict[Cell, Optional[Cell]] = {start: None}
+        closed = set()
+        counter = 0
+        open_list = [(self.heuristic(start, goal), counter, start)]
+        while open_list:
+            _, _, cell = heapq.heappop(open_list)
+            if cell in closed:
+                continue
+            if cell == goal:
+                self.last_cost = g[cell]
+                self.stats['total_planning_time'] += time.time() - start_time
+                return self._reconstruct(parents, goal)
+            closed.add(cell)
+            self.stats['nodes_expanded'] += 1
+
+            for direction in self._directions(cell, parents[cell]):
+                jump = self._jump(cell, direction, goal)
+                if jump is None:
+                    continue
+                target, steps = jump
+                cost = g[cell] + self._segment_cost(target, steps, direction[0] != 0 and direction[1] != 0)
+                if cost < g.get(target, float('inf')):
+                    g[target] = cost
+                    parents[target] = cell
+                    counter += 1
+                    heapq.heappush(open_list, (cost + self.heuristic(target, goal), counter, target))
+
+        self.stats['total_planning_time'] += time.time() - start_time
+        return []
+
+    def _reconstruct(self, parents: Dict[Cell, Optional[Cell]], goal: Cell) -> List[Cell]:
+        """Atlama noktalarını hücre hücre aç"""
+        jump_points = []
+        cell = goal
+        while cell is not None:
+            jump_points.append(cell)
+            cell = parents[cell]
+        jump_points.reverse()
+
+        path = [jump_points[0]]
+        for (x, y), (tx, ty) in zip(jump_points, jump_points[1:]):
+            dx = (tx > x) - (tx < x)
+            dy = (ty > y) - (ty < y)
+            while (x, y) != (tx, ty):
+                x, y = x + dx, y + dy
+                path.append((x, y))
+        return path
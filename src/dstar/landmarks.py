@@ -0,0 +1,91 @@
+import numpy as np
+from typing import List
+from scipy.sparse.csgraph import dijkstra
+
+from .cost_field import cost_table_graph
+from .providers import entry_cost_table
+
+
+def free_flow_cost_table(traffic_env) -> np.ndarray:
+    """Serbest akış maliyetleriyle (height, width, 8) kenar maliyetleri.
+
+    `TrafficProvider` ile aynı kural: hedef hücre yolsa kenar maliyeti
+    mesafe (1 ya da √2) çarpı hedefin serbest akış maliyeti.
+    """
+    return entry_cost_table(traffic_env.free_flow_cost_grid())
+
+
+class LandmarkHeuristic:
+    """Yol ağı için ALT (A*, landmark, üçgen eşitsizliği) alt sınırı.
+
+    Yol hücrelerinden ``count`` landmark en uzak nokta seçimiyle alınır ve
+    her biri için serbest akış grafında ileri d(L, v) ve geri d(v, L)
+    mesafeleri SciPy Dijkstra ile hesaplanıp (hücre, landmark) dizilerinde
+    saklanır. Alt sınır::
+
+        d(a, b) >= max_L max(d(L, b) - d(L, a), d(a, L) - d(b, L))
+
+    Dinamik maliyetler serbest akış maliyetlerinden küçük olamadığından sınır
+    trafik değiştikçe de geçerli kalır. Yeni yol açılırsa `rebuild` çağrılmalı.
+    Bir landmark'a göre ulaşılamayan hücreler ``UNREACHABLE`` ile tutulur;
+    bu değer yalnızca gerçekten ulaşılamayan çiftlerde büyük sınır üretir.
+    """
+
+    # Sonsuz mesafelerin yerine geçen sonlu değer (inf - inf = nan olmasın)
+    UNREACHABLE = 1e12
+    # Farklı işlem sırasından gelen yuvarlamaya karşı sınırı hafifçe küçült
+    SLACK = 1.0 - 1e-6
+
+    def __init__(self, traffic_env, count: int = 8):
+        if count < 1:
+            raise ValueError("Landmark sayısı en az 1 olmalı")
+        self.traffic_env = traffic_env
+        self.count = count
+        self.landmarks: List[int] = []
+        self.from_landmarks = None  # (hücre, landmark): d(L, v)
+        self.to_landmarks = None    # (hücre, landmark): d(v, L)
+        self.rebuild()
+
+    def rebuild(self):
+        """Landmark'ları seç ve mesafe dizilerini yeniden hesapla"""
+        table = free_flow_cost_table(self.traffic_env)
+        forward = cost_table_graph(table)
+        reverse = cost_table_graph(table, reverse=True)
+        road_ids = np.flatnonzero(np.isfinite(self.traffic_env.free_flow_cost_grid()))
+        size = table.shape[0] * table.shape[1]
+
+        self.landmarks = []
+        from_rows, to_rows = [], []
+        if len(road_ids):
+            # İlk landmark ilk yol hücresinden en uzak hücre, sonrakiler
+            # seçilmişlere en uzak olanlar
+            seed = dijkstra(forward, directed=True, indices=int(road_ids[0]))
+            score = np.where(np.isfinite(seed), seed, -1.0)
+            while len(self.landmarks) < self.count:
+                landmark = int(np.argmax(score))
+                if score[landmark] <= 0.0 and self.landmarks:
+                    break
+                self.landmarks.append(landmark)
+                from_row = dijkstra(forward, directed=True, indices=landmark)
+                from_rows.append(from_row)
+                to_rows.append(dijkstra(reverse, directed=True, indices=landmark))
+                reach = np.where(np.isfinite(from_row), from_row, -1.0)
+                score = reach if len(self.landmarks) == 1 else np.minimum(score, reach)
+
+        self.from_landmarks = self._stack(from_rows, size)
+        self.to_landmarks = self._stack(to_rows, size)
+
+    def _stack(self, rows, size: int) -> np.ndarray:
+        if not rows:
+            return np.zeros((size, 1))
+        distances = np.stack(rows, axis=1) * self.SLACK
+        distances[~np.isfinite(distances)] = self.UNREACHABLE
+        return np.ascontiguousarray(distances)
+
+    def lower_bound(self, from_id: int, to_id: int) -> float:
+        """``from_id`` hücresinden ``to_id`` hücresine maliyetin alt sınırı"""
+        forward = self.from_landmarks
+        backward = self.to_landmarks
+        bound = max((forward[to_id] - forward[from_id]).max(),
+                    (backward[from_id] - backward[to_id]).max())
+        return float(bound) if bound > 0.0 else 0.0
@@ -0,0 +1,81 @@
+import numpy as np
+from typing import Tuple
+
+
+class ArrayNodeStore:
+    """Düğüm durumlarını (g, rhs, h) düz NumPy dizilerinde tutan depo.
+
+    Her hücrenin kimliği ``y * width + x`` tamsayısıdır. Python nesnesi
+    oluşturulmadığı için 1000x1000 bir harita birkaç on MB ile temsil edilir.
+    Sıcak döngüler için dizilerle aynı belleği paylaşan ``memoryview``
+    görünümleri de tutulur (skaler erişim NumPy indekslemesinden hızlıdır).
+
+    Sıfırlama nesil damgalarıyla yapılır: damgası ``generation`` değerinden
+    eski olan bir hücre g = rhs = inf kabul edilir. Böylece `reset` O(1)
+    olur; hücre ilk kez dokunulduğunda (`touch`) sıfırlanır.
+    """
+
+    MAX_GENERATION = np.iinfo(np.int32).max
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.size = width * height
+
+        self.g = np.full(self.size, np.inf, dtype=np.float64)
+        self.rhs = np.full(self.size, np.inf, dtype=np.float64)
+        self.h = np.zeros(self.size, dtype=np.float64)
+        self.stamp = np.zeros(self.size, dtype=np.int32)
+        self.generation = 0
+
+        self.g_view = memoryview(self.g)
+        self.rhs_view = memoryview(self.rhs)
+        self.h_view = memoryview(self.h)
+        self.stamp_view = memoryview(self.stamp)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def index(self, x: int, y: int) -> int:
+        """Koordinatlardan hücre kimliği"""
+        return y * self.width + x
+
+    def coords(self, node_id: int) -> Tuple[int, int]:
+        """Hücre kimliğinden (x, y) koordinatları"""
+        y, x = divmod(node_id, self.width)
+        return x, y
+
+    def reset(self):
+        """Yeni nesle geç; önceki aramanın değerleri geçersiz sayılır"""
+        if self.generation >= self.MAX_GENERATION:
+            # Sayaç taşmadan önce tek seferlik tam sıfırlama
+            self.g.fill(np.inf)
+            self.rhs.fill(np.inf)
+            self.stamp.fill(0)
+            self.generation = 0
+        self.generation += 1
+
+    def touch(self, node_id: int):
+        """Hücre eski nesildense g ve rhs değerlerini sonsuza çek"""
+        if self.stamp_view[node_id] != self.generation:
+            self.stamp_view[node_id] = self.generation
+            self.g_view[node_id] = np.inf
+            self.rhs_view[node_id] = np.inf
+
+    def refresh_all(self):
+        """Eski nesildeki tüm hücreleri vektörel olarak sıfırla.
+
+        Sonrasında ``g`` / ``rhs`` dizileri damgaya bakmadan okunabilir.
+        """
+        stale = self.stamp != self.generation
+        self.g[stale] = np.inf
+        self.rhs[stale] = np.inf
+        self.stamp[stale] = self.generation
+
+    def is_current(self, node_id: int) -> bool:
+        """Hücre bu aramada dokunulmuş mu"""
+        return self.stamp_view[node_id] == self.generation
+
+    def nbytes(self) -> int:
+        """Deponun kullandığı toplam bellek (bayt)"""
+        return self.g.nbytes + self.rhs.nbytes + self.h.nbytes + self.stamp.nbytes
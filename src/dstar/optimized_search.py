@@ -0,0 +1,106 @@
+from typing import Optional
+
+from .array_search import INF, budget_exhausted
+
+
+class OptimizedSearchMixin:
+    """Optimize D* Lite (Koenig & Likhachev, 2002, Şekil 4) adımları.
+
+    `ArraySearchMixin` ile birlikte dizi deposu ve `GridAdjacency` üzerinde
+    çalışır. Temel sürümden farkları:
+
+    - Genişletmede öncüllerin rhs değeri tüm komşular üzerinden yeniden
+      hesaplanmaz; g azalınca yalnızca ``c(s, u) + g(u)`` ile karşılaştırılır,
+      g artınca da yalnızca u, s'nin argmin'i ise (``rhs(s) == c(s, u) + g_eski``)
+      yeniden taranır.
+    - Kenar maliyeti azalınca rhs doğrudan güncellenir; artınca yalnızca
+      değişen kenar argmin ise tarama yapılır.
+    - `update_vertex` rhs hesaplamaz, sadece kuyruğu düzenler
+      (`_array_queue_vertex`).
+    """
+
+    def _optimized_compute_shortest_path(self, max_expansions: Optional[int] = None,
+                                         deadline: Optional[float] = None) -> bool:
+        g = self.nodes.g_view
+        rhs = self.nodes.rhs_view
+        open_list = self.open_list
+        goal = self.goal
+        limited = max_expansions is not None or deadline is not None
+        expanded = 0
+        # Makaledeki ``rhs > g`` yerine ``!=``: başlangıç da genişletilir ve
+        # g(start) ortak yol çıkarımı için kesinleşir
+        while (not open_list.empty() and
+               (open_list.top_key() < self._array_key(self.start) or
+                rhs[self.start] != g[self.start])):
+            if limited and budget_exhausted(expanded, max_expansions, deadline):
+                return False
+            k_old = open_list.top_key()
+            current = open_list.pop()
+            k_new = self._array_key(current)
+            if k_old < k_new:
+                open_list.insert(current, k_new)
+                continue
+            self.stats['nodes_expanded'] += 1
+            expanded += 1
+
+            if g[current] > rhs[current]:
+                g[current] = rhs[current]
+                g_current = g[current]
+                for neighbor, edge_cost in self._array_predecessors(current):
+                    if neighbor != goal:
+                        cost = edge_cost + g_current
+                        if cost < rhs[neighbor]:
+                            rhs[neighbor] = cost
+                    self._array_queue_vertex(neighbor)
+            else:
+                g_old = g[current]
+                g[current] = INF
+                for neighbor, edge_cost in self._array_predecessors(current):
+                    # Yalnızca current bu öncülün en iyi ardılıysa yeniden tara
+                    if neighbor != goal and rhs[neighbor] == edge_cost + g_old:
+                        rhs[neighbor] = self._array_min_rhs(neighbor)
+                    self._array_queue_vertex(neighbor)
+                # rhs(current) kendi g değerine bağlı değil; sadece kuyruğu düzenle
+                self._array_queue_vertex(current)
+        return True
+
+    def _optimized_update_edges(self, cells=()) -> int:
+        """Komşuluk tablosundaki bekleyen değişiklikleri kenar kenar uygula.
+
+        Engel hücrenin çıkan kenarları tabloda durduğu için engeli kalkan
+        hücrenin rhs değeri hiçbir kenar değişikliğiyle tetiklenmez; bu
+        hücreler ``cells`` ile verilip ayrıca yeniden hesaplanır.
+        """
+        sources, targets, old_costs, new_costs = self.adjacency.sync_changes()
+        # Engel kaynaklı kenarlar okunmaz (gelen kenarları inf); kapatılan
+        # bölgenin iç kenarlarını atla, iş sınırla orantılı kalsın
+        adjacency = self.adjacency
+        keep = ~adjacency.blocked(sources) | (sources == self.start)
+        sources, targets = sources[keep], targets[keep]
+        old_costs, new_costs = old_costs[keep], new_costs[keep]
+        store = self.nodes
+        g = store.g_view
+        rhs = store.rhs_view
+        goal = self.goal
+        for u, v, c_old, c_new in zip(sources.tolist(), targets.tolist(),
+                                      old_costs.tolist(), new_costs.tolist()):
+            store.touch(u)
+            store.touch(v)
+            if u != goal:
+                if c_old > c_new:
+                    cost = c_new + g[v]
+                    if cost < rhs[u]:
+                        rhs[u] = cost
+                elif rhs[u] == c_old + g[v]:
+                    rhs[u] = self._array_min_rhs(u)
+            self._array_queue_vertex(u)
+        index = store.index
+        for x, y in cells:
+            node_id = index(x, y)
+            if adjacency.blocked(node_id) and node_id != self.start:
+                continue
+            store.touch(node_id)
+            if node_id != goal:
+                rhs[node_id] = self._array_min_rhs(node_id)
+            self._array_queue_vertex(node_id)
+        return len(sources)
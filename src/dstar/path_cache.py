@@ -0,0 +1,88 @@
+import numpy as np
+from collections import OrderedDict
+from typing import List, Tuple
+
+
+class PathCache:
+    """`DStarLite.plan_path` önünde uç noktalarla anahtarlanan LRU yol önbelleği.
+
+    Her kayıt, aramanın okuduğu hücrelerin düştüğü `GridMap` karolarını ve
+    bu karoların ``tile_versions`` değerlerini saklar. Okunan hücreler g ya da
+    rhs değeri sonlu olan hücreler (genişletilenler ve açık listedeki sınır)
+    ile bunların bir hücrelik komşuluğudur; arama ve yol çıkarımı bu bölgenin
+    dışını okumaz. Kayıt yalnızca bu karolardan birinin sürümü değişmişse
+    geçersiz sayılır; haritanın başka yerindeki değişiklikler isabeti bozmaz.
+
+    ``stats`` isabet, ıskalama, geçersizleşme ve kapasite tahliyelerini sayar.
+    """
+
+    def __init__(self, planner, capacity: int = 128):
+        if capacity < 1:
+            raise ValueError("Kapasite en az 1 olmalı")
+        self.planner = planner
+        self.grid_map = planner.grid_map
+        self.capacity = capacity
+        self._entries = OrderedDict()  # (start, goal) -> (yol, karo y, karo x, sürümler)
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'invalidations': 0,
+            'evictions': 0
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def hit_rate(self) -> float:
+        """İsabet oranı (hiç sorgu yoksa 0)"""
+        total = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / total if total else 0.0
+
+    def clear(self):
+        self._entries.clear()
+
+    def plan_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Önbellekte geçerli kayıt varsa onu, yoksa planlayıcının yolunu döndür"""
+        key = (tuple(start), tuple(goal))
+        entry = self._entries.get(key)
+        if entry is not None:
+            path, tile_ys, tile_xs, versions = entry
+            if np.array_equal(self.grid_map.tile_versions[tile_ys, tile_xs], versions):
+                self._entries.move_to_end(key)
+                self.stats['hits'] += 1
+                return list(path)
+            del self._entries[key]
+            self.stats['invalidations'] += 1
+
+        self.stats['misses'] += 1
+        path = self.planner.plan_path(start, goal)
+        tile_ys, tile_xs = self._read_tiles(start, goal)
+        self._entries[key] = (list(path), tile_ys, tile_xs,
+                              self.grid_map.tile_versions[tile_ys, tile_xs].copy())
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.stats['evictions'] += 1
+        return path
+
+    def _read_tiles(self, start: Tuple[int, int], goal: Tuple[int, int]):
+        """Son aramanın okuduğu hücrelerin karoları (y, x indeks dizileri)"""
+        g, rhs = self.planner.cost_field(with_rhs=True)
+        touched = np.isfinite(g) | np.isfinite(rhs)
+        touched[start[1], start[0]] = True
+        touched[goal[1], goal[0]] = True
+
+        # Komşu ve köşe kontrolleri için bir hücrelik genişletme
+        read = touched.copy()
+        read[1:, :] |= touched[:-1, :]
+        read[:-1, :] |= touched[1:, :]
+        row_dilated = read.copy()
+        read[:, 1:] |= row_dilated[:, :-1]
+        read[:, :-1] |= row_dilated[:, 1:]
+
+        tile = self.grid_map.TILE_SIZE
+        ys, xs = np.nonzero(read)
+        tiles = np.unique((ys // tile) * self.grid_map.tile_versions.shape[1] + xs // tile)
+        return np.divmod(tiles, self.grid_map.tile_versions.shape[1])
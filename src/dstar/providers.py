@@ -0,0 +1,190 @@
+import math
+import numpy as np
+from typing import List, Optional
+
+from .adjacency import GridAdjacency, TrafficAdjacency, edge_cost_window
+from .array_search import DIRECTIONS, INF, SQRT2
+
+
+def entry_cost_table(cell_cost: np.ndarray) -> np.ndarray:
+    """Hücreye giriş maliyetlerinden (height, width, 8) kenar maliyetleri.
+
+    Trafik kuralı: kaynak ve hedef geçilebilirse (maliyet sonlu) kenar
+    maliyeti mesafe (1 ya da √2) çarpı hedefin maliyetidir; köşe kesme
+    kısıtı yoktur. Değerler `TrafficProvider.cost_ids` ile birebir aynıdır.
+    """
+    height, width = cell_cost.shape
+    passable = np.isfinite(cell_cost)
+    padded = np.pad(cell_cost, 1, constant_values=np.inf)
+    table = np.full((height, width, len(DIRECTIONS)), np.inf)
+    for k, (dx, dy) in enumerate(DIRECTIONS):
+        distance = SQRT2 if dx and dy else 1.0
+        target = padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+        table[:, :, k] = np.where(passable, distance * target, np.inf)
+    return table
+
+
+class GridProvider:
+    """`GridMap` kuralları: 8 komşuluk, köşe kesme yasağı, kenar maliyeti
+    taban (1 veya √2) artı hedefin arazi maliyeti.
+
+    Sağlayıcılar planlayıcı çekirdeğine (`DStarLite`) hücre kimlikleri
+    (``y * width + x``) üzerinden komşuluk, kenar maliyeti ve ağırlıksız
+    heuristik verir. Toplu sorgular NumPy dizileri döner: `edge_cost_table`
+    (`GridAdjacency.cost_table` düzeninde) ve `cell_cost_grid`. `compile`
+    derlenmiş komşuluk tablosu döndürebiliyorsa dizi modu onu kullanır.
+    """
+
+    def __init__(self, grid_map):
+        self.grid_map = grid_map
+        self.width = grid_map.width
+        self.height = grid_map.height
+
+    def neighbor_ids(self, node_id: int) -> List[int]:
+        """Geçilebilir komşu kimlikleri (köşe kesmeyi engelle)"""
+        width = self.width
+        height = self.height
+        y, x = divmod(node_id, width)
+        # Harita dizisi doğrudan okunur: hedef harita içindeyse köşe
+        # hücreleri de içindedir, is_obstacle'ın sınır kontrolü gerekmez
+        grid = self.grid_map.grid
+        obstacle = self.grid_map.OBSTACLE
+        neighbors = []
+        for dx, dy in DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+            if grid[ny, nx] == obstacle:
+                continue
+            if dx != 0 and dy != 0:
+                if grid[y, nx] == obstacle or grid[ny, x] == obstacle:
+                    continue
+            neighbors.append(ny * width + nx)
+        return neighbors
+
+    def cost_ids(self, from_id: int, to_id: int) -> float:
+        """İki hücre kimliği arasındaki hareket maliyeti"""
+        width = self.width
+        ay, ax = divmod(from_id, width)
+        by, bx = divmod(to_id, width)
+        grid_map = self.grid_map
+        if not (0 <= bx < width and 0 <= by < self.height):
+            return INF
+        if grid_map.grid[by, bx] == grid_map.OBSTACLE:
+            return INF
+        base = SQRT2 if (ax != bx and ay != by) else 1.0
+        # float32 arazi maliyeti float64 toplamı bozmasın
+        return base + float(grid_map.terrain_costs[by, bx])
+
+    def edge_cost_for(self, from_id: int, to_id: int, cell_cost: float) -> float:
+        """Hedef hücrenin maliyeti ``cell_cost`` iken c(from, to)"""
+        width = self.width
+        ay, ax = divmod(from_id, width)
+        by, bx = divmod(to_id, width)
+        base = SQRT2 if (ax != bx and ay != by) else 1.0
+        return base + cell_cost
+
+    def heuristic_ids(self, id1: int, id2: int) -> float:
+        """Kimlikler arası Euclidean mesafe"""
+        width = self.width
+        y1, x1 = divmod(id1, width)
+        y2, x2 = divmod(id2, width)
+        dx = x1 - x2
+        dy = y1 - y2
+        return math.sqrt(dx * dx + dy * dy)
+
+    def compile(self) -> Optional[GridAdjacency]:
+        """Harita değişikliklerini izleyen derlenmiş komşuluk tabloları"""
+        return GridAdjacency(self.grid_map)
+
+    def edge_cost_table(self) -> np.ndarray:
+        """(height, width, 8) kenar maliyetleri, tek vektörel geçişte"""
+        return edge_cost_window(self.grid_map, 0, 0, self.width - 1, self.height - 1)
+
+    def cell_cost_grid(self) -> np.ndarray:
+        """(height, width) hücre giriş maliyetleri; engeller inf"""
+        grid_map = self.grid_map
+        return np.where(grid_map.grid == grid_map.OBSTACLE, np.inf,
+                        grid_map.terrain_costs.astype(np.float64))
+
+
+class TrafficProvider:
+    """`TrafficEnvironment` kuralları: yol hücreleri arasında 8 komşuluk,
+    kenar maliyeti mesafe (1 veya √2) çarpı hedefin dinamik maliyeti.
+
+    ``landmark_heuristic`` verilirse heuristik ALT alt sınırıdır, aksi halde
+    trafik yoğunluğuyla ölçeklenen Manhattan + Euclidean hibrit. Toplu
+    sorgular `TrafficEnvironment.dynamic_cost_grid` üzerinden gelir. `compile`
+    o anki maliyetlerden bir `TrafficAdjacency` kurar; tablo ortamı izlemez,
+    planlayıcı raporlanan değişiklikleri `set_cell_costs` ile yazar.
+    """
+
+    # Düz yönler önce, sonra köşegenler (eşit maliyetlerde düz hareket seçilir)
+    DIRECTIONS = [
+        (-1, 0), (1, 0), (0, -1), (0, 1),
+        (-1, -1), (-1, 1), (1, -1), (1, 1)
+    ]
+
+    def __init__(self, traffic_env, landmark_heuristic=None):
+        self.traffic_env = traffic_env
+        self.landmark_heuristic = landmark_heuristic
+        self.width = traffic_env.width
+        self.height = traffic_env.height
+
+    def neighbor_ids(self, node_id: int) -> List[int]:
+        """Yol hücresi komşu kimlikleri"""
+        width = self.width
+        y, x = divmod(node_id, width)
+        is_road = self.traffic_env.is_road
+        neighbors = []
+        for dx, dy in self.DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if is_road(nx, ny):
+                neighbors.append(ny * width + nx)
+        return neighbors
+
+    def cost_ids(self, from_id: int, to_id: int) -> float:
+        """Trafik farkındalıklı hareket maliyeti"""
+        by, bx = divmod(to_id, self.width)
+        return self.edge_cost_for(from_id, to_id, self.traffic_env.get_dynamic_cost(bx, by))
+
+    def edge_cost_for(self, from_id: int, to_id: int, cell_cost: float) -> float:
+        """Hedef hücrenin dinamik maliyeti ``cell_cost`` iken c(from, to)"""
+        if cell_cost == INF:
+            return INF
+        width = self.width
+        ay, ax = divmod(from_id, width)
+        by, bx = divmod(to_id, width)
+        distance_cost = SQRT2 if (ax != bx and ay != by) else 1.0
+        return distance_cost * cell_cost
+
+    def heuristic_ids(self, id1: int, id2: int) -> float:
+        """Hibrit ya da landmark heuristiği (ağırlıksız).
+
+        Geriye arama ``heuristic(s, start)`` sorar; landmark sınırı bu yüzden
+        start'tan s'ye (``id2``'den ``id1``'e) maliyet içindir.
+        """
+        if self.landmark_heuristic is not None:
+            return self.landmark_heuristic.lower_bound(id2, id1)
+        width = self.width
+        y1, x1 = divmod(id1, width)
+        y2, x2 = divmod(id2, width)
+        dx = abs(x1 - x2)
+        dy = abs(y1 - y2)
+        manhattan = dx + dy
+        euclidean = math.sqrt(dx * dx + dy * dy)
+        # Trafik yoğunluğuna göre heuristik ağırlık ayarlama
+        traffic_factor = 1.0 + self.traffic_env.traffic_grid[y1, x1] * 0.5
+        return (0.7 * manhattan + 0.3 * euclidean) * traffic_factor
+
+    def compile(self) -> Optional[GridAdjacency]:
+        """Güncel dinamik maliyetlerden derlenmiş komşuluk tabloları"""
+        return TrafficAdjacency(self.cell_cost_grid())
+
+    def edge_cost_table(self) -> np.ndarray:
+        """Güncel dinamik maliyetlerle (height, width, 8) kenar maliyetleri"""
+        return entry_cost_table(self.cell_cost_grid())
+
+    def cell_cost_grid(self) -> np.ndarray:
+        """(height, width) güncel dinamik maliyetler; yol olmayan hücreler inf"""
+        return self.traffic_env.dynamic_cost_grid()
@@ -0,0 +1,363 @@
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+from .array_search import DIRECTIONS, SQRT2, INF
+from .dstar_lite import Node
+from .traffic_dstar import TrafficAwareDStar
+
+
+def _run_lengths(mask: np.ndarray) -> np.ndarray:
+    """Her True hücrenin satırındaki kesintisiz True dizisinin uzunluğu"""
+    left = np.zeros_like(mask)
+    left[:, 1:] = mask[:, :-1]
+    run_id = np.cumsum((mask & ~left).ravel()).reshape(mask.shape)
+    lengths = np.bincount(run_id[mask], minlength=int(run_id.max()) + 1)
+    return np.where(mask, lengths[run_id], 0)
+
+
+def _shift(array: np.ndarray, dx: int, dy: int, fill) -> np.ndarray:
+    """``result[y, x] = array[y + dy, x + dx]`` (harita dışı ``fill``)"""
+    height, width = array.shape
+    padded = np.pad(array, 1, constant_values=fill)
+    return padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+
+
+class RoadGraph:
+    """`TrafficEnvironment` yol ağının kavşak/segment grafı.
+
+    Yol hücreleri yatay koridor, dikey koridor ya da kavşak olarak sınıflanır:
+    koridorun enine genişliği ``max_road_width``'i aşmaz ve boyuna uzunluğu
+    genişliğinden büyüktür. Bir koridor hücresi şu durumlarda düğüm olur:
+    başka sınıfta bir yol hücresine komşuysa, boyuna komşusunda yol tipi ya
+    da şerit sayısı değişiyorsa, ya da boyuna koordinatı
+    ``lane_change_spacing``'in katıysa (şerit değiştirme noktası). Kalan
+    koridor hücreleri şeritler boyunca zincirlenir. Graf düğümleri kavşak,
+    çıkmaz sokak ve şerit değiştirme hücreleridir.
+
+    Kenarlar iki türlüdür: komşu iki düğüm arasında tek adımlık kenar ve bir
+    şerit zinciri boyunca iki uç düğüm arasındaki kenar. Kenar maliyeti
+    girilen hücrelerin `get_dynamic_cost` değerlerinin (adım mesafesiyle
+    çarpılmış) toplamıdır ve `refresh_costs` ile vektörel yenilenir.
+
+    Sıkıştırma kesin değildir: şerit değiştirme ve zincir içi köşegen
+    hareketler yalnızca düğümlerde mümkündür. 200x150 şehirde (trafik
+    güncellemelerinden sonra, rastgele yol hücresi çiftleri) yollar hücre
+    düzeyindeki `TrafficAwareDStar` optimumundan ortalama %3-5, en kötü
+    durumda %25'e kadar pahalıdır; düğüm sayısı yol hücrelerinin yaklaşık
+    1/3.4'üdür. ``lane_change_spacing`` küçültmek farkı yalnızca biraz
+    azaltır (4'te ortalama ~%3) ama sıkıştırmayı 2.2 katına düşürür.
+    """
+
+    def __init__(self, traffic_env, max_road_width: int = 9, lane_change_spacing: int = 32):
+        if max_road_width < 1:
+            raise ValueError("Yol genişliği en az 1 olmalı")
+        if lane_change_spacing < 2:
+            raise ValueError("Şerit değiştirme aralığı en az 2 olmalı")
+        self.traffic_env = traffic_env
+        self.width = traffic_env.width
+        self.height = traffic_env.height
+        self.max_road_width = max_road_width
+        self.lane_change_spacing = lane_change_spacing
+        self.rebuild()
+
+    def rebuild(self):
+        """Yol ızgarasından düğümleri, zincirleri ve kenarları yeniden çıkar"""
+        env = self.traffic_env
+        width = self.width
+        road = (env.road_grid > 0) & (env.building_grid == 0)
+        self.cell_count = int(road.sum())
+        self.is_node = self._classify(road)
+
+        sources, targets, cells, dists = [], [], [], []
+
+        # Komşu düğümler arası tek adımlık kenarlar
+        node_ids = np.flatnonzero(self.is_node)
+        for dx, dy in DIRECTIONS:
+            ends = node_ids[_shift(self.is_node, dx, dy, False).ravel()[node_ids]]
+            distance = SQRT2 if dx and dy else 1.0
+            for source in ends.tolist():
+                target = source + dy * width + dx
+                sources.append(source)
+                targets.append(target)
+                cells.append([target])
+                dists.append([distance])
+
+        # Şerit zincirleri: iki uç düğüm arasında her iki yönde bir kenar
+        self.chain_of: Dict[int, Tuple[int, int]] = {}  # hücre -> (zincir, sıra)
+        self.chains: List[Tuple[int, List[int], int]] = []  # (A, iç hücreler, B)
+        interior = road & ~self.is_node
+        for axis in (0, 1):
+            mask = interior & (self._horizontal if axis == 0 else self._vertical)
+            run_mask = mask if axis == 0 else mask.T
+            left = np.zeros_like(run_mask)
+            left[:, 1:] = run_mask[:, :-1]
+            lengths = _run_lengths(run_mask)
+            for row, col in zip(*np.nonzero(run_mask & ~left)):
+                length = int(lengths[row, col])
+                if axis == 0:
+                    chain = [row * width + col + i for i in range(length)]
+                    step = 1
+                else:
+                    chain = [(col + i) * width + row for i in range(length)]
+                    step = width
+                a, b = chain[0] - step, chain[-1] + step
+                index = len(self.chains)
+                self.chains.append((a, chain, b))
+                for position, cell in enumerate(chain):
+                    self.chain_of[cell] = (index, position)
+                for source, path in ((a, chain + [b]), (b, chain[::-1] + [a])):
+                    sources.append(source)
+                    targets.append(path[-1])
+                    cells.append(path)
+                    dists.append([1.0] * len(path))
+
+        self.edge_sources = np.array(sources, dtype=np.int64)
+        self.edge_targets = np.array(targets, dtype=np.int64)
+        self.edge_lengths = np.array([len(path) for path in cells], dtype=np.int64)
+        self.edge_starts = np.cumsum(self.edge_lengths) - self.edge_lengths
+        self.edge_cells = np.array([cell for path in cells for cell in path], dtype=np.int64)
+        self.edge_dists = np.array([d for path in dists for d in path], dtype=np.float64)
+
+        self.edge_index: Dict[Tuple[int, int], int] = {}
+        self.neighbors: Dict[int, List[int]] = {}
+        for index, (source, target) in enumerate(zip(sources, targets)):
+            self.edge_index[(source, target)] = index
+            self.neighbors.setdefault(source, []).append(target)
+
+        self.costs = np.zeros(len(sources))
+        self.cell_costs = None
+        self.refresh_costs()
+
+    def _classify(self, road: np.ndarray) -> np.ndarray:
+        """Graf düğümü olan yol hücrelerinin maskesi"""
+        road_type = self.traffic_env.road_grid
+        horizontal_run = _run_lengths(road)
+        vertical_run = _run_lengths(road.T).T
+        limit = self.max_road_width
+        self._horizontal = road & (vertical_run <= limit) & (horizontal_run > vertical_run)
+        self._vertical = road & (horizontal_run <= limit) & (vertical_run > horizontal_run)
+
+        ys, xs = np.mgrid[0:self.height, 0:self.width]
+        interior = np.zeros_like(road)
+        for corridor, along, cross_run, (dx, dy) in (
+                (self._horizontal, xs, vertical_run, (1, 0)),
+                (self._vertical, ys, horizontal_run, (0, 1))):
+            # Koridor dışındaki bir yol hücresine 8-komşu olan hücreler düğümdür
+            other = road & ~corridor
+            near_other = np.zeros_like(road)
+            for ndx, ndy in DIRECTIONS:
+                near_other |= _shift(other, ndx, ndy, False)
+            inner = corridor & ~near_other & (along % self.lane_change_spacing != 0)
+            for sign in (1, -1):
+                inner &= _shift(corridor, sign * dx, sign * dy, False)
+                inner &= _shift(road_type, sign * dx, sign * dy, 0) == road_type
+                inner &= _shift(cross_run, sign * dx, sign * dy, 0) == cross_run
+            interior |= inner
+        return road & ~interior
+
+    @property
+    def node_count(self) -> int:
+        return int(self.is_node.sum())
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.edge_sources)
+
+    def refresh_costs(self) -> np.ndarray:
+        """Kenar maliyetlerini güncel dinamik maliyetlerle yenile.
+
+        Maliyeti değişen kenarların indekslerini döndürür.
+        """
+        self.cell_costs = self.traffic_env.dynamic_cost_grid().ravel()
+        costs = np.add.reduceat(self.edge_dists * self.cell_costs[self.edge_cells],
+                                self.edge_starts) if len(self.edge_starts) else self.costs
+        changed = np.flatnonzero(costs != self.costs)
+        self.costs = costs
+        return changed
+
+    def edge_path(self, source: int, target: int) -> Optional[List[int]]:
+        """Kenar boyunca girilen hücre kimlikleri (hedef dahil); kenar yoksa None"""
+        index = self.edge_index.get((source, target))
+        if index is None:
+            return None
+        start = self.edge_starts[index]
+        return self.edge_cells[start:start + self.edge_lengths[index]].tolist()
+
+    def path_cost(self, cells: List[int]) -> float:
+        """Düz adımlarla girilen hücrelerin güncel maliyet toplamı"""
+        return float(self.cell_costs[cells].sum()) if cells else 0.0
+
+    def split(self, cell: int, stops=()) -> List[Tuple[int, List[int], List[int]]]:
+        """Zincir içindeki ``cell``'i iki uca bağlayan geçici kenarlar.
+
+        Her yön için (uç, cell -> uç hücreleri, uç -> cell hücreleri) döner.
+        ``stops`` içindeki zincir hücreleri uç sayılır; böylece aynı zincirde
+        duran iki geçici düğüm birbirine bağlanır. Hücre zincir içinde
+        değilse boş liste döner.
+        """
+        entry = self.chain_of.get(cell)
+        if entry is None:
+            return []
+        index, position = entry
+        a, chain, b = self.chains[index]
+        links = []
+        for step, end in ((-1, a), (1, b)):
+            walk = []
+            i = position + step
+            while 0 <= i < len(chain):
+                walk.append(chain[i])
+                if chain[i] in stops:
+                    break
+                i += step
+            else:
+                walk.append(end)
+            target = walk[-1]
+            back = walk[-2::-1] + [cell]
+            links.append((target, walk, back))
+        return links
+
+
+class RoadGraphDStar(TrafficAwareDStar):
+    """`RoadGraph` üzerinde planlayan trafik farkındalıklı D* Lite.
+
+    Arama yalnızca graf düğümlerini genişletir; kenar maliyetleri şerit
+    zincirlerinin toplam dinamik maliyetidir. Zincir içindeki başlangıç ve
+    hedef hücreleri zincirin uçlarına geçici kenarlarla bağlanır. Hücre yolu
+    yalnızca `extract_path` sırasında zincirler açılarak üretilir. Düğümler
+    seyrek olduğundan her zaman tembel depolama kullanılır. Yollar graf
+    üzerinde optimaldir, hücre grafına göre farkı `RoadGraph` belgeler.
+    """
+
+    def __init__(self, traffic_env, road_graph: Optional[RoadGraph] = None,
+                 heuristic_weight: float = 1.2, queue: str = 'lazy', landmarks: int = 0):
+        self.graph = road_graph if road_graph is not None else RoadGraph(traffic_env)
+        self._temp_edges: Dict[Tuple[int, int], List[int]] = {}
+        self._temp_costs: Dict[Tuple[int, int], float] = {}
+        self._temp_neighbors: Dict[int, List[int]] = {}
+        self._attached = {}  # geçici düğüm -> eklenen kenar anahtarları
+        super().__init__(traffic_env, heuristic_weight=heuristic_weight, storage='lazy',
+                         queue=queue, landmarks=landmarks)
+
+    def _node_id(self, node: Node) -> int:
+        return node.y * self.width + node.x
+
+    def get_neighbors(self, node: Node) -> List[Node]:
+        """Graf komşuları (geçici uç kenarları dahil)"""
+        node_id = node.y * self.width + node.x
+        width = self.width
+        neighbors = []
+        for ids in (self.graph.neighbors.get(node_id, ()), self._temp_neighbors.get(node_id, ())):
+            for neighbor_id in ids:
+                y, x = divmod(neighbor_id, width)
+                neighbors.append(self.get_node(x, y))
+        return neighbors
+
+    def get_cost(self, node1: Node, node2: Node) -> float:
+        """Graf kenarının güncel toplam maliyeti"""
+        key = (node1.y * self.width + node1.x, node2.y * self.width + node2.x)
+        index = self.graph.edge_index.get(key)
+        if index is not None:
+            return float(self.graph.costs[index])
+        return self._temp_costs.get(key, INF)
+
+    def _edge_cells(self, source: int, target: int) -> List[int]:
+        cells = self.graph.edge_path(source, target)
+        return cells if cells is not None else self._temp_edges[(source, target)]
+
+    def _attach(self, cell: int, outgoing: bool, stops=()):
+        """Zincir içindeki hücreyi uçlarına bağla (başlangıç için giden,
+        hedef için gelen kenarlarla)"""
+        if self.graph.is_node.flat[cell] or cell in self._attached:
+            return
+        keys = []
+        for end, walk, back in self.graph.split(cell, stops):
+            key, cells = ((cell, end), walk) if outgoing else ((end, cell), back)
+            self._temp_edges[key] = cells
+            self._temp_costs[key] = self.graph.path_cost(cells)
+            self._temp_neighbors.setdefault(cell, []).append(end)
+            self._temp_neighbors.setdefault(end, []).append(cell)
+            keys.append(key)
+        self._attached[cell] = keys
+
+    def _detach(self, cell: int):
+        """Geçici düğümün kenarlarını kaldır"""
+        for key in self._attached.pop(cell, ()):
+            self._temp_edges.pop(key, None)
+            self._temp_costs.pop(key, None)
+            for a, b in (key, key[::-1]):
+                neighbors = self._temp_neighbors.get(a)
+                if neighbors and b in neighbors:
+                    neighbors.remove(b)
+                    if not neighbors:
+                        del self._temp_neighbors[a]
+
+    def initialize_search(self, start: Tuple[int, int], goal: Tuple[int, int]):
+        """Aramayı başlat; zincir içindeki başlangıç ve hedefi bağla"""
+        for cell in list(self._attached):
+            self._detach(cell)
+        goal_id = goal[1] * self.width + goal[0]
+        start_id = start[1] * self.width + start[0]
+        self._attach(goal_id, outgoing=False)
+        if start_id != goal_id:
+            self._attach(start_id, outgoing=True, stops={goal_id})
+        super().initialize_search(start, goal)
+
+    def replan_path(self, new_start: Optional[Tuple[int, int]] = None,
+                    max_expansions: Optional[int] = None,
+                    deadline: Optional[float] = None) -> List[Tuple[int, int]]:
+        """Başlangıç zincir içine taşındıysa geçici kenarları yenile"""
+        if new_start:
+            old_id = self._node_id(self.start)
+            new_id = new_start[1] * self.width + new_start[0]
+            goal_id = self._node_id(self.goal)
+            if new_id != old_id:
+                if old_id != goal_id:
+                    self._detach(old_id)
+                self._attach(new_id, outgoing=True, stops={goal_id})
+                self.start = self.get_node(new_start[0], new_start[1])
+                self._advance_start()
+                if self.start != self.goal:
+                    self.update_vertex(self.start)
+        return super().replan_path(new_start, max_expansions, deadline)
+
+    def extract_path(self) -> List[Tuple[int, int]]:
+        """Düğüm yolunu çıkar ve zincirleri hücrelere aç"""
+        node_path = super().extract_path()
+        if len(node_path) < 2:
+            return node_path
+        width = self.width
+        path = [node_path[0]]
+        for (ax, ay), (bx, by) in zip(node_path, node_path[1:]):
+            for cell in self._edge_cells(ay * width + ax, by * width + bx):
+                path.append((cell % width, cell // width))
+        return path
+
+    def _record_dynamic_costs(self):
+        """Kenar maliyetlerini planlayıcının göreceği değerlere yenile"""
+        self.graph.refresh_costs()
+        self._refresh_temp_costs()
+
+    def _refresh_temp_costs(self) -> List[Tuple[int, int]]:
+        changed = []
+        for key, cells in self._temp_edges.items():
+            cost = self.graph.path_cost(cells)
+            if cost != self._temp_costs[key]:
+                self._temp_costs[key] = cost
+                changed.append(key)
+        return changed
+
+    def _update_dynamic_costs(self):
+        """Değişen kenarların kaynak düğümlerini güncelle"""
+        changed = self.graph.refresh_costs()
+        sources = set(self.graph.edge_sources[changed].tolist())
+        sources.update(source for source, _ in self._refresh_temp_costs())
+        if not sources:
+            return
+        self.stats['replanning_count'] += 1
+        self._advance_start()
+        width = self.width
+        for source in sources:
+            y, x = divmod(source, width)
+            node = self.get_node(x, y)
+            if node != self.goal:
+                self.update_vertex(node)
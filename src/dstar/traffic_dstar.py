@@ -1,94 +1,56 @@
-from src.dstar.dstar_lite import DStarLite, Node
-from src.environment.traffic_environment import TrafficEnvironment
+from src.dstar.dstar_lite import DStarLite
+from src.dstar.landmarks import LandmarkHeuristic
+from src.dstar.providers import TrafficProvider
+from src.environment.traffic_environment import TrafficEnvironment, RoadType
 import time
 import numpy as np
 from typing import List, Tuple, Dict, Optional
 
 class TrafficAwareDStar(DStarLite):
-    """Trafik farkındalıklı D* Lite"""
+    """Trafik farkındalıklı D* Lite
     
-    def __init__(self, traffic_env: TrafficEnvironment, heuristic_weight: float = 1.2):
+    `DStarLite` çekirdeğinin `TrafficProvider` ile kurulmuş hâlidir: yol
+    hücreleri arasında 8 komşuluk, dinamik maliyet ve hibrit heuristik.
+    ``landmarks > 0`` ise hibrit heuristik yerine `LandmarkHeuristic` ALT alt
+    sınırı kullanılır; ``heuristic_weight=1.0`` ile yollar optimal kalır.
+    
+    ``engine='optimized'`` (dizi deposu gerekir) maliyetleri bir
+    `TrafficAdjacency` tablosuna derler. Tablo planlayıcının gördüğü
+    maliyetleri tutar: aramanın başında ortamdan yeniden kurulur ve
+    `update_costs` ile raporlanan hücreler yerinde yamalanır. Temel motor
+    maliyetleri her sorguda ortamdan okur.
+    """
+    
+    TRAFFIC_DIRECTIONS = TrafficProvider.DIRECTIONS
+    
+    def __init__(self, traffic_env: TrafficEnvironment, heuristic_weight: float = 1.2,
+                 storage: str = 'object', queue: str = 'lazy', landmarks: int = 0,
+                 engine: str = 'basic'):
+        if landmarks < 0:
+            raise ValueError("Landmark sayısı negatif olamaz")
         self.traffic_env = traffic_env
-        self.width = traffic_env.width
-        self.height = traffic_env.height
-        self.heuristic_weight = heuristic_weight
-        
-        # Node haritası
-        self.nodes = {}
-        self.initialize_nodes()
-        
-        # Priority queue
-        from src.utils.data_structures import PriorityQueue
-        self.open_list = PriorityQueue()
-        
-        # Planlama parametreleri
-        self.start = None
-        self.goal = None
-        self.last_start = None
+        self.landmark_heuristic = LandmarkHeuristic(traffic_env, landmarks) if landmarks else None
+        # Derlenmiş tablo yalnızca optimize motorla kurulur; temel motor
+        # sürekli değişen maliyetleri doğrudan ortamdan okur
+        super().__init__(None, heuristic_weight, storage=storage,
+                         compiled_adjacency=engine == 'optimized', queue=queue, engine=engine,
+                         provider=TrafficProvider(traffic_env, self.landmark_heuristic))
+        
+        # Dizi ve tembel modlarda hücre başına son dinamik maliyet
+        # (düğüm nesnesi olmadığından ya da aramalar arasında bırakıldığından)
+        self._last_cost_grid = (np.full((self.height, self.width), np.nan)
+                                if storage != 'object' else None)
         
         # Trafik güncellemesi
         self.last_traffic_update = 0.0
         self.traffic_update_interval = 1.0  # saniye
         
         # Gelişmiş istatistikler
-        self.stats = {
-            'nodes_expanded': 0,
-            'replanning_count': 0,
-            'total_planning_time': 0.0,
+        self.stats.update({
             'traffic_updates': 0,
             'average_cost': 0.0,
             'path_safety_score': 0.0
-        }
-    
-    def get_neighbors(self, node: Node) -> List[Node]:
-        """Trafik farkındalıklı komşu bulma"""
-        neighbors = []
-        # 8 yönlü hareket + köşegen öncelik
-        directions = [
-            (-1, 0), (1, 0), (0, -1), (0, 1),    # Düz yönler
-            (-1, -1), (-1, 1), (1, -1), (1, 1)   # Köşegen yönler
-        ]
-        
-        for dx, dy in directions:
-            nx, ny = node.x + dx, node.y + dy
-            
-            if self.traffic_env.is_road(nx, ny):
-                neighbors.append(self.get_node(nx, ny))
-        
-        return neighbors
-    
-    def get_cost(self, node1: Node, node2: Node) -> float:
-        """Trafik farkındalıklı maliyet hesaplama"""
-        # Dinamik maliyet al
-        dynamic_cost = self.traffic_env.get_dynamic_cost(node2.x, node2.y)
-        
-        if dynamic_cost == float('inf'):
-            return float('inf')
-        
-        # Mesafe maliyeti
-        dx = abs(node1.x - node2.x)
-        dy = abs(node1.y - node2.y)
-        
-        if dx == 1 and dy == 1:  # Diagonal
-            distance_cost = np.sqrt(2)
-        else:  # Düz hareket
-            distance_cost = 1.0
-        
-        return distance_cost * dynamic_cost
-    
-    def heuristic(self, node1: Node, node2: Node) -> float:
-        """Gelişmiş heuristik - Manhattan + Euclidean hibrit"""
-        dx = abs(node1.x - node2.x)
-        dy = abs(node1.y - node2.y)
-        
-        # Hibrit heuristik: Manhattan + Euclidean
-        manhattan = dx + dy
-        euclidean = np.sqrt(dx*dx + dy*dy)
-        
-        # Trafik yoğunluğuna göre heuristik ağırlık ayarlama
-        traffic_factor = 1.0 + self.traffic_env.traffic_grid[node1.y, node1.x] * 0.5
-        
-        return self.heuristic_weight * (0.7 * manhattan + 0.3 * euclidean) * traffic_factor
+        })
     
     def plan_path_with_traffic(self, start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
         """Trafik farkındalıklı yol planlama"""
@@ -110,6 +72,25 @@ class TrafficAwareDStar(DStarLite):
         
         return path
     
+    def plan_to_nearest_parking(self, start: Tuple[int, int],
+                                offsets: Optional[Dict[Tuple[int, int], float]] = None):
+        """Tek aramada en ucuz ulaşılabilir otopark hücresini bul.
+        
+        Hedefler ``parking_areas`` içindeki otopark hücreleridir; ``offsets``
+        ile hücre başına ek maliyet (ör. ücret, doluluk) verilebilir.
+        (hedef, yol) döndürür.
+        """
+        parking_value = RoadType.PARKING_LOT.value
+        goals = {}
+        for x1, y1, x2, y2 in self.traffic_env.parking_areas:
+            for y in range(y1, min(y2, self.height)):
+                for x in range(x1, min(x2, self.width)):
+                    if self.traffic_env.road_grid[y, x] == parking_value:
+                        goals[(x, y)] = 0.0
+        if offsets:
+            goals.update(offsets)
+        return self.plan_path_multi_goal(start, goals)
+    
     def replan_with_traffic_update(self, dt: float = 0.1) -> List[Tuple[int, int]]:
         """Trafik güncellemesi ile yeniden planlama"""
         current_time = time.time()
@@ -125,28 +106,75 @@ class TrafficAwareDStar(DStarLite):
         
         return self.replan_path()
     
+    def initialize_search(self, start: Tuple[int, int], goal: Tuple[int, int]):
+        """Arama sürecini başlat ve o anki dinamik maliyetleri kaydet"""
+        super().initialize_search(start, goal)
+        self._record_dynamic_costs()
+    
+    def update_costs(self, cell_ids, old_costs, new_costs,
+                     max_expansions: Optional[int] = None,
+                     deadline: Optional[float] = None):
+        """`DStarLite.update_costs`; derlenmiş tablo varsa önce yeni maliyetler yazılır"""
+        if self.adjacency is not None:
+            self.adjacency.set_cell_costs(cell_ids, new_costs)
+        return super().update_costs(cell_ids, old_costs, new_costs, max_expansions, deadline)
+    
+    def _record_dynamic_costs(self):
+        """Planlayıcının gördüğü maliyetleri `_update_dynamic_costs` için sakla.
+        
+        Böylece planlamadan sonraki ilk trafik güncellemesi de eski/yeni
+        maliyet farkı olarak raporlanır. Derlenmiş tablo da bu maliyetlerle
+        yeniden kurulur.
+        """
+        costs = self.provider.cell_cost_grid()
+        if self.adjacency is not None:
+            self.adjacency.load(costs)
+        road = np.isfinite(costs)
+        if self._last_cost_grid is not None:
+            self._last_cost_grid[road] = costs[road]
+            return
+        ys, xs = np.nonzero(road)
+        for x, y, cost in zip(xs.tolist(), ys.tolist(), costs[ys, xs].tolist()):
+            self.get_node(x, y).last_cost = cost
+    
     def _update_dynamic_costs(self):
         """Dinamik maliyetlerde değişiklik varsa güncelle"""
-        changed_cells = []
-        
-        # Tüm yol hücrelerini kontrol et (optimizasyon için sadece değişenler)
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.traffic_env.is_road(x, y):
-                    # Eski maliyet ile yeni maliyeti karşılaştır
-                    current_cost = self.traffic_env.get_dynamic_cost(x, y)
-                    node = self.get_node(x, y)
-                    
-                    # Önemli maliyet değişikliği varsa güncelle
-                    if hasattr(node, 'last_cost'):
-                        cost_change = abs(current_cost - node.last_cost)
-                        if cost_change > 0.5:  # %50'den fazla değişim
-                            changed_cells.append((x, y, False))  # False = cost change
-                    
-                    node.last_cost = current_cost
-        
-        if changed_cells:
-            self.update_obstacles(changed_cells)
+        # Tüm yol hücrelerinin maliyeti tek vektörel geçişte okunur. Son
+        # maliyet yalnızca raporlanınca güncellenir: update_costs'a verilen
+        # eski maliyet planlayıcının gördüğü değerdir, yavaş kaymalar da birikip
+        # eşiği aşınca raporlanır.
+        current = self.provider.cell_cost_grid()
+        road = np.isfinite(current)
+        
+        if self._last_cost_grid is not None:
+            # Son maliyetler ayrı bir grid'de tutulur
+            last = self._last_cost_grid
+            unseen = road & np.isnan(last)
+            last[unseen] = current[unseen]
+            cell_ids = np.flatnonzero(road & (np.abs(current - last) > 0.5))
+            old_costs = last.flat[cell_ids]
+            new_costs = current.flat[cell_ids]
+            last.flat[cell_ids] = new_costs
+            if len(cell_ids):
+                self.update_costs(cell_ids, old_costs, new_costs)
+            return
+        
+        cell_ids, old_costs, new_costs = [], [], []
+        ys, xs = np.nonzero(road)
+        for x, y, current_cost in zip(xs.tolist(), ys.tolist(), current[ys, xs].tolist()):
+            node = self.get_node(x, y)
+            
+            # Önemli maliyet değişikliği varsa güncelle
+            if node.last_cost is None:
+                node.last_cost = current_cost
+            elif abs(current_cost - node.last_cost) > 0.5:  # %50'den fazla değişim
+                cell_ids.append(y * self.width + x)
+                old_costs.append(node.last_cost)
+                new_costs.append(current_cost)
+                node.last_cost = current_cost
+        
+        if cell_ids:
+            self.update_costs(cell_ids, old_costs, new_costs)
     
     def _analyze_path_quality(self, path: List[Tuple[int, int]]):
         """Yol kalitesi analizi"""
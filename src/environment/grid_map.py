@@ -1,10 +1,14 @@
 import numpy as np
 import random
+import weakref
 from typing import List, Tuple, Optional
 
 class GridMap:
     """Grid tabanlı harita sınıfı"""
     
+    # Bölge sürüm sayaçlarının karo kenarı (hücre)
+    TILE_SIZE = 16
+    
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
@@ -15,6 +19,44 @@ class GridMap:
         self.FREE = 0
         self.OBSTACLE = 1
         self.ROUGH_TERRAIN = 2
+        
+        # Değişiklik bildirimi (derlenmiş komşuluk tabloları vb. için)
+        self.version = 0
+        self._change_listeners = []
+        # Karo başına sürüm: değişiklik bildirimi dokunduğu karoları artırır
+        tile = self.TILE_SIZE
+        self.tile_versions = np.zeros(((height + tile - 1) // tile, (width + tile - 1) // tile),
+                                      dtype=np.int64)
+    
+    def add_change_listener(self, callback):
+        """Hücre değişikliklerinde callback(x1, y1, x2, y2) çağrılır.
+        
+        Bağlı metotlar zayıf referansla tutulur; dinleyici nesne silinince
+        kayıt kendiliğinden düşer.
+        """
+        self._change_listeners.append(weakref.WeakMethod(callback))
+    
+    def remove_change_listener(self, callback):
+        """Dinleyici kaydını sil"""
+        self._change_listeners = [ref for ref in self._change_listeners
+                                  if ref() is not None and ref() != callback]
+    
+    def _notify_change(self, x1: int, y1: int, x2: int, y2: int):
+        """[x1, x2] x [y1, y2] dikdörtgenindeki hücrelerin değiştiğini bildir"""
+        x1, y1 = max(0, x1), max(0, y1)
+        x2, y2 = min(self.width - 1, x2), min(self.height - 1, y2)
+        if x1 > x2 or y1 > y2:
+            return
+        self.version += 1
+        tile = self.TILE_SIZE
+        self.tile_versions[y1 // tile:y2 // tile + 1, x1 // tile:x2 // tile + 1] += 1
+        alive = []
+        for ref in self._change_listeners:
+            callback = ref()
+            if callback is not None:
+                callback(x1, y1, x2, y2)
+                alive.append(ref)
+        self._change_listeners = alive
     
     def is_valid_cell(self, x: int, y: int) -> bool:
         """Hücre geçerli mi kontrolü"""
@@ -30,6 +72,7 @@ class GridMap:
         """Engel ayarla"""
         if self.is_valid_cell(x, y):
             self.grid[y, x] = self.OBSTACLE if is_obstacle else self.FREE
+            self._notify_change(x, y, x, y)
     
     def add_obstacle(self, x1: int, y1: int, x2: int, y2: int):
         """Dikdörtgen engel ekle"""
@@ -39,6 +82,7 @@ class GridMap:
         for y in range(max(0, y1), min(self.height, y2 + 1)):
             for x in range(max(0, x1), min(self.width, x2 + 1)):
                 self.grid[y, x] = self.OBSTACLE
+        self._notify_change(x1, y1, x2, y2)
     
     def add_circular_obstacle(self, center_x: int, center_y: int, radius: int):
         """Dairesel engel ekle"""
@@ -48,6 +92,8 @@ class GridMap:
                           min(self.width, center_x + radius + 1)):
                 if ((x - center_x) ** 2 + (y - center_y) ** 2) <= radius ** 2:
                     self.grid[y, x] = self.OBSTACLE
+        self._notify_change(center_x - radius, center_y - radius,
+                            center_x + radius, center_y + radius)
     
     def add_random_obstacles(self, obstacle_ratio: float = 0.2):
         """Rastgele engeller ekle"""
@@ -58,6 +104,7 @@ class GridMap:
             x = random.randint(0, self.width - 1)
             y = random.randint(0, self.height - 1)
             self.grid[y, x] = self.OBSTACLE
+        self._notify_change(0, 0, self.width - 1, self.height - 1)
     
     def set_terrain_cost(self, x: int, y: int, cost: float):
         """Arazi maliyeti ayarla"""
@@ -65,12 +112,14 @@ class GridMap:
             self.terrain_costs[y, x] = cost
             if cost > 1.0:
                 self.grid[y, x] = self.ROUGH_TERRAIN
+            self._notify_change(x, y, x, y)
     
     def get_terrain_cost(self, x: int, y: int) -> float:
         """Arazi maliyetini getir"""
         if not self.is_valid_cell(x, y):
             return float('inf')
-        return self.terrain_costs[y, x]
+        # float32 skaler yol maliyetlerini float32'de biriktirmesin
+        return float(self.terrain_costs[y, x])
     
     def add_rough_terrain_area(self, x1: int, y1: int, x2: int, y2: int, cost: float = 3.0):
         """Zor arazi alanı ekle"""
@@ -82,6 +131,7 @@ class GridMap:
                 if self.grid[y, x] != self.OBSTACLE:
                     self.grid[y, x] = self.ROUGH_TERRAIN
                     self.terrain_costs[y, x] = cost
+        self._notify_change(x1, y1, x2, y2)
     
     def clear_area(self, x1: int, y1: int, x2: int, y2: int):
         """Alanı temizle"""
@@ -92,6 +142,7 @@ class GridMap:
             for x in range(max(0, x1), min(self.width, x2 + 1)):
                 self.grid[y, x] = self.FREE
                 self.terrain_costs[y, x] = 1.0
+        self._notify_change(x1, y1, x2, y2)
     
     def get_neighbors_8(self, x: int, y: int) -> List[Tuple[int, int]]:
         """8-bağlantılı komşuları getir"""
@@ -38,6 +38,17 @@ class MovingVehicle:
 class TrafficEnvironment:
     """Trafik ortamı simülatörü"""
     
+    # Yol tipine göre temel maliyet (listede olmayan tipler 2.0)
+    ROAD_BASE_COSTS = {
+        RoadType.HIGHWAY.value: 1.0,
+        RoadType.MAIN_STREET.value: 1.2,
+        RoadType.STREET.value: 1.5,
+        RoadType.NARROW_STREET.value: 2.0,
+        RoadType.PARKING_LOT.value: 3.0,
+        RoadType.INTERSECTION.value: 2.5,
+        RoadType.ROUNDABOUT.value: 2.0
+    }
+    
     def __init__(self, width: int = 200, height: int = 150):
         self.width = width
         self.height = height
@@ -410,26 +421,59 @@ class TrafficEnvironment:
             return float('inf')
         
         # Temel maliyet (yol tipine göre)
-        base_cost = {
-            RoadType.HIGHWAY.value: 1.0,
-            RoadType.MAIN_STREET.value: 1.2,
-            RoadType.STREET.value: 1.5,
-            RoadType.NARROW_STREET.value: 2.0,
-            RoadType.PARKING_LOT.value: 3.0,
-            RoadType.INTERSECTION.value: 2.5,
-            RoadType.ROUNDABOUT.value: 2.0
-        }.get(self.road_grid[y, x], 2.0)
-        
-        # Trafik yoğunluğu maliyeti
-        traffic_cost = 1.0 + self.traffic_grid[y, x] * 2.0
+        base_cost = self.ROAD_BASE_COSTS.get(self.road_grid[y, x], 2.0)
+        
+        # Trafik yoğunluğu maliyeti (float32 grid değerleri float64'e çevrilir;
+        # sonuç NumPy'ın tür yükseltme kurallarından bağımsız olur)
+        traffic_cost = 1.0 + float(self.traffic_grid[y, x]) * 2.0
         
         # Trafik ışığı maliyeti
         light_cost = self._get_traffic_light_cost(x, y)
         
         # Hız limiti maliyeti (düşük hız = yüksek maliyet)
-        speed_factor = 50.0 / max(self.speed_limit_grid[y, x], 10.0)
+        speed_factor = 50.0 / max(float(self.speed_limit_grid[y, x]), 10.0)
         
-        return base_cost * traffic_cost * light_cost * speed_factor
+        return float(base_cost * traffic_cost * light_cost * speed_factor)
+    
+    def free_flow_cost_grid(self) -> np.ndarray:
+        """Trafiksiz ve ışıksız (serbest akış) hücre maliyetleri, (height, width).
+        
+        Trafik ve ışık çarpanları 1'den küçük olamadığından her hücrede
+        `get_dynamic_cost`'un alt sınırıdır. Yol olmayan hücreler inf'tir.
+        """
+        lookup = np.full(256, 2.0)
+        for road_type, cost in self.ROAD_BASE_COSTS.items():
+            lookup[road_type] = cost
+        base_cost = lookup[self.road_grid.astype(np.uint8)]
+        speed_factor = 50.0 / np.maximum(self.speed_limit_grid.astype(np.float64), 10.0)
+        road = (self.road_grid > 0) & (self.building_grid == 0)
+        return np.where(road, base_cost * speed_factor, np.inf)
+    
+    def dynamic_cost_grid(self) -> np.ndarray:
+        """Tüm hücrelerin `get_dynamic_cost` değeri, tek vektörel geçişte.
+        
+        Hesap `get_dynamic_cost` ile aynı sırada float64'te yapılır; değerler
+        NumPy 1.x ve 2.x'te hücre hücre çağrıyla birebir aynıdır. Yol olmayan
+        hücreler inf'tir.
+        """
+        lookup = np.full(256, 2.0)
+        for road_type, cost in self.ROAD_BASE_COSTS.items():
+            lookup[road_type] = cost
+        base_cost = lookup[self.road_grid.astype(np.uint8)]
+        traffic_cost = 1.0 + self.traffic_grid.astype(np.float64) * 2.0
+        
+        # İlk kırmızı/sarı ışık kazanır: ışıklar ters sırada yazılır
+        light_cost = np.ones((self.height, self.width))
+        ys, xs = np.mgrid[0:self.height, 0:self.width]
+        for light in reversed(self.traffic_lights):
+            if light.state == "red" or light.state == "yellow":
+                near = np.abs(xs - light.x) + np.abs(ys - light.y) <= 3
+                light_cost[near] = 5.0 if light.state == "red" else 2.0
+        
+        speed_factor = 50.0 / np.maximum(self.speed_limit_grid.astype(np.float64), 10.0)
+        cost = ((base_cost * traffic_cost) * light_cost) * speed_factor
+        road = (self.road_grid > 0) & (self.building_grid == 0)
+        return np.where(road, cost, np.inf)
     
     def _get_traffic_light_cost(self, x: int, y: int) -> float:
         """Trafik ışığı maliyeti"""
@@ -1,3 +1,3 @@
-from .data_structures import PriorityQueue
+from .data_structures import PriorityQueue, IndexedPriorityQueue, QUEUE_TYPES
 
-__all__ = ['PriorityQueue']
\ No newline at end of file
+__all__ = ['PriorityQueue', 'IndexedPriorityQueue', 'QUEUE_TYPES']
\ No newline at end of file
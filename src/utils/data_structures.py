@@ -53,8 +53,143 @@ class PriorityQueue:
         """Boş mu kontrol et"""
         return not bool(self.entry_finder)
     
+    def items(self) -> List[Any]:
+        """Kuyruktaki canlı öğeler (sırasız)"""
+        return list(self.entry_finder)
+    
     def clear(self):
         """Temizle"""
         self.elements.clear()
         self.entry_finder.clear()
-        self.counter = 0
\ No newline at end of file
+        self.counter = 0
+
+class IndexedPriorityQueue:
+    """Konum haritalı d'li yığın (varsayılan ikili) priority queue.
+
+    `PriorityQueue` ile aynı arayüze sahiptir. Var olan bir öğe yeniden
+    eklendiğinde girdisi yığında yerinde güncellenir (decrease/increase-key),
+    `remove` girdiyi gerçekten siler. Böylece yığında silinmiş işaretli girdi
+    birikmez ve boyut her zaman canlı öğe sayısına eşittir.
+    Eşit önceliklerde ekleme sırası korunur (FIFO), bu yüzden `PriorityQueue`
+    ile aynı pop sırasını verir.
+    """
+    
+    def __init__(self, arity: int = 2):
+        if arity < 2:
+            raise ValueError("arity en az 2 olmalı")
+        self.arity = arity
+        self.heap = []  # [priority, count, item] girdileri
+        self.position = {}  # item -> yığın indeksi
+        self.counter = 0
+    
+    def __len__(self) -> int:
+        return len(self.heap)
+    
+    def _sift_up(self, index: int):
+        heap = self.heap
+        position = self.position
+        entry = heap[index]
+        while index > 0:
+            parent_index = (index - 1) // self.arity
+            parent = heap[parent_index]
+            if entry < parent:
+                heap[index] = parent
+                position[parent[2]] = index
+                index = parent_index
+            else:
+                break
+        heap[index] = entry
+        position[entry[2]] = index
+    
+    def _sift_down(self, index: int):
+        heap = self.heap
+        position = self.position
+        size = len(heap)
+        entry = heap[index]
+        while True:
+            first_child = index * self.arity + 1
+            if first_child >= size:
+                break
+            best = first_child
+            for child in range(first_child + 1, min(first_child + self.arity, size)):
+                if heap[child] < heap[best]:
+                    best = child
+            if heap[best] < entry:
+                heap[index] = heap[best]
+                position[heap[index][2]] = index
+                index = best
+            else:
+                break
+        heap[index] = entry
+        position[entry[2]] = index
+    
+    def insert(self, item: Any, priority: Tuple[float, float]):
+        """Öğe ekle; varsa önceliğini yerinde güncelle"""
+        entry = [priority, self.counter, item]
+        self.counter += 1
+        index = self.position.get(item)
+        if index is None:
+            self.heap.append(entry)
+            self._sift_up(len(self.heap) - 1)
+            return
+        old_entry = self.heap[index]
+        self.heap[index] = entry
+        if entry < old_entry:
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
+    
+    update = insert
+    
+    def remove(self, item: Any):
+        """Öğeyi yığından sil"""
+        index = self.position.pop(item, None)
+        if index is None:
+            return
+        last = self.heap.pop()
+        if index < len(self.heap):
+            self.heap[index] = last
+            self.position[last[2]] = index
+            if index > 0 and last < self.heap[(index - 1) // self.arity]:
+                self._sift_up(index)
+            else:
+                self._sift_down(index)
+    
+    def pop(self) -> Any:
+        """En yüksek öncelikli öğeyi çıkar"""
+        if not self.heap:
+            raise KeyError('pop from empty priority queue')
+        item = self.heap[0][2]
+        self.remove(item)
+        return item
+    
+    def top_key(self) -> Tuple[float, float]:
+        """En üstteki öğenin önceliğini getir"""
+        if self.heap:
+            return self.heap[0][0]
+        return (float('inf'), float('inf'))
+    
+    def contains(self, item: Any) -> bool:
+        """Öğe var mı kontrol et"""
+        return item in self.position
+    
+    def empty(self) -> bool:
+        """Boş mu kontrol et"""
+        return not self.heap
+    
+    def items(self) -> List[Any]:
+        """Kuyruktaki canlı öğeler (sırasız)"""
+        return list(self.position)
+    
+    def clear(self):
+        """Temizle"""
+        self.heap.clear()
+        self.position.clear()
+        self.counter = 0
+
+
+# Planlayıcıların ``queue`` parametresi için seçenekler
+QUEUE_TYPES = {
+    'lazy': PriorityQueue,
+    'indexed': IndexedPriorityQueue,
+}
@@ -4,8 +4,26 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.dstar.dstar_lite import DStarLite, Node
+from src.dstar.dstar_original import DStarLiteOriginal
+from src.dstar.providers import GridProvider, TrafficProvider, entry_cost_table
+from src.dstar.adjacency import GridAdjacency, TrafficAdjacency
+from src.dstar.array_search import DIRECTIONS
+from src.dstar.path_cache import PathCache
+from src.dstar.hierarchical import HierarchicalDStarLite
+from src.dstar.jump_point import JumpPointPlanner
+from src.dstar.bidirectional import BidirectionalAStar, QueryDispatcher
+from src.dstar.landmarks import LandmarkHeuristic, free_flow_cost_table
+from src.dstar.traffic_dstar import TrafficAwareDStar
+from src.dstar.road_graph import RoadGraph, RoadGraphDStar
+from src.dstar.contraction import ContractionHierarchy
+from src.dstar.cost_field import dijkstra_cost_field
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+from src.environment.traffic_environment import TrafficEnvironment
 from src.environment.grid_map import GridMap
 import numpy as np
+import random
+import tempfile
 
 class TestDStarLite(unittest.TestCase):
     """D* Lite algoritması test sınıfı"""
@@ -32,6 +50,18 @@ class TestDStarLite(unittest.TestCase):
         self.assertEqual(node1, node2)
         self.assertNotEqual(node1, node3)
     
+    def test_node_compact_key(self):
+        """Node __dict__ tutmamalı; hash ve eşitlik tamsayı anahtardan gelmeli"""
+        node = Node(np.int64(7), 3)
+        self.assertFalse(hasattr(node, '__dict__'))
+        self.assertEqual(hash(node), node.id)
+        self.assertEqual(node, Node(7, 3))
+        self.assertNotEqual(Node(3, 7), Node(7, 3))
+        self.assertNotEqual(Node(-1, -1), Node(0, 0))
+        self.assertIsNone(node.last_cost)
+        with self.assertRaises(AttributeError):
+            node.extra = 1.0
+    
     def test_heuristic_calculation(self):
         """Heuristik hesaplama testi"""
         node1 = Node(0, 0)
@@ -137,6 +167,46 @@ class TestDStarLite(unittest.TestCase):
             # Yeni yol engelden geçmemeli
             self.assertNotIn(mid_point, path2)
     
+    def test_moving_start_uses_key_modifier(self):
+        """Başlangıç hareket edince km artmalı ve yol taze planla aynı maliyette olmalı"""
+        for y in range(0, 15):
+            self.grid_map.set_obstacle(10, y, True)
+        goal = (18, 2)
+        
+        for storage in ('object', 'array'):
+            planner = DStarLite(self.grid_map, storage=storage)
+            path = planner.plan_path((2, 2), goal)
+            new_start = path[3]
+            path = planner.replan_path(new_start)
+            self.assertGreater(planner.km, 0.0)
+            
+            self.grid_map.set_obstacle(10, 15, True)
+            planner.update_obstacles([(10, 15, True)])
+            replanned = planner.replan_path()
+            fresh = DStarLite(self.grid_map).plan_path(new_start, goal)
+            self.assertEqual(replanned[0], new_start)
+            self.assertAlmostEqual(self._path_cost(replanned), self._path_cost(fresh))
+            self.grid_map.set_obstacle(10, 15, False)
+    
+    def test_batch_update_touches_boundary_once(self):
+        """Kapatılan bloğun yalnızca sınırı ve dış halkası bir kez güncellenmeli"""
+        self.planner.plan_path((2, 2), (17, 17))
+        cells = [(x, y, True) for x in range(5, 15) for y in range(5, 15)]
+        for x, y, blocked in cells:
+            self.grid_map.set_obstacle(x, y, blocked)
+        affected = self.planner._affected_vertices(cells)
+        self.assertEqual(len(affected), len(set(affected)))
+        # 36 sınır hücresi + 44 dış halka hücresi; 64 iç hücre atlanır
+        self.assertEqual(len(affected), 80)
+        
+        self.planner.update_obstacles(cells)
+        fresh = DStarLite(self.grid_map)
+        fresh.plan_path((2, 2), (17, 17))
+        self.assertAlmostEqual(self.planner.get_node(2, 2).g, fresh.get_node(2, 2).g)
+    
+    def _path_cost(self, path):
+        return sum(self.planner.get_cost(Node(*a), Node(*b)) for a, b in zip(path, path[1:]))
+    
     def test_cost_calculation(self):
         """Maliyet hesaplama testi"""
         node1 = Node(0, 0)
@@ -180,6 +250,1189 @@ class TestDStarLite(unittest.TestCase):
         top_key = pq.top_key()
         self.assertEqual(top_key, (5.0, 3.0))
 
+class TestArrayStorage(unittest.TestCase):
+    """Dizi tabanlı düğüm deposu testleri"""
+    
+    def setUp(self):
+        self.grid_map = GridMap(20, 20)
+        for y in range(3, 17):
+            self.grid_map.set_obstacle(10, y, True)
+        self.grid_map.add_rough_terrain_area(4, 4, 6, 8, cost=3.0)
+    
+    def test_store_layout(self):
+        """Depo boyutu ve kimlik dönüşümleri"""
+        planner = DStarLite(self.grid_map, storage='array')
+        self.assertEqual(len(planner.nodes), 400)
+        node_id = planner.get_node(7, 3)
+        self.assertEqual(node_id, 3 * 20 + 7)
+        self.assertEqual(planner.nodes.coords(node_id), (7, 3))
+    
+    def test_same_path_as_object_mode(self):
+        """Dizi modu nesne moduyla aynı yolu bulmalı"""
+        start, goal = (2, 10), (17, 10)
+        object_path = DStarLite(self.grid_map).plan_path(start, goal)
+        array_path = DStarLite(self.grid_map, storage='array').plan_path(start, goal)
+        self.assertEqual(array_path, object_path)
+    
+    def test_array_replanning(self):
+        """Dizi modunda engel güncellemesi"""
+        planner = DStarLite(self.grid_map, storage='array')
+        path = planner.plan_path((2, 10), (17, 10))
+        blocked = path[len(path) // 2]
+        self.grid_map.set_obstacle(blocked[0], blocked[1], True)
+        planner.update_obstacles([(blocked[0], blocked[1], True)])
+        new_path = planner.replan_path()
+        self.assertGreater(len(new_path), 0)
+        self.assertNotIn(blocked, new_path)
+    
+    def test_original_with_array_store(self):
+        """DStarLiteOriginal aynı depoyu kullanabilmeli"""
+        from src.dstar.dstar_original import DStarLiteOriginal
+        start, goal = (2, 10), (17, 10)
+        expected = DStarLiteOriginal(self.grid_map).plan_path(start, goal)
+        planner = DStarLiteOriginal(self.grid_map, storage='array')
+        self.assertEqual(planner.plan_path(start, goal), expected)
+    
+    def test_extraction_reports_stall(self):
+        """Tutarsız g değerlerinde çıkarım döngüye girmeden durmayı bildirmeli"""
+        corridor = GridMap(12, 3)
+        corridor.add_obstacle(0, 0, 11, 0)
+        corridor.add_obstacle(0, 2, 11, 2)
+        for kwargs in ({}, {'storage': 'array'}, {'storage': 'array', 'compiled_adjacency': False}):
+            planner = DStarLite(corridor, **kwargs)
+            path = planner.plan_path((0, 1), (11, 1))
+            self.assertEqual(len(path), 12)
+            self.assertEqual(planner.path_status, 'complete')
+            # Koridorun ortasındaki değeri boz: iniş (6, 1)'den önce kesilmeli
+            node = planner.get_node(6, 1)
+            if planner.array_mode:
+                planner.nodes.g[node] = float('inf')
+            else:
+                node.g = float('inf')
+            self.assertEqual(planner.extract_path(), [(x, 1) for x in range(6)])
+            self.assertEqual(planner.path_status, 'stalled')
+            self.assertIsNone(planner.reached_goal)
+        corridor.set_obstacle(5, 1, True)
+        planner = DStarLite(corridor, storage='array')
+        self.assertEqual(planner.plan_path((0, 1), (11, 1)), [])
+        self.assertEqual(planner.path_status, 'unreachable')
+    
+    def test_invalid_storage(self):
+        """Bilinmeyen depolama modu reddedilmeli"""
+        with self.assertRaises(ValueError):
+            DStarLite(self.grid_map, storage='disk')
+
+class TestSearchReset(unittest.TestCase):
+    """Nesil damgalı O(1) arama sıfırlama testleri"""
+    
+    def setUp(self):
+        self.grid_map = GridMap(25, 25)
+        self.grid_map.add_obstacle(8, 0, 9, 18)
+        self.grid_map.add_obstacle(15, 6, 16, 24)
+        self.queries = [((1, 1), (23, 23)), ((23, 2), (2, 22)),
+                        ((12, 12), (1, 24)), ((1, 1), (23, 23))]
+    
+    def test_reused_planner_matches_fresh_planner(self):
+        """Aynı planlayıcıyla ardışık sorgular taze planlayıcıyla aynı olmalı"""
+        for storage in ('object', 'array'):
+            reused = DStarLite(self.grid_map, storage=storage)
+            for start, goal in self.queries:
+                fresh = DStarLite(self.grid_map, storage=storage)
+                self.assertEqual(reused.plan_path(start, goal),
+                                 fresh.plan_path(start, goal))
+    
+    def test_reset_does_not_touch_all_nodes(self):
+        """Sıfırlama düğümleri tek tek gezmemeli"""
+        planner = DStarLite(self.grid_map)
+        planner.plan_path((1, 1), (5, 5))
+        untouched = planner.nodes[(24, 0)]
+        planner.plan_path((1, 1), (6, 6))
+        self.assertLess(untouched.generation, planner.generation)
+        self.assertEqual(planner.get_node(24, 0).g, float('inf'))
+    
+    def test_lazy_mode_materializes_explored_region(self):
+        """Tembel mod sadece keşfedilen düğümleri oluşturmalı"""
+        from src.dstar.dstar_original import DStarLiteOriginal
+        for planner_class in (DStarLite, DStarLiteOriginal):
+            planner = planner_class(self.grid_map, storage='lazy')
+            self.assertEqual(len(planner.nodes), 0)
+            path = planner.plan_path((1, 1), (6, 5))
+            expected = planner_class(self.grid_map).plan_path((1, 1), (6, 5))
+            self.assertEqual(path, expected)
+            self.assertLess(len(planner.nodes), 25 * 25 // 2)
+            # Yeni arama önceki düğümleri bırakır
+            planner.plan_path((20, 20), (22, 22))
+            self.assertNotIn((1, 1), planner.nodes)
+
+class TestGridAdjacency(unittest.TestCase):
+    """Derlenmiş CSR komşuluk tablosu testleri"""
+    
+    def setUp(self):
+        self.grid_map = GridMap(15, 12)
+        self.grid_map.add_obstacle(5, 2, 6, 8)
+        self.grid_map.add_rough_terrain_area(9, 3, 11, 6, cost=2.5)
+        self.reference = DStarLite(self.grid_map, storage='array', compiled_adjacency=False)
+    
+    def assert_matches_grid_rules(self, adjacency):
+        for node_id in range(self.grid_map.width * self.grid_map.height):
+            expected = sorted((n, self.reference._cost_ids(node_id, n))
+                              for n in self.reference._neighbor_ids(node_id))
+            self.assertEqual(sorted(adjacency.edges(node_id)), expected)
+    
+    def test_tables_follow_neighbor_rules(self):
+        """Tablolar köşe kesme ve arazi kurallarına uymalı"""
+        from src.dstar.adjacency import GridAdjacency
+        adjacency = GridAdjacency(self.grid_map)
+        self.assert_matches_grid_rules(adjacency)
+        # (4, 2) -> (5, 1) diyagonali (5, 2) engelinin köşesini keser
+        self.assertNotIn(self.grid_map.width * 1 + 5,
+                         [n for n, _ in adjacency.edges(self.grid_map.width * 2 + 4)])
+    
+    def test_incremental_patch(self):
+        """Harita değişiklikleri yalnızca etkilenen satırları yamalamalı"""
+        from src.dstar.adjacency import GridAdjacency
+        adjacency = GridAdjacency(self.grid_map)
+        self.grid_map.set_obstacle(12, 10, True)
+        self.grid_map.clear_area(5, 5, 6, 6)
+        self.assertTrue(adjacency.is_dirty())
+        patched = adjacency.sync()
+        self.assertLess(patched, 30)
+        self.assert_matches_grid_rules(adjacency)
+    
+    def test_compiled_planner_matches_object_planner(self):
+        """Derlenmiş tablolarla planlama nesne moduyla aynı yolu bulmalı"""
+        start, goal = (1, 5), (13, 5)
+        compiled = DStarLite(self.grid_map, storage='array')
+        self.assertEqual(compiled.plan_path(start, goal),
+                         DStarLite(self.grid_map).plan_path(start, goal))
+        self.grid_map.add_obstacle(7, 0, 7, 10)
+        compiled.update_obstacles([(7, y, True) for y in range(11)])
+        self.assertEqual(compiled.replan_path(),
+                         DStarLite(self.grid_map).plan_path(start, goal))
+
+class TestIndexedPriorityQueue(unittest.TestCase):
+    """Konum haritalı yığın testleri"""
+    
+    def test_decrease_and_increase_key(self):
+        """Yerinde öncelik güncelleme ve silme"""
+        from src.utils.data_structures import IndexedPriorityQueue
+        pq = IndexedPriorityQueue()
+        for i in range(10):
+            pq.insert(i, (float(i), 0.0))
+        pq.insert(7, (-1.0, 0.0))   # decrease-key
+        pq.insert(0, (20.0, 0.0))   # increase-key
+        pq.remove(3)
+        self.assertEqual(len(pq), 9)
+        self.assertFalse(pq.contains(3))
+        self.assertEqual(pq.top_key(), (-1.0, 0.0))
+        order = [pq.pop() for _ in range(len(pq))]
+        self.assertEqual(order, [7, 1, 2, 4, 5, 6, 8, 9, 0])
+        self.assertTrue(pq.empty())
+        with self.assertRaises(KeyError):
+            pq.pop()
+    
+    def test_matches_lazy_queue_order(self):
+        """Eşit önceliklerde PriorityQueue ile aynı sırayı vermeli"""
+        import random
+        from src.utils.data_structures import PriorityQueue, IndexedPriorityQueue
+        rng = random.Random(7)
+        lazy, indexed = PriorityQueue(), IndexedPriorityQueue(arity=4)
+        for _ in range(3000):
+            item = rng.randrange(50)
+            op = rng.random()
+            if op < 0.5:
+                key = (rng.randrange(5), rng.randrange(3))
+                lazy.insert(item, key)
+                indexed.insert(item, key)
+            elif op < 0.7:
+                lazy.remove(item)
+                indexed.remove(item)
+            elif not lazy.empty():
+                self.assertEqual(lazy.pop(), indexed.pop())
+            self.assertEqual(len(indexed), len(lazy.entry_finder))
+    
+    def test_planner_with_indexed_queue(self):
+        """Planlayıcılar indeksli kuyrukla aynı yolu bulmalı"""
+        grid_map = GridMap(20, 20)
+        grid_map.add_obstacle(8, 2, 9, 16)
+        expected = DStarLite(grid_map).plan_path((2, 10), (17, 10))
+        for storage in ('object', 'array'):
+            planner = DStarLite(grid_map, storage=storage, queue='indexed')
+            self.assertEqual(planner.plan_path((2, 10), (17, 10)), expected)
+
+class TestOptimizedEngine(unittest.TestCase):
+    """Optimize D* Lite motoru testleri"""
+    
+    def test_engine_validation(self):
+        """Optimize motor dizi deposu ve derlenmiş komşuluk ister"""
+        grid_map = GridMap(10, 10)
+        with self.assertRaises(ValueError):
+            DStarLite(grid_map, engine='optimized')
+        with self.assertRaises(ValueError):
+            DStarLite(grid_map, storage='array', compiled_adjacency=False, engine='optimized')
+        with self.assertRaises(ValueError):
+            DStarLite(grid_map, engine='fast')
+    
+    def test_matches_basic_engine(self):
+        """Engel ekleme/kaldırma sonrası temel motorla aynı yolu bulmalı"""
+        rng = np.random.default_rng(3)
+        grid_map = GridMap(25, 25)
+        grid_map.grid[rng.random((25, 25)) < 0.2] = grid_map.OBSTACLE
+        grid_map.terrain_costs[:] = rng.random((25, 25)) * (rng.random((25, 25)) < 0.3)
+        grid_map.clear_area(0, 0, 3, 3)
+        grid_map.clear_area(21, 21, 24, 24)
+        
+        basic = DStarLite(grid_map, storage='array')
+        optimized = DStarLite(grid_map, storage='array', engine='optimized')
+        self.assertEqual(optimized.plan_path((1, 1), (23, 23)), basic.plan_path((1, 1), (23, 23)))
+        for _ in range(10):
+            changed = []
+            for x, y in rng.integers(4, 21, size=(4, 2)).tolist():
+                blocked = not grid_map.is_obstacle(x, y)
+                grid_map.set_obstacle(x, y, blocked)
+                changed.append((x, y, blocked))
+            basic.update_obstacles(changed)
+            optimized.update_obstacles(changed)
+            self.assertAlmostEqual(optimized.nodes.g[optimized.start], basic.nodes.g[basic.start])
+            self.assertEqual(optimized.extract_path(), basic.extract_path())
+
+class TestCostUpdates(unittest.TestCase):
+    """update_costs ile arazi maliyeti değişikliği testleri"""
+    
+    def test_matches_fresh_plan(self):
+        """Artan ve azalan maliyetlerden sonra taze planla aynı maliyet bulunmalı"""
+        rng = np.random.default_rng(5)
+        grid_map = GridMap(20, 20)
+        grid_map.add_obstacle(9, 3, 10, 16)
+        start, goal = (2, 10), (17, 10)
+        planners = [DStarLite(grid_map), DStarLite(grid_map, storage='lazy'),
+                    DStarLite(grid_map, storage='array'),
+                    DStarLite(grid_map, storage='array', engine='optimized')]
+        for planner in planners:
+            planner.plan_path(start, goal)
+        for _ in range(8):
+            cells = rng.choice(400, size=30, replace=False)
+            old_costs = grid_map.terrain_costs.ravel()[cells].copy()
+            new_costs = rng.choice([0.0, 1.0, 4.0], size=30)
+            for node_id, cost in zip(cells.tolist(), new_costs.tolist()):
+                grid_map.set_terrain_cost(node_id % 20, node_id // 20, cost)
+            fresh = DStarLite(grid_map)
+            fresh.plan_path(start, goal)
+            for planner in planners:
+                planner.update_costs(cells, old_costs, new_costs)
+                if planner.array_mode:
+                    g_start = planner.nodes.g[planner.start]
+                else:
+                    g_start = planner.start.g
+                self.assertAlmostEqual(g_start, fresh.start.g)
+    
+    def test_rejects_mismatched_arrays(self):
+        """Uzunluğu farklı ya da harita dışı girdiler reddedilmeli"""
+        planner = DStarLite(GridMap(5, 5))
+        planner.plan_path((0, 0), (4, 4))
+        with self.assertRaises(ValueError):
+            planner.update_costs([1, 2], [1.0], [2.0])
+        with self.assertRaises(ValueError):
+            planner.update_costs([25], [1.0], [2.0])
+
+class TestBudgetedSearch(unittest.TestCase):
+    """Bütçeli ve kaldığı yerden süren arama testleri"""
+    
+    def setUp(self):
+        self.grid_map = GridMap(30, 30)
+        self.grid_map.add_obstacle(14, 0, 15, 24)
+        self.start, self.goal = (2, 2), (27, 2)
+    
+    def test_resumed_search_matches_full_search(self):
+        """Küçük dilimlerle sürdürülen arama tek seferlik aramayla aynı yolu bulmalı"""
+        for kwargs in ({}, {'storage': 'lazy'}, {'storage': 'array'},
+                       {'storage': 'array', 'engine': 'optimized'}):
+            expected = DStarLite(self.grid_map, **kwargs).plan_path(self.start, self.goal)
+            planner = DStarLite(self.grid_map, **kwargs)
+            planner.plan_path(self.start, self.goal, max_expansions=20)
+            self.assertEqual(planner.search_status, 'partial')
+            self.assertTrue(planner.path_tentative)
+            self.assertFalse(planner.is_start_consistent())
+            slices = 1
+            while planner.compute_shortest_path(max_expansions=20) == 'partial':
+                slices += 1
+            self.assertGreater(slices, 5)
+            self.assertTrue(planner.is_start_consistent())
+            self.assertEqual(planner.extract_path(), expected)
+            self.assertFalse(planner.path_tentative)
+    
+    def test_expired_deadline_defers_replanning(self):
+        """Geçmiş bir son an verilirse yeniden planlama sonraki çağrıya kalmalı"""
+        import time
+        planner = DStarLite(self.grid_map, storage='array')
+        planner.plan_path(self.start, self.goal)
+        self.grid_map.add_obstacle(14, 25, 15, 27)
+        cells = [(x, y, True) for x in (14, 15) for y in range(25, 28)]
+        planner.update_obstacles(cells, deadline=time.perf_counter())
+        self.assertEqual(planner.search_status, 'partial')
+        path = planner.replan_path()
+        self.assertFalse(planner.path_tentative)
+        self.assertEqual(path, DStarLite(self.grid_map).plan_path(self.start, self.goal))
+
+class TestAnytimeSearch(unittest.TestCase):
+    """AD* tarzı anytime mod testleri"""
+    
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.grid_map = GridMap(40, 40)
+        self.grid_map.grid[rng.random((40, 40)) < 0.25] = self.grid_map.OBSTACLE
+        self.grid_map.terrain_costs[:] = 1 + 2 * rng.random((40, 40))
+        self.grid_map.clear_area(0, 0, 2, 2)
+        self.grid_map.clear_area(37, 37, 39, 39)
+        self.start, self.goal = (1, 1), (38, 38)
+    
+    def _optimal_cost(self):
+        reference = DStarLite(self.grid_map)
+        reference.plan_path(self.start, self.goal)
+        return reference.start.g
+    
+    def test_paths_respect_bound_and_converge(self):
+        """Her yol ε sınırı içinde kalmalı, ε = 1'de optimum bulunmalı"""
+        optimal = self._optimal_cost()
+        for storage in ('object', 'lazy'):
+            planner = DStarLite(self.grid_map, storage=storage)
+            path, bound = planner.plan_path_anytime(self.start, self.goal, initial_inflation=3.0)
+            bounds = [bound]
+            while bound > 1.0:
+                self.assertLessEqual(planner.start.g, bound * optimal + 1e-9)
+                path, bound = planner.improve_path(0.5)
+                bounds.append(bound)
+            self.assertEqual(bounds, [3.0, 2.5, 2.0, 1.5, 1.0])
+            self.assertAlmostEqual(planner.start.g, optimal)
+            self.assertEqual(path[0], self.start)
+            self.assertEqual(path[-1], self.goal)
+            
+            # Engel değişikliği sonrası aynı ε ile tutarlı kalmalı
+            x, y = path[len(path) // 2]
+            self.grid_map.set_obstacle(x, y, True)
+            planner.update_obstacles([(x, y, True)])
+            self.assertAlmostEqual(planner.start.g, self._optimal_cost())
+            self.grid_map.set_obstacle(x, y, False)
+            
+            # Normal planlama anytime modunu kapatır
+            planner.plan_path(self.start, self.goal)
+            self.assertFalse(planner.anytime)
+            self.assertEqual(planner.heuristic_weight, 1.0)
+    
+    def test_budgeted_first_iteration_has_no_bound(self):
+        """Bütçe ilk iterasyonu bitiremezse ε sınırı inf olmalı"""
+        planner = DStarLite(self.grid_map)
+        path, bound = planner.plan_path_anytime(self.start, self.goal, initial_inflation=2.0,
+                                                max_expansions=5)
+        self.assertEqual(planner.search_status, 'partial')
+        self.assertEqual(bound, float('inf'))
+        
+        # Sürdürülen arama tamamlanınca sınır ε olur
+        path, bound = planner.improve_path(0.5)
+        self.assertEqual(planner.search_status, 'complete')
+        self.assertEqual(bound, 2.0)
+        self.assertLessEqual(planner.start.g, bound * self._optimal_cost() + 1e-9)
+    
+    def test_requires_object_storage(self):
+        """Dizi deposu anytime modunu desteklemez"""
+        planner = DStarLite(self.grid_map, storage='array')
+        with self.assertRaises(ValueError):
+            planner.plan_path_anytime(self.start, self.goal)
+        with self.assertRaises(RuntimeError):
+            DStarLite(self.grid_map).improve_path()
+
+class TestSharedGoalQueries(unittest.TestCase):
+    """Tek hedefe çok başlangıçlı sorgu testleri"""
+    
+    def test_path_from_matches_fresh_plans(self):
+        """Korunan arama ağacı taze planlarla aynı maliyeti daha az genişletmeyle bulmalı"""
+        rng = np.random.default_rng(2)
+        grid_map = GridMap(40, 40)
+        grid_map.grid[rng.random((40, 40)) < 0.2] = grid_map.OBSTACLE
+        grid_map.clear_area(35, 35, 38, 38)
+        goal = (36, 36)
+        starts = [tuple(p) for p in rng.integers(0, 40, size=(15, 2)).tolist()
+                  if not grid_map.is_obstacle(*p)]
+        for storage in ('object', 'array'):
+            planner = DStarLite(grid_map, storage=storage)
+            fresh_expansions = 0
+            for start in starts:
+                path = planner.path_from(start, goal)
+                fresh = DStarLite(grid_map, storage=storage)
+                self.assertEqual(bool(path), bool(fresh.plan_path(start, goal)))
+                # Tutarlı başlangıçta anahtarın ikinci bileşeni g(start)
+                self.assertAlmostEqual(planner.calculate_key(planner.start)[1],
+                                       fresh.calculate_key(fresh.start)[1])
+                fresh_expansions += fresh.stats['nodes_expanded']
+            self.assertLess(planner.stats['nodes_expanded'], fresh_expansions / 2)
+        with self.assertRaises(ValueError):
+            DStarLite(grid_map).path_from((0, 0))
+
+class TestMultiGoalSearch(unittest.TestCase):
+    """Çoklu hedef (en yakın hedef) arama testleri"""
+    
+    def setUp(self):
+        rng = np.random.default_rng(4)
+        self.grid_map = GridMap(30, 30)
+        self.grid_map.grid[rng.random((30, 30)) < 0.15] = self.grid_map.OBSTACLE
+        self.goals = {(27, 3): 4.0, (3, 27): 0.0, (26, 26): 0.0, (15, 2): 12.0}
+        for x, y in self.goals:
+            self.grid_map.set_obstacle(x, y, False)
+        self.start = (8, 8)
+        self.grid_map.set_obstacle(*self.start, False)
+    
+    def _best_single_goal(self):
+        best = (float('inf'), None)
+        for goal, offset in self.goals.items():
+            planner = DStarLite(self.grid_map)
+            planner.plan_path(self.start, goal)
+            best = min(best, (planner.start.g + offset, goal))
+        return best
+    
+    def test_matches_best_single_goal_search(self):
+        """Tek arama, hedef başına ayrı aramaların en iyisini bulmalı"""
+        for kwargs in ({}, {'storage': 'array'}, {'storage': 'array', 'engine': 'optimized'}):
+            planner = DStarLite(self.grid_map, **kwargs)
+            goal, path = planner.plan_path_multi_goal(self.start, self.goals)
+            cost, expected_goal = self._best_single_goal()
+            self.assertEqual(goal, expected_goal)
+            self.assertEqual(path[0], self.start)
+            self.assertEqual(path[-1], goal)
+            self.assertAlmostEqual(planner.calculate_key(planner.start)[1], cost)
+            
+            # En iyi hedefin önü kapanınca artımlı olarak diğer hedefe geçmeli
+            x, y = goal
+            cells = [(cx, cy, True) for cx in range(x - 2, x + 3) for cy in range(y - 2, y + 3)
+                     if (cx, cy) != goal and self.grid_map.is_valid_cell(cx, cy)]
+            for cx, cy, _ in cells:
+                self.grid_map.set_obstacle(cx, cy, True)
+            planner.update_obstacles(cells)
+            path = planner.extract_path()
+            cost, expected_goal = self._best_single_goal()
+            self.assertNotEqual(expected_goal, goal)
+            self.assertEqual(planner.reached_goal, expected_goal)
+            self.assertEqual(path[-1], expected_goal)
+            self.assertAlmostEqual(planner.calculate_key(planner.start)[1], cost)
+            self.setUp()
+
+class TestCostField(unittest.TestCase):
+    """Maliyet alanı dışa aktarımı ve gradyan inişi testleri"""
+    
+    def test_field_and_descent_match_planner(self):
+        """Alan düğüm değerleriyle aynı olmalı, iniş extract_path ile aynı yolu vermeli"""
+        rng = np.random.default_rng(3)
+        grid_map = GridMap(40, 30)
+        grid_map.grid[rng.random((30, 40)) < 0.2] = grid_map.OBSTACLE
+        grid_map.terrain_costs[:] = rng.random((30, 40))
+        grid_map.clear_area(0, 0, 2, 2)
+        grid_map.clear_area(37, 27, 39, 29)
+        fields = []
+        for storage in ('object', 'array'):
+            planner = DStarLite(grid_map, storage=storage)
+            path = planner.plan_path((1, 1), (38, 28))
+            g, rhs = planner.cost_field(with_rhs=True)
+            self.assertEqual(g.shape, (30, 40))
+            self.assertEqual(g[28, 38], 0.0)
+            self.assertTrue(np.isinf(g[grid_map.grid == grid_map.OBSTACLE]).all())
+            self.assertEqual(planner.extract_path_from_field(), path)
+            fields.append(g)
+        np.testing.assert_array_equal(fields[0], fields[1])
+        
+        # Dizi modunda alan depoyla bellek paylaşır; yeni aramadan sonra
+        # tekrar çağrı eski hücreleri sıfırlar
+        self.assertTrue(np.shares_memory(g, planner.nodes.g))
+        planner.plan_path((38, 1), (1, 28))
+        fresh = DStarLite(grid_map, storage='array')
+        fresh.plan_path((38, 1), (1, 28))
+        self.assertTrue(np.shares_memory(planner.cost_field(), g))
+        np.testing.assert_array_equal(g, fresh.cost_field())
+
+class TestPathCache(unittest.TestCase):
+    """Bölge sürümlü LRU yol önbelleği testleri"""
+    
+    def test_unrelated_change_keeps_entry(self):
+        """Aramanın okumadığı karodaki değişiklik isabeti bozmamalı"""
+        grid_map = GridMap(64, 64)
+        cache = PathCache(DStarLite(grid_map, storage='array'))
+        path = cache.plan_path((2, 2), (10, 4))
+        self.assertEqual(cache.plan_path((2, 2), (10, 4)), path)
+        self.assertEqual(cache.stats['hits'], 1)
+        
+        grid_map.set_obstacle(60, 60)
+        self.assertEqual(cache.plan_path((2, 2), (10, 4)), path)
+        self.assertEqual(cache.stats['hits'], 2)
+        self.assertEqual(cache.stats['invalidations'], 0)
+    
+    def test_change_on_path_invalidates(self):
+        """Yolun geçtiği karodaki değişiklik kaydı geçersiz kılmalı"""
+        grid_map = GridMap(64, 64)
+        planner = DStarLite(grid_map)
+        cache = PathCache(planner)
+        path = cache.plan_path((2, 2), (10, 2))
+        grid_map.set_obstacle(*path[len(path) // 2])
+        new_path = cache.plan_path((2, 2), (10, 2))
+        self.assertEqual(cache.stats['invalidations'], 1)
+        self.assertEqual(cache.stats['misses'], 2)
+        self.assertEqual(new_path, DStarLite(grid_map).plan_path((2, 2), (10, 2)))
+        self.assertNotIn(path[len(path) // 2], new_path)
+    
+    def test_lru_eviction(self):
+        """Kapasite aşılınca en eski kullanılan kayıt çıkmalı"""
+        cache = PathCache(DStarLite(GridMap(20, 20)), capacity=2)
+        cache.plan_path((0, 0), (5, 5))
+        cache.plan_path((0, 0), (6, 6))
+        cache.plan_path((0, 0), (5, 5))
+        cache.plan_path((0, 0), (7, 7))
+        self.assertIn(((0, 0), (5, 5)), cache)
+        self.assertNotIn(((0, 0), (6, 6)), cache)
+        self.assertEqual(cache.stats['evictions'], 1)
+        self.assertEqual(len(cache), 2)
+        with self.assertRaises(ValueError):
+            PathCache(DStarLite(GridMap(5, 5)), capacity=0)
+
+class TestHierarchicalPlanner(unittest.TestCase):
+    """Küme tabanlı hiyerarşik D* Lite testleri"""
+    
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.grid_map = GridMap(60, 50)
+        self.grid_map.grid[rng.random((50, 60)) < 0.2] = self.grid_map.OBSTACLE
+        self.grid_map.terrain_costs[:] = rng.random((50, 60))
+        self.grid_map.clear_area(0, 0, 2, 2)
+        self.grid_map.clear_area(57, 47, 59, 49)
+    
+    def path_cost(self, path):
+        """Yolu DStarLite kenar kurallarıyla doğrula ve maliyetini döndür"""
+        reference = DStarLite(self.grid_map)
+        total = 0.0
+        for a, b in zip(path, path[1:]):
+            node_a, node_b = reference.get_node(*a), reference.get_node(*b)
+            self.assertIn(node_b, reference.get_neighbors(node_a))
+            total += reference.get_cost(node_a, node_b)
+        return total
+    
+    def test_path_valid_and_near_optimal(self):
+        """Yol geçerli olmalı ve optimuma yakın olmalı"""
+        planner = HierarchicalDStarLite(self.grid_map, cluster_size=10)
+        path = planner.plan_path((1, 1), (58, 48))
+        self.assertEqual(path[0], (1, 1))
+        self.assertEqual(path[-1], (58, 48))
+        optimal = self.path_cost(DStarLite(self.grid_map).plan_path((1, 1), (58, 48)))
+        cost = self.path_cost(path)
+        self.assertGreaterEqual(cost, optimal - 1e-9)
+        self.assertLess(cost, optimal * 1.2)
+        with self.assertRaises(ValueError):
+            HierarchicalDStarLite(self.grid_map, cluster_size=1)
+    
+    def test_replan_rebuilds_only_affected_clusters(self):
+        """Değişiklik yalnızca ilgili kümeleri yenilemeli, sonuç sıfırdan planla aynı olmalı"""
+        planner = HierarchicalDStarLite(self.grid_map, cluster_size=10)
+        path = planner.plan_path((1, 1), (58, 48))
+        blocked = path[len(path) // 2]
+        self.grid_map.set_obstacle(*blocked)
+        new_path = planner.replan_path(path[3])
+        self.assertLessEqual(planner.stats['clusters_rebuilt'], 4)
+        self.assertNotIn(blocked, new_path)
+        self.assertEqual(new_path[0], path[3])
+        fresh = HierarchicalDStarLite(self.grid_map, cluster_size=10).plan_path(path[3], (58, 48))
+        self.assertAlmostEqual(self.path_cost(new_path), self.path_cost(fresh))
+    
+    def test_enclosed_goal(self):
+        """Kapalı hedef boş yol vermeli, geçit açılınca yol bulunmalı"""
+        grid_map = GridMap(30, 30)
+        grid_map.add_obstacle(18, 18, 22, 18)
+        grid_map.add_obstacle(18, 22, 22, 22)
+        grid_map.add_obstacle(18, 18, 18, 22)
+        grid_map.add_obstacle(22, 18, 22, 22)
+        planner = HierarchicalDStarLite(grid_map, cluster_size=8)
+        self.assertEqual(planner.plan_path((1, 1), (20, 20)), [])
+        grid_map.set_obstacle(20, 18, False)
+        path = planner.replan_path()
+        self.assertEqual(path[-1], (20, 20))
+        self.assertIn((20, 18), path)
+
+class TestJumpPointPlanner(unittest.TestCase):
+    """Jump Point Search planlayıcı testleri"""
+    
+    def make_map(self, seed):
+        rng = np.random.default_rng(seed)
+        grid_map = GridMap(50, 40)
+        grid_map.grid[rng.random((40, 50)) < 0.15] = grid_map.OBSTACLE
+        grid_map.clear_area(0, 0, 1, 1)
+        grid_map.clear_area(48, 38, 49, 39)
+        return grid_map
+    
+    def test_cost_matches_dstar(self):
+        """Yol geçerli olmalı ve maliyeti D* Lite ile aynı olmalı (zor arazi dahil)"""
+        for seed in range(4):
+            grid_map = self.make_map(seed)
+            if seed % 2:
+                grid_map.add_rough_terrain_area(10, 5, 30, 20, cost=2.5)
+            planner = JumpPointPlanner(grid_map)
+            path = planner.plan_path((0, 0), (49, 39))
+            reference = DStarLite(grid_map)
+            reference.plan_path((0, 0), (49, 39))
+            self.assertAlmostEqual(planner.last_cost, reference.start.g)
+            total = 0.0
+            for a, b in zip(path, path[1:]):
+                node_a, node_b = reference.get_node(*a), reference.get_node(*b)
+                self.assertIn(node_b, reference.get_neighbors(node_a))
+                total += reference.get_cost(node_a, node_b)
+            self.assertAlmostEqual(total, planner.last_cost)
+            if not seed % 2:
+                self.assertLess(planner.stats['nodes_expanded'], reference.stats['nodes_expanded'])
+    
+    def test_tables_patch_locally(self):
+        """Engel değişiklikleri yalnızca ilgili satır/sütunları yenilemeli"""
+        grid_map = self.make_map(7)
+        planner = JumpPointPlanner(grid_map)
+        planner.plan_path((0, 0), (49, 39))
+        grid_map.set_obstacle(20, 20)
+        grid_map.add_obstacle(30, 10, 34, 11)
+        grid_map.set_obstacle(5, 5, False)
+        patched = planner.sync()
+        self.assertLess(patched, 40)
+        fresh = JumpPointPlanner(grid_map)
+        for direction, table in fresh.jumps.items():
+            np.testing.assert_array_equal(planner.jumps[direction], table)
+        
+        planner.plan_path((0, 0), (49, 39))
+        reference = DStarLite(grid_map)
+        reference.plan_path((0, 0), (49, 39))
+        self.assertAlmostEqual(planner.last_cost, reference.start.g)
+    
+    def test_unreachable(self):
+        """Ulaşılamayan hedefte boş yol ve sonsuz maliyet"""
+        grid_map = GridMap(20, 20)
+        grid_map.add_obstacle(10, 0, 10, 19)
+        planner = JumpPointPlanner(grid_map)
+        self.assertEqual(planner.plan_path((2, 2), (15, 15)), [])
+        self.assertEqual(planner.last_cost, float('inf'))
+
+class TestWarmStart(unittest.TestCase):
+    """Toplu Dijkstra ile sıcak başlatma testleri"""
+    
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        self.grid_map = GridMap(40, 30)
+        self.grid_map.grid[rng.random((30, 40)) < 0.2] = self.grid_map.OBSTACLE
+        self.grid_map.terrain_costs[:] = rng.random((30, 40))
+        self.grid_map.clear_area(0, 0, 1, 1)
+        self.grid_map.clear_area(38, 28, 39, 29)
+    
+    def test_warm_start_is_consistent(self):
+        """Yüklenen durum tutarlı olmalı ve soğuk aramayla aynı yolu vermeli"""
+        for storage in ('object', 'lazy', 'array'):
+            cold = DStarLite(self.grid_map, storage=storage)
+            warm = DStarLite(self.grid_map, storage=storage)
+            path = cold.plan_path((0, 0), (39, 29))
+            self.assertEqual(warm.plan_path((0, 0), (39, 29), warm_start=True), path)
+            self.assertEqual(warm.stats['nodes_expanded'], 0)
+            self.assertTrue(warm.open_list.empty())
+            
+            g, rhs = warm.cost_field(with_rhs=True)
+            np.testing.assert_array_equal(g, rhs)
+            for x, y in [(5, 5), (20, 10), (39, 0), (12, 27)]:
+                node = warm.get_node(x, y)
+                if node != warm.goal:
+                    before = rhs[y, x]
+                    warm.update_vertex(node)
+                    self.assertEqual(warm.cost_field(with_rhs=True)[1][y, x], before)
+    
+    def test_incremental_updates_after_warm_start(self):
+        """Sıcak başlatma sonrası artımlı yeniden planlama taze planla aynı maliyeti vermeli"""
+        planner = DStarLite(self.grid_map, storage='array', engine='optimized')
+        path = planner.plan_path((0, 0), (39, 29), warm_start=True)
+        changed = []
+        for x, y in path[5:12]:
+            self.grid_map.set_obstacle(x, y)
+            changed.append((x, y, True))
+        planner.update_obstacles(changed)
+        planner.replan_path(path[2])
+        
+        fresh = DStarLite(self.grid_map)
+        fresh.plan_path(path[2], (39, 29))
+        self.assertAlmostEqual(planner.nodes.g[planner.start], fresh.start.g)
+
+class TestLandmarkHeuristic(unittest.TestCase):
+    """Trafik yol ağı için ALT landmark heuristiği testleri"""
+    
+    def setUp(self):
+        random.seed(3)
+        self.env = TrafficEnvironment(80, 60)
+        for _ in range(20):
+            self.env.update_traffic(0.1)
+        ys, xs = np.nonzero((self.env.road_grid > 0) & (self.env.building_grid == 0))
+        self.roads = [(int(x), int(y)) for x, y in zip(xs, ys)]
+    
+    def test_lower_bound_is_admissible(self):
+        """Sınır serbest akış mesafesini aşmamalı"""
+        landmarks = LandmarkHeuristic(self.env, count=6)
+        self.assertEqual(len(landmarks.landmarks), 6)
+        table = free_flow_cost_table(self.env)
+        width = self.env.width
+        rng = random.Random(4)
+        for _ in range(5):
+            gx, gy = rng.choice(self.roads)
+            field = dijkstra_cost_field(table, gy * width + gx)
+            for x, y in rng.sample(self.roads, 50):
+                bound = landmarks.lower_bound(y * width + x, gy * width + gx)
+                self.assertLessEqual(bound, field[y, x] + 1e-9)
+        
+        with self.assertRaises(ValueError):
+            LandmarkHeuristic(self.env, count=0)
+    
+    def test_landmark_planning_is_optimal(self):
+        """Landmark heuristiğiyle yol maliyeti Dijkstra optimumuna eşit olmalı"""
+        rng = random.Random(5)
+        for storage in ('object', 'array'):
+            planner = TrafficAwareDStar(self.env, heuristic_weight=1.0, storage=storage, landmarks=6)
+            table = planner._edge_cost_table()
+            for _ in range(4):
+                start, goal = rng.sample(self.roads, 2)
+                path = planner.plan_path(start, goal)
+                field = dijkstra_cost_field(table, goal[1] * self.env.width + goal[0])
+                if not np.isfinite(field[start[1], start[0]]):
+                    self.assertEqual(path, [])
+                    continue
+                cost = sum(planner.get_cost(planner.get_node(*a), planner.get_node(*b))
+                           for a, b in zip(path, path[1:]))
+                self.assertAlmostEqual(cost, field[start[1], start[0]], places=6)
+    
+    def test_landmarks_reduce_expansions(self):
+        """ALT sınırı sıfır heuristiğe göre genişletmeleri azaltmalı"""
+        rng = random.Random(6)
+        alt = TrafficAwareDStar(self.env, heuristic_weight=1.0, landmarks=6)
+        blind = TrafficAwareDStar(self.env, heuristic_weight=0.0)
+        for _ in range(5):
+            start, goal = rng.sample(self.roads, 2)
+            self.assertEqual(bool(alt.plan_path(start, goal)), bool(blind.plan_path(start, goal)))
+        self.assertLess(alt.stats['nodes_expanded'], blind.stats['nodes_expanded'] / 2)
+    
+    def test_replan_after_moves_and_traffic_changes(self):
+        """Art arda başlangıç hareketi ve trafik değişikliğinden sonra yol optimal kalmalı"""
+        rng = random.Random(7)
+        width = self.env.width
+        checked = 0
+        for storage in ('object', 'array'):
+            planner = TrafficAwareDStar(self.env, heuristic_weight=1.0, storage=storage, landmarks=6)
+            start, goal = rng.sample(self.roads, 2)
+            path = planner.plan_path(start, goal)
+            for _ in range(4):
+                if len(path) < 8:
+                    break
+                # Değişiklikler eşiğin üstünde: planlayıcının gördüğü maliyetler güncel
+                for x, y in path[4:4 + len(path) // 3]:
+                    self.env.traffic_grid[y, x] += 1.5
+                for x, y in rng.sample(self.roads, 100):
+                    self.env.traffic_grid[y, x] = 0.0
+                planner._update_dynamic_costs()
+                last_start, km = planner.start, planner.km
+                path = planner.replan_path(path[3])
+                # km, last_start'tan start'a maliyetin alt sınırı kadar artmalı
+                self.assertAlmostEqual(planner.km - km, planner.heuristic(planner.start, last_start))
+                field = dijkstra_cost_field(planner._edge_cost_table(), goal[1] * width + goal[0])
+                cost = sum(planner._cost_ids(ay * width + ax, by * width + bx)
+                           for (ax, ay), (bx, by) in zip(path, path[1:]))
+                self.assertAlmostEqual(cost, field[path[0][1], path[0][0]], places=6)
+                checked += 1
+        self.assertGreater(checked, 2)
+
+class TestRoadGraph(unittest.TestCase):
+    """Yol ağı sıkıştırma ve graf üzerinde D* Lite testleri"""
+    
+    def setUp(self):
+        random.seed(8)
+        self.env = TrafficEnvironment(200, 150)
+        for _ in range(10):
+            self.env.update_traffic(0.1)
+        self.graph = RoadGraph(self.env)
+        ys, xs = np.nonzero(self.graph.is_node)
+        self.nodes = [(int(x), int(y)) for x, y in zip(xs, ys)]
+    
+    def path_cost(self, path):
+        width = self.env.width
+        cost = 0.0
+        for (ax, ay), (bx, by) in zip(path, path[1:]):
+            self.assertEqual(max(abs(ax - bx), abs(ay - by)), 1)
+            distance = np.sqrt(2) if ax != bx and ay != by else 1.0
+            cost += distance * self.graph.cell_costs[by * width + bx]
+        return cost
+    
+    def test_graph_structure(self):
+        """Kenarlar komşu hücrelerden geçmeli, maliyetler dinamik maliyet toplamı olmalı"""
+        graph = self.graph
+        width = self.env.width
+        self.assertLess(graph.node_count * 3, graph.cell_count)
+        for index in range(0, graph.edge_count, 7):
+            source = int(graph.edge_sources[index])
+            target = int(graph.edge_targets[index])
+            cells = graph.edge_path(source, target)
+            self.assertEqual(cells[-1], target)
+            self.assertTrue(all(not graph.is_node.flat[cell] for cell in cells[:-1]))
+            path = [(source % width, source // width)] + [(c % width, c // width) for c in cells]
+            self.assertAlmostEqual(graph.costs[index], self.path_cost(path))
+        
+        x, y = self.nodes[0]
+        self.assertAlmostEqual(graph.cell_costs[y * width + x], self.env.get_dynamic_cost(x, y))
+    
+    def test_dynamic_cost_grid_matches_scalar(self):
+        """Vektörel dinamik maliyetler hücre hücre değerlerle birebir aynı olmalı"""
+        grid = self.env.dynamic_cost_grid()
+        self.assertEqual(grid.dtype, np.float64)
+        expected = np.array([[self.env.get_dynamic_cost(x, y) for x in range(self.env.width)]
+                             for y in range(self.env.height)])
+        np.testing.assert_array_equal(grid, expected)
+        self.assertTrue((self.env.free_flow_cost_grid() <= grid).all())
+    
+    def test_plans_optimal_graph_paths(self):
+        """Düğümler arası yol, graf üzerindeki Dijkstra optimumuna eşit olmalı"""
+        graph = self.graph
+        width = self.env.width
+        size = self.env.width * self.env.height
+        adjacency = csr_matrix((graph.costs, (graph.edge_sources, graph.edge_targets)),
+                               shape=(size, size))
+        rng = random.Random(9)
+        planner = RoadGraphDStar(self.env, graph, heuristic_weight=1.0, landmarks=4)
+        for _ in range(4):
+            start, goal = rng.sample(self.nodes, 2)
+            path = planner.plan_path(start, goal)
+            best = dijkstra(adjacency, indices=start[1] * width + start[0])[goal[1] * width + goal[0]]
+            self.assertEqual((path[0], path[-1]), (start, goal))
+            self.assertAlmostEqual(self.path_cost(path), best, places=6)
+            self.assertLess(planner.stats['nodes_expanded'], graph.node_count)
+    
+    def test_cost_gap_to_cell_planner(self):
+        """Graf yolları hücre düzeyindeki optimal trafik yolundan belgelenen
+        farktan fazla pahalı olmamalı"""
+        ys, xs = np.nonzero(np.isfinite(self.env.dynamic_cost_grid()))
+        roads = [(int(x), int(y)) for x, y in zip(xs, ys)]
+        rng = random.Random(1)
+        planner = RoadGraphDStar(self.env, self.graph, heuristic_weight=1.0, landmarks=4)
+        reference = TrafficAwareDStar(self.env, heuristic_weight=1.0, storage='lazy', landmarks=6)
+        ratios = []
+        for _ in range(20):
+            start, goal = rng.sample(roads, 2)
+            optimal = reference.plan_path(start, goal)
+            if not optimal:
+                continue
+            path = planner.plan_path(start, goal)
+            self.assertEqual((path[0], path[-1]), (start, goal))
+            ratios.append(self.path_cost(path) / self.path_cost(optimal))
+        self.assertGreater(len(ratios), 10)
+        self.assertGreaterEqual(min(ratios), 1.0 - 1e-9)
+        self.assertLess(np.mean(ratios), 1.06)
+        self.assertLess(max(ratios), 1.25)
+    
+    def test_replan_inside_chain_after_traffic_change(self):
+        """Zincir içinden yeniden planlama, trafik değişince taze planla aynı maliyeti vermeli"""
+        rng = random.Random(10)
+        interior = [(cell % self.env.width, cell // self.env.width) for cell in self.graph.chain_of]
+        start, goal = rng.sample(interior, 2)
+        planner = RoadGraphDStar(self.env, self.graph, heuristic_weight=1.0, landmarks=4)
+        path = planner.plan_path(start, goal)
+        self.assertEqual((path[0], path[-1]), (start, goal))
+        
+        for light in self.env.traffic_lights:
+            light.state = 'red'
+        planner._update_dynamic_costs()
+        path = planner.replan_path(path[3])
+        fresh = RoadGraphDStar(self.env, self.graph, heuristic_weight=1.0, landmarks=4)
+        self.assertAlmostEqual(self.path_cost(path), self.path_cost(fresh.plan_path(path[0], goal)))
+
+class TestContractionHierarchy(unittest.TestCase):
+    """Yol grafı üzerinde özelleştirilebilir kontraksiyon hiyerarşisi testleri"""
+    
+    def setUp(self):
+        random.seed(11)
+        self.env = TrafficEnvironment(200, 150)
+        for _ in range(10):
+            self.env.update_traffic(0.1)
+        self.graph = RoadGraph(self.env)
+        self.hierarchy = ContractionHierarchy(self.graph)
+        self.nodes = [(cell % self.env.width, cell // self.env.width)
+                      for cell in self.hierarchy.node_cells.tolist()]
+    
+    def graph_distances(self, source):
+        size = self.env.width * self.env.height
+        adjacency = csr_matrix((self.graph.costs, (self.graph.edge_sources, self.graph.edge_targets)),
+                               shape=(size, size))
+        return dijkstra(adjacency, indices=source[1] * self.env.width + source[0])
+    
+    def path_cost(self, path):
+        width = self.env.width
+        cost = 0.0
+        for (ax, ay), (bx, by) in zip(path, path[1:]):
+            self.assertEqual(max(abs(ax - bx), abs(ay - by)), 1)
+            distance = np.sqrt(2) if ax != bx and ay != by else 1.0
+            cost += distance * self.graph.cell_costs[by * width + bx]
+        return cost
+    
+    def check_queries(self, rng, count):
+        for _ in range(count):
+            start, goal = rng.sample(self.nodes, 2)
+            path = self.hierarchy.plan_path(start, goal)
+            best = self.graph_distances(start)[goal[1] * self.env.width + goal[0]]
+            self.assertEqual((path[0], path[-1]), (start, goal))
+            self.assertAlmostEqual(self.hierarchy.last_cost, best, places=6)
+            self.assertAlmostEqual(self.path_cost(path), best, places=6)
+    
+    def test_queries_match_graph_dijkstra(self):
+        """Düğümler ve zincir içi hücreler arası sorgular optimal olmalı"""
+        rng = random.Random(12)
+        self.check_queries(rng, 10)
+        self.assertLess(self.hierarchy.stats['nodes_expanded'], 10 * len(self.nodes) / 4)
+        
+        interior = [(cell % self.env.width, cell // self.env.width) for cell in self.graph.chain_of]
+        for _ in range(5):
+            start, goal = rng.sample(interior, 2)
+            path = self.hierarchy.plan_path(start, goal)
+            reference = RoadGraphDStar(self.env, self.graph, heuristic_weight=0.0).plan_path(start, goal)
+            self.assertEqual((path[0], path[-1]), (start, goal))
+            self.assertAlmostEqual(self.path_cost(path), self.path_cost(reference), places=6)
+    
+    def test_customize_after_traffic_change(self):
+        """Trafik değişince yeniden özelleştirme optimal sorguları korumalı"""
+        for light in self.env.traffic_lights:
+            light.state = 'red'
+        self.env.update_traffic(0.5)
+        self.hierarchy.customize()
+        self.check_queries(random.Random(13), 6)
+    
+    def test_save_and_load(self):
+        """Kaydedilen hiyerarşi aynı yolları vermeli; farklı grafa yüklenmemeli"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'hierarchy.npz')
+            self.hierarchy.save(path)
+            loaded = ContractionHierarchy.load(path, self.graph)
+            rng = random.Random(14)
+            for _ in range(5):
+                start, goal = rng.sample(self.nodes, 2)
+                self.assertEqual(loaded.plan_path(start, goal), self.hierarchy.plan_path(start, goal))
+            
+            with self.assertRaises(ValueError):
+                ContractionHierarchy.load(path, RoadGraph(self.env, lane_change_spacing=16))
+
+class TestBidirectionalSearch(unittest.TestCase):
+    """Tek seferlik sorgular için iki yönlü A* ve yönlendirici testleri"""
+    
+    def setUp(self):
+        rng = np.random.default_rng(15)
+        self.grid_map = GridMap(40, 30)
+        self.grid_map.grid[rng.random((30, 40)) < 0.25] = self.grid_map.OBSTACLE
+        self.grid_map.terrain_costs[:] = rng.random((30, 40)) * 2
+        self.grid_map.clear_area(0, 0, 1, 1)
+        self.grid_map.clear_area(38, 28, 39, 29)
+        self.free = [(int(x), int(y)) for y, x in zip(*np.nonzero(self.grid_map.grid == 0))]
+    
+    def test_matches_dstar_cost(self):
+        """Yol maliyeti D* Lite optimumuna eşit olmalı"""
+        rng = random.Random(16)
+        planner = BidirectionalAStar(self.grid_map)
+        for _ in range(8):
+            start, goal = rng.sample(self.free, 2)
+            reference = DStarLite(self.grid_map)
+            expected = reference.plan_path(start, goal)
+            path = planner.plan_path(start, goal)
+            self.assertEqual(bool(path), bool(expected))
+            if not path:
+                continue
+            self.assertEqual((path[0], path[-1]), (start, goal))
+            cost = sum(reference.get_cost(reference.get_node(*a), reference.get_node(*b))
+                       for a, b in zip(path, path[1:]))
+            self.assertAlmostEqual(cost, reference.start.g)
+            self.assertAlmostEqual(planner.last_cost, reference.start.g)
+        self.assertGreater(planner.stats['nodes_expanded'], 0)
+        self.assertEqual(set(planner.stats), set(reference.stats))
+    
+    def test_map_changes_and_unreachable(self):
+        """Harita değişiklikleri görülmeli; ulaşılamayan hedefte boş yol"""
+        planner = BidirectionalAStar(self.grid_map)
+        self.assertTrue(planner.plan_path((0, 0), (39, 29)))
+        self.grid_map.add_obstacle(36, 26, 39, 27)
+        self.grid_map.add_obstacle(36, 26, 37, 29)
+        self.assertEqual(planner.plan_path((0, 0), (39, 29)), [])
+        self.assertEqual(planner.path_status, 'unreachable')
+        self.assertEqual(planner.plan_path((0, 0), (36, 26)), [])
+    
+    def test_dispatcher_routes_queries(self):
+        """Tek seferlik sorgular A*'a, oturumlar D* Lite'a gitmeli"""
+        dispatcher = QueryDispatcher(self.grid_map, storage='array')
+        with self.assertRaises(ValueError):
+            dispatcher.replan_path()
+        
+        one_shot = dispatcher.plan_path((0, 0), (39, 29))
+        self.assertIsNone(dispatcher.session)
+        self.assertGreater(dispatcher.one_shot.stats['nodes_expanded'], 0)
+        
+        path = dispatcher.plan_path((0, 0), (39, 29), session=True)
+        self.assertEqual(dispatcher.session.storage, 'array')
+        self.assertAlmostEqual(dispatcher.session.nodes.g[dispatcher.session.start],
+                               dispatcher.one_shot.last_cost)
+        self.assertEqual(len(path) > 0, len(one_shot) > 0)
+        self.assertTrue(dispatcher.replan_path(path[1]))
+        self.assertEqual(dispatcher.stats, {'one_shot_queries': 1, 'session_queries': 1})
+
+class TestPlannerProviders(unittest.TestCase):
+    """Ortak çekirdeğin komşuluk/maliyet/heuristik sağlayıcı testleri"""
+    
+    def setUp(self):
+        rng = np.random.default_rng(21)
+        self.grid_map = GridMap(30, 25)
+        self.grid_map.grid[rng.random((25, 30)) < 0.2] = self.grid_map.OBSTACLE
+        self.grid_map.terrain_costs[:] = rng.random((25, 30))
+        self.grid_map.clear_area(0, 0, 1, 1)
+        self.grid_map.clear_area(28, 23, 29, 24)
+    
+    def assert_table_matches(self, provider, table):
+        """Toplu kenar tablosu tekil sorgularla birebir aynı olmalı"""
+        width = provider.width
+        passable = np.isfinite(provider.cell_cost_grid())
+        for node_id in range(width * provider.height):
+            y, x = divmod(node_id, width)
+            if not passable[y, x]:
+                continue
+            expected = {n: provider.cost_ids(node_id, n) for n in provider.neighbor_ids(node_id)}
+            for k, (dx, dy) in enumerate(DIRECTIONS):
+                neighbor = node_id + dy * width + dx
+                self.assertEqual(table[y, x, k], expected.get(neighbor, float('inf')))
+    
+    def test_bulk_lookups_match_scalar(self):
+        """Izgara ve trafik sağlayıcılarının toplu sorguları tutarlı olmalı"""
+        provider = GridProvider(self.grid_map)
+        self.assert_table_matches(provider, provider.edge_cost_table())
+        np.testing.assert_array_equal(provider.edge_cost_table(),
+                                      GridAdjacency(self.grid_map).cost_table)
+        
+        random.seed(8)
+        env = TrafficEnvironment(60, 45)
+        for _ in range(10):
+            env.update_traffic(0.1)
+        provider = TrafficProvider(env)
+        self.assert_table_matches(provider, provider.edge_cost_table())
+    
+    def test_custom_provider(self):
+        """Çekirdek özel bir sağlayıcıyla (4 komşuluk) çalışmalı"""
+        class FourConnected(GridProvider):
+            def neighbor_ids(self, node_id):
+                width = self.width
+                return [n for n in super().neighbor_ids(node_id)
+                        if n % width == node_id % width or n // width == node_id // width]
+            
+            def compile(self):
+                return None
+        
+        paths = []
+        for storage in ('object', 'array'):
+            planner = DStarLite(self.grid_map, storage=storage, provider=FourConnected(self.grid_map))
+            path = planner.plan_path((0, 0), (29, 24))
+            self.assertTrue(path)
+            for (ax, ay), (bx, by) in zip(path, path[1:]):
+                self.assertEqual(abs(ax - bx) + abs(ay - by), 1)
+            paths.append(path)
+        self.assertEqual(paths[0], paths[1])
+        
+        with self.assertRaises(ValueError):
+            DStarLite(self.grid_map, storage='array', engine='optimized',
+                      provider=FourConnected(self.grid_map))
+    
+    def test_configurations_share_core(self):
+        """Orijinal ve trafik planlayıcıları çekirdeği yapılandırmalı"""
+        original = DStarLiteOriginal(self.grid_map)
+        self.assertIsInstance(original.provider, GridProvider)
+        self.assertEqual(original.plan_path((0, 0), (29, 24)),
+                         DStarLite(self.grid_map).plan_path((0, 0), (29, 24)))
+        
+        random.seed(9)
+        env = TrafficEnvironment(60, 45)
+        ys, xs = np.nonzero((env.road_grid > 0) & (env.building_grid == 0))
+        roads = [(int(x), int(y)) for x, y in zip(xs, ys)]
+        start, goal = random.Random(10).sample(roads, 2)
+        planners = [TrafficAwareDStar(env, storage=storage) for storage in ('object', 'array')]
+        for planner in planners:
+            self.assertIsInstance(planner.provider, TrafficProvider)
+            self.assertIn('nodes_expanded', planner.stats)
+            self.assertIn('traffic_updates', planner.stats)
+        paths = [planner.plan_path(start, goal) for planner in planners]
+        self.assertEqual(paths[0], paths[1])
+        
+        # Toplu maliyet okumasıyla iki mod aynı değişiklikleri görmeli
+        for x, y in paths[0][len(paths[0]) // 3:2 * len(paths[0]) // 3]:
+            env.traffic_grid[y, x] += 2.0
+        for planner in planners:
+            planner._update_dynamic_costs()
+            self.assertEqual(planner.stats['replanning_count'], 1)
+        self.assertEqual(planners[0].replan_path(), planners[1].replan_path())
+    
+    def test_traffic_adjacency_patches(self):
+        """Trafik tablosu yamalandıktan sonra toplu tabloyla aynı olmalı"""
+        random.seed(8)
+        env = TrafficEnvironment(60, 45)
+        costs = env.dynamic_cost_grid()
+        adjacency = TrafficAdjacency(costs)
+        np.testing.assert_array_equal(adjacency.cost_table, entry_cost_table(costs))
+        
+        rng = np.random.default_rng(22)
+        cell_ids = rng.choice(np.flatnonzero(np.isfinite(costs)), 40, replace=False)
+        cell_ids[0] = np.flatnonzero(~np.isfinite(costs))[0]  # yol olmayan hücre açılır
+        new_costs = costs.flat[cell_ids] + rng.random(40)
+        new_costs[1] = np.inf  # yol kapanır
+        adjacency.set_cell_costs(cell_ids, new_costs)
+        costs.flat[cell_ids] = new_costs
+        before = adjacency.cost_table.copy()
+        sources, targets, old, new = adjacency.sync_changes()
+        np.testing.assert_array_equal(adjacency.cost_table, entry_cost_table(costs))
+        
+        changed = before != adjacency.cost_table
+        self.assertEqual(len(sources), changed.sum())
+        offsets = np.array([dy * env.width + dx for dx, dy in DIRECTIONS])
+        for u, v, c_old, c_new in zip(sources, targets, old, new):
+            y, x = divmod(int(u), env.width)
+            k = list(offsets).index(v - u)
+            self.assertEqual(before[y, x, k], c_old)
+            self.assertEqual(adjacency.cost_table[y, x, k], c_new)
+        self.assertTrue(adjacency.blocked(int(cell_ids[1])))
+        with self.assertRaises(ValueError):
+            adjacency.set_cell_costs([0, 1], [1.0])
+    
+    def test_optimized_traffic_engine(self):
+        """Optimize trafik motoru trafik değişimlerinden sonra optimal kalmalı"""
+        random.seed(8)
+        env = TrafficEnvironment(60, 45)
+        ys, xs = np.nonzero(np.isfinite(env.dynamic_cost_grid()))
+        roads = [(int(x), int(y)) for x, y in zip(xs, ys)]
+        rng = random.Random(3)
+        with self.assertRaises(ValueError):
+            TrafficAwareDStar(env, storage='object', engine='optimized')
+        
+        for _ in range(3):
+            start, goal = rng.sample(roads, 2)
+            basic, optimized = [TrafficAwareDStar(env, heuristic_weight=1.0, storage='array',
+                                                  landmarks=4, engine=engine)
+                                for engine in ('basic', 'optimized')]
+            self.assertIsNone(basic.adjacency)
+            self.assertIsInstance(optimized.adjacency, TrafficAdjacency)
+            path = optimized.plan_path(start, goal)
+            basic.plan_path(start, goal)
+            self.assertAlmostEqual(optimized.cost_field()[start[1], start[0]],
+                                   basic.cost_field()[start[1], start[0]], places=6)
+            
+            for _ in range(3):
+                for x, y in path[len(path) // 3:2 * len(path) // 3]:
+                    env.traffic_grid[y, x] += 2.0
+                env.update_traffic(0.1)
+                optimized._update_dynamic_costs()
+                start = path[min(2, len(path) - 1)]
+                path = optimized.replan_path(start)
+                
+                # Tablo planlayıcının gördüğü (raporlanan) maliyetleri tutmalı
+                seen = np.where(np.isfinite(env.dynamic_cost_grid()), optimized._last_cost_grid, np.inf)
+                table = entry_cost_table(seen)
+                np.testing.assert_array_equal(optimized.adjacency.cost_table, table)
+                best = dijkstra_cost_field(table, goal[1] * env.width + goal[0])[start[1], start[0]]
+                self.assertEqual((path[0], path[-1]), (start, goal))
+                self.assertAlmostEqual(optimized.cost_field()[start[1], start[0]], best, places=6)
+
 class TestGridMap(unittest.TestCase):
     """GridMap test sınıfı"""
     
@@ -360,6 +1613,26 @@ if __name__ == '__main__':
     
     # Test sınıflarını ekle
     suite.addTests(loader.loadTestsFromTestCase(TestDStarLite))
+    suite.addTests(loader.loadTestsFromTestCase(TestArrayStorage))
+    suite.addTests(loader.loadTestsFromTestCase(TestSearchReset))
+    suite.addTests(loader.loadTestsFromTestCase(TestGridAdjacency))
+    suite.addTests(loader.loadTestsFromTestCase(TestIndexedPriorityQueue))
+    suite.addTests(loader.loadTestsFromTestCase(TestOptimizedEngine))
+    suite.addTests(loader.loadTestsFromTestCase(TestCostUpdates))
+    suite.addTests(loader.loadTestsFromTestCase(TestBudgetedSearch))
+    suite.addTests(loader.loadTestsFromTestCase(TestAnytimeSearch))
+    suite.addTests(loader.loadTestsFromTestCase(TestSharedGoalQueries))
+    suite.addTests(loader.loadTestsFromTestCase(TestMultiGoalSearch))
+    suite.addTests(loader.loadTestsFromTestCase(TestCostField))
+    suite.addTests(loader.loadTestsFromTestCase(TestPathCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestHierarchicalPlanner))
+    suite.addTests(loader.loadTestsFromTestCase(TestJumpPointPlanner))
+    suite.addTests(loader.loadTestsFromTestCase(TestWarmStart))
+    suite.addTests(loader.loadTestsFromTestCase(TestBidirectionalSearch))
+    suite.addTests(loader.loadTestsFromTestCase(TestLandmarkHeuristic))
+    suite.addTests(loader.loadTestsFromTestCase(TestRoadGraph))
+    suite.addTests(loader.loadTestsFromTestCase(TestContractionHierarchy))
+    suite.addTests(loader.loadTestsFromTestCase(TestPlannerProviders))
     suite.addTests(loader.loadTestsFromTestCase(TestGridMap))
     suite.addTests(loader.loadTestsFromTestCase(TestVehicleModel))
     